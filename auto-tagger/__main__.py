@@ -0,0 +1,5 @@
+"""Entry point of the single-file bundle (see the bundle task) and of python <dir>."""
+
+from main import main
+
+raise SystemExit(main())
@@ -0,0 +1,350 @@
+"""Asyncio front end of the GitHub helper, starting independent reads together."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from github_helpers import GitHubHelper
+from main import _runs_on_default_branch, tag_release
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+    from datetime import datetime
+
+    from github import InputGitAuthor
+
+    from components import Component
+    from configuration import Configuration
+    from github_helpers import (
+        ComponentRelease,
+        GitAnnotatedTagPayload,
+        GitCommitPayload,
+        GitComparison,
+        GitHubClient,
+        GitRefPayload,
+        GitReference,
+        GitRepository,
+        GitTagPayload,
+        TagIndex,
+    )
+    from github_resources import BumpStrategy, Commit, Tag, TagRef
+    from rate_limit import RateLimitScheduler
+
+_T = TypeVar("_T")
+
+
+class AsyncGitRepository(Protocol):
+    """Async counterpart of GitRepository; listings are returned whole."""
+
+    async def get_commits(
+        self, *, since: datetime = ..., sha: str = ..., path: str | None = None
+    ) -> list[GitCommitPayload]:
+        """Return commits reachable from sha (default branch by default) after a timestamp for an optional path."""
+
+    async def compare(self, base: str, head: str) -> GitComparison:
+        """Compare two commits, listing the commits reachable from head but not from base."""
+
+    async def get_commit(self, sha: str) -> GitCommitPayload:
+        """Fetch a commit by SHA or ref name."""
+
+    async def get_tags(self) -> list[GitTagPayload]:
+        """Return all tags on the repository."""
+
+    async def get_git_matching_refs(self, ref: str) -> list[GitRefPayload]:
+        """Return the references starting with the given name (e.g. tags/v)."""
+
+    async def get_git_tag(self, sha: str) -> GitAnnotatedTagPayload:
+        """Fetch an annotated tag object by SHA."""
+
+    async def create_git_tag(
+        self,
+        *,
+        tag: str,
+        message: str,
+        object: str,  # noqa: A002
+        type: str,  # noqa: A002
+        tagger: InputGitAuthor,
+    ) -> None:
+        """Create a new annotated tag."""
+
+    async def create_git_ref(self, ref: str, sha: str) -> None:
+        """Create a reference pointing to a specific SHA."""
+
+    async def get_git_ref(self, ref: str) -> GitReference:
+        """Return a mutable reference object."""
+
+
+class ThreadedRepository:
+    """AsyncGitRepository running each call of a GitRepository in a worker thread."""
+
+    def __init__(self, repo: GitRepository) -> None:
+        """Wrap a synchronous repository."""
+        self.repo = repo
+
+    async def get_commits(self, **kwargs: Any) -> list[GitCommitPayload]:
+        """Return the whole commit listing, read in a worker thread."""
+        return await asyncio.to_thread(lambda: list(self.repo.get_commits(**kwargs)))
+
+    async def compare(self, base: str, head: str) -> GitComparison:
+        """Compare two commits in a worker thread."""
+        return await asyncio.to_thread(self.repo.compare, base, head)
+
+    async def get_commit(self, sha: str) -> GitCommitPayload:
+        """Fetch a commit in a worker thread."""
+        return await asyncio.to_thread(self.repo.get_commit, sha)
+
+    async def get_tags(self) -> list[GitTagPayload]:
+        """Return the whole tag listing, read in a worker thread."""
+        return await asyncio.to_thread(lambda: list(self.repo.get_tags()))
+
+    async def get_git_matching_refs(self, ref: str) -> list[GitRefPayload]:
+        """Return the whole reference listing, read in a worker thread."""
+        return await asyncio.to_thread(
+            lambda: list(self.repo.get_git_matching_refs(ref))
+        )
+
+    async def get_git_tag(self, sha: str) -> GitAnnotatedTagPayload:
+        """Fetch an annotated tag object in a worker thread."""
+        return await asyncio.to_thread(self.repo.get_git_tag, sha)
+
+    async def create_git_tag(self, **kwargs: Any) -> None:
+        """Create an annotated tag in a worker thread."""
+        await asyncio.to_thread(lambda: self.repo.create_git_tag(**kwargs))
+
+    async def create_git_ref(self, ref: str, sha: str) -> None:
+        """Create a reference in a worker thread."""
+        await asyncio.to_thread(self.repo.create_git_ref, ref, sha)
+
+    async def get_git_ref(self, ref: str) -> GitReference:
+        """Fetch a reference in a worker thread."""
+        return await asyncio.to_thread(self.repo.get_git_ref, ref)
+
+
+class AsyncGitHubHelper:
+    """GitHubHelper whose calls are awaitable and can run together.
+
+    Each call runs the synchronous helper in a worker thread. Reads shared by several
+    callers (the repository, the tag index, the head commit, the latest tags) are
+    started once and awaited by all of them. Writes, including the default tags the
+    latest tag lookups may create, go through a lock in call order, so they reach
+    the repository in the same order as with GitHubHelper.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        config: Configuration,
+        github_client: GitHubClient | None = None,
+        *,
+        rate_limit: RateLimitScheduler | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> None:
+        """Create the underlying helper; no request is sent here.
+
+        Pending reads are bound to the event loop: use a helper within a single loop.
+        """
+        self.helper = GitHubHelper(
+            token, config, github_client, rate_limit=rate_limit, env=env
+        )
+        self._reads: dict[str, asyncio.Future[Any]] = {}
+        self.write_lock = asyncio.Lock()
+
+    @property
+    def config(self) -> Configuration:
+        """Return the configuration of the underlying helper."""
+        return self.helper.config
+
+    @property
+    def env(self) -> Mapping[str, str]:
+        """Return the workflow variables of the underlying helper."""
+        return self.helper.env
+
+    @property
+    def rate_limit(self) -> RateLimitScheduler | None:
+        """Return the rate limit scheduler of the underlying helper."""
+        return self.helper.rate_limit
+
+    def _shared(
+        self, name: str, call: Callable[[], Awaitable[_T]]
+    ) -> asyncio.Future[_T]:
+        """Start call once and hand the same pending result to every caller."""
+        if name not in self._reads:
+            self._reads[name] = asyncio.ensure_future(call())
+        return self._reads[name]
+
+    async def _write(self, call: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a call that may write, after the writes requested before it."""
+        async with self.write_lock:
+            return await asyncio.to_thread(call, *args, **kwargs)
+
+    async def get_repo(self) -> AsyncGitRepository:
+        """Return the repository backend, resolved once in a worker thread."""
+        repo: GitRepository = await self._shared(
+            "repo", lambda: asyncio.to_thread(lambda: self.helper.repo)
+        )
+        return ThreadedRepository(repo)
+
+    async def get_tag_index(self) -> TagIndex:
+        """Return the tag index, listing the repository tags once."""
+        await self.get_repo()
+        return await self._shared(
+            "tag_index", lambda: asyncio.to_thread(lambda: self.helper.tag_index)
+        )
+
+    async def list_tag_refs(self, prefix: str | None = None) -> list[TagRef]:
+        """List tag names and SHAs under prefix, the configured one by default."""
+        await self.get_repo()
+        return await asyncio.to_thread(lambda: list(self.helper.list_tag_refs(prefix)))
+
+    async def get_last_commit(self) -> Commit:
+        """Get the latest commit: GITHUB_SHA when set, otherwise the head of the default branch or path."""
+        await self.get_repo()
+        return await self._shared(
+            "last_commit", lambda: asyncio.to_thread(self.helper.get_last_commit)
+        )
+
+    async def _latest_tag(self, *, major: bool) -> Tag:
+        """Resolve the latest full or major-only tag, creating the default one when missing."""
+        index = await self.get_tag_index()
+        if not (index.major if major else index.semver):
+            # The default tag points to the head commit: share its lookup.
+            await self.get_last_commit()
+        return await self._write(
+            lambda: (
+                self.helper.last_available_major_tag
+                if major
+                else self.helper.last_available_tag
+            )
+        )
+
+    async def last_available_tag(self) -> Tag:
+        """Return the latest semver tag, looked up once."""
+        return await self._shared("last_tag", lambda: self._latest_tag(major=False))
+
+    async def last_available_major_tag(self) -> Tag:
+        """Return the latest major-only tag, looked up once."""
+        return await self._shared(
+            "last_major_tag", lambda: self._latest_tag(major=True)
+        )
+
+    async def get_commits_since(self, since: datetime) -> list[Commit]:
+        """Get the commits since a datetime."""
+        await self.get_repo()
+        return await asyncio.to_thread(
+            lambda: list(self.helper.get_commits_since(since))
+        )
+
+    async def get_commits_between(self, base: str, head: str) -> list[Commit]:
+        """Get the commits reachable from head but not from base, newest first."""
+        await self.get_repo()
+        return await asyncio.to_thread(self.helper.get_commits_between, base, head)
+
+    async def get_release_commits(self, last_tag: Tag) -> list[Commit]:
+        """Get the commits released since the last tag, following the configured range mode."""
+        if self.env.get("GITHUB_SHA") is None:
+            await self.get_last_commit()
+        else:
+            await self.get_repo()
+        return await asyncio.to_thread(
+            lambda: list(self.helper.get_release_commits(last_tag))
+        )
+
+    async def get_changed_files(
+        self, shas: Sequence[str]
+    ) -> dict[str, list[str] | None]:
+        """Return the files changed by each commit; None when the list is incomplete."""
+        await self.get_repo()
+        return await asyncio.to_thread(self.helper.get_changed_files, shas)
+
+    async def get_component_releases(
+        self, components: Sequence[Component]
+    ) -> list[ComponentRelease]:
+        """Split a single tag and commit listing between monorepo components."""
+        await asyncio.gather(self.get_repo(), self.get_last_commit())
+        return await self._write(self.helper.get_component_releases, components)
+
+    async def bump_tag_version(self, strategy: BumpStrategy, tag: Tag) -> Tag:
+        """Create a new Tag resource with the increased version number."""
+        await self.get_last_commit()
+        return await asyncio.to_thread(self.helper.bump_tag_version, strategy, tag)
+
+    async def create_git_tag(self, tag: Tag) -> None:
+        """Create a new tag bound to a specific commit (no-op in dry-run)."""
+        await self._write(self.helper.create_git_tag, tag)
+
+    async def move_git_tag(self, tag: Tag) -> None:
+        """Point an existing tag to a new commit (no-op in dry-run)."""
+        await self._write(self.helper.move_git_tag, tag)
+
+    async def write_tags(
+        self, created: Sequence[Tag] = (), moved: Sequence[Tag] = ()
+    ) -> None:
+        """Create and move tags together, rolling back on failure (no-op in dry-run)."""
+        await self._write(self.helper.write_tags, created, moved)
+
+    async def delete_git_tag(self, tag_name: str) -> None:
+        """Delete a tag on the repository (no-op in dry-run)."""
+        await self._write(self.helper.delete_git_tag, tag_name)
+
+
+async def run_async(
+    config: Configuration,
+    github: AsyncGitHubHelper,
+    env: Mapping[str, str],
+    logger: logging.Logger,
+) -> int:
+    """Execute the auto-tagging workflow, starting independent reads together.
+
+    The tag listing and the head commit are read at the same time; the commit range
+    and, when bound, an existing major tag are read once the last tag is known. The
+    critical path is the tag listing, the last tag's commit, the commit range and
+    the writes, which happen in the same order as with run().
+    """
+    if config.DRY_RUN:
+        logger.info("Running in dry-run mode.")
+
+    if not _runs_on_default_branch(config, env, logger):
+        return 0
+
+    if config.components:
+        for release in await github.get_component_releases(config.components):
+            logger.info(
+                "Component %s: last available tag: %s",
+                release.component.path,
+                release.last_tag.name,
+            )
+            async with github.write_lock:
+                await asyncio.to_thread(
+                    tag_release,
+                    release.helper.config,
+                    release.helper,
+                    release.last_tag,
+                    release.commits,
+                    env=env,
+                    logger=logger,
+                )
+        return 0
+
+    last_tag, _ = await asyncio.gather(
+        github.last_available_tag(), github.get_last_commit()
+    )
+    logger.info("Last available tag: %s", last_tag.name)
+    reads: list[Awaitable[Any]] = [github.get_release_commits(last_tag)]
+    index = await github.get_tag_index()
+    if config.BIND_TO_MAJOR and index.major:
+        # A missing major tag is created only when a release is due, as in run().
+        reads.append(github.last_available_major_tag())
+    commits, *_ = await asyncio.gather(*reads)
+    async with github.write_lock:
+        await asyncio.to_thread(
+            tag_release,
+            config,
+            github.helper,
+            last_tag,
+            commits,
+            env=env,
+            logger=logger,
+        )
+    return 0
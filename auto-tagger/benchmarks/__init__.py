@@ -0,0 +1 @@
+"""Benchmark scripts, run directly with python."""
@@ -0,0 +1,80 @@
+"""Throughput of the commit rule engine as the number of rules grows.
+
+Run from the auto-tagger directory: python benchmarks/bench_commit_rules.py
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from commit_rules import (
+    CONVENTIONAL_COMMIT_RULES,
+    MARKER_RULES,
+    CommitRule,
+    CommitRuleEngine,
+)
+from github_resources import BumpStrategy
+
+MESSAGES = 20_000
+RULE_COUNTS = (0, 8, 32, 128, 512)
+_TYPES = ("feat", "fix", "chore", "docs", "refactor", "ci", "test")
+
+
+def build_messages(count: int) -> list[str]:
+    """Build commit messages with a header, a wrapped body and optional footers."""
+    rng = random.Random(42)  # noqa: S311
+    words = ["tag", "release", "commit", "path", "version", "branch", "cache", "api"]
+    messages = []
+    for _ in range(count):
+        header = f"{rng.choice(_TYPES)}({rng.choice(words)}): {' '.join(rng.choices(words, k=6))}"
+        body = "\n".join(
+            " ".join(rng.choices(words, k=10)) for _ in range(rng.randint(0, 8))
+        )
+        footer = "BREAKING CHANGE: removed input" if rng.random() < 0.01 else ""  # noqa: PLR2004
+        # Half the messages reference an issue, hitting the custom rules' matcher.
+        if rng.random() < 0.5:  # noqa: PLR2004
+            key = "".join(rng.choices(string.ascii_uppercase, k=4))
+            footer = f"{footer}\nRefs: {key}-{rng.randint(1, 999)}"
+        messages.append(f"{header}\n\n{body}\n\n{footer}")
+    return messages
+
+
+def build_rules(count: int) -> list[CommitRule]:
+    """Build the built-in rules plus count custom rules keyed on issue tracker projects."""
+    rng = random.Random(7)  # noqa: S311
+    strategies = (BumpStrategy.MAJOR, BumpStrategy.MINOR, BumpStrategy.PATCH)
+    custom = [
+        CommitRule(
+            strategies[index % len(strategies)],
+            rf"{''.join(rng.choices(string.ascii_uppercase, k=4))}-\d+",
+        )
+        for index in range(count)
+    ]
+    return [*MARKER_RULES, *CONVENTIONAL_COMMIT_RULES, *custom]
+
+
+def main() -> None:
+    """Print compile time and messages classified per second for each rule count."""
+    messages = build_messages(MESSAGES)
+    print(f"{'custom rules':>12} {'compile ms':>11} {'messages/s':>12}")
+    for count in RULE_COUNTS:
+        started = time.perf_counter()
+        engine = CommitRuleEngine(build_rules(count))
+        compiled = time.perf_counter()
+        for message in messages:
+            engine.classify(message)
+        finished = time.perf_counter()
+        print(
+            f"{count:>12} {(compiled - started) * 1000:>11.2f} "
+            f"{len(messages) / (finished - compiled):>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
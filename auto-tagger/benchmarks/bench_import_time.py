@@ -0,0 +1,43 @@
+"""Cold import time of the entry point and of the GitHub helper, from -X importtime.
+
+Run from the auto-tagger directory: python benchmarks/bench_import_time.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+RUNS = 5
+MODULES = ("main", "github_helpers")
+
+
+def cumulative_import_us(module: str) -> int:
+    """Return the cumulative import time of module in a fresh interpreter, in microseconds."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip() == module:  # noqa: PLR2004
+            return int(fields[1])
+    message = f"{module} not found in the import timings"
+    raise RuntimeError(message)
+
+
+def main() -> None:
+    """Print the median cumulative import time of each module."""
+    for module in MODULES:
+        timings = [cumulative_import_us(module) for _ in range(RUNS)]
+        print(f"{module:<16} {statistics.median(timings) / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Memory held by commit resources for a large release range.
+
+Run from the auto-tagger directory: python benchmarks/bench_resource_memory.py
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from github_resources import Commit, CommitBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+COMMITS = 50_000
+
+
+@dataclass
+class DictCommit:
+    """Commit resource as defined before slots, with a per-instance __dict__."""
+
+    sha: str
+    author_name: str
+    author_email: str
+    message: str
+    date: datetime
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the object build returns."""
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    """Print the memory per commit of each representation."""
+    # Field values are shared so only the per-object overhead is measured.
+    sha, name, email, message = "0" * 40, "octocat", "octo@github.com", "fix: x"
+    date = datetime(2025, 1, 1, tzinfo=UTC)
+    layouts: dict[str, Callable[[], object]] = {
+        "dataclass": lambda: [
+            DictCommit(sha, name, email, message, date) for _ in range(COMMITS)
+        ],
+        "slotted dataclass": lambda: [
+            Commit(sha, name, email, message, date) for _ in range(COMMITS)
+        ],
+        "CommitBatch": lambda: CommitBatch([sha] * COMMITS, [message] * COMMITS),
+    }
+    for label, build in layouts.items():
+        print(f"{label:<18} {measure(build) / COMMITS:>6.1f} bytes per commit")
+
+
+if __name__ == "__main__":
+    main()
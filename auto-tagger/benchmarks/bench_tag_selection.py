@@ -0,0 +1,57 @@
+"""Time to select the latest version among many tag names.
+
+Run from the auto-tagger directory: python benchmarks/bench_tag_selection.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from semver import Version
+
+from version_keys import version_key
+
+TAGS = 100_000
+
+
+def build_names(count: int) -> list[str]:
+    """Build version strings, some with prerelease or build metadata, plus noise."""
+    rng = random.Random(42)  # noqa: S311
+    names = []
+    for index in range(count):
+        version = f"{rng.randint(0, 40)}.{rng.randint(0, 99)}.{rng.randint(0, 99)}"
+        if index % 10 == 0:
+            version += f"-rc.{rng.randint(1, 9)}"
+        elif index % 25 == 0:
+            version += f"+build.{index}"
+        elif index % 50 == 0:
+            version = f"nightly-{index}"
+        names.append(version)
+    return names
+
+
+def main() -> None:
+    """Print the selection time with semver objects and with memoized keys."""
+    names = build_names(TAGS)
+
+    started = time.perf_counter()
+    latest = max(Version.parse(name) for name in names if Version.is_valid(name))
+    print(
+        f"semver.Version     {(time.perf_counter() - started) * 1000:>8.1f} ms  {latest}"
+    )
+
+    for run in ("cold", "memoized"):
+        started = time.perf_counter()
+        keys = [key for key in map(version_key, names) if key is not None]
+        best = max(keys)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"version_key {run:<8} {elapsed:>5.1f} ms  {best[:3]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""Commit message rules deciding the bump strategy, compiled into a single matcher."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+from github_resources import BumpStrategy, CommitBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from github_resources import Commit
+
+# Strategies by decreasing precedence; skip overrides every bump.
+STRATEGY_PRECEDENCE: Final[tuple[BumpStrategy, ...]] = (
+    BumpStrategy.SKIP,
+    BumpStrategy.MAJOR,
+    BumpStrategy.MINOR,
+    BumpStrategy.PATCH,
+)
+_RULE_SEPARATOR: Final[str] = "="
+_COMMENT_PREFIX: Final[str] = "#"
+# Start of the message, then start of any line: the first one is tried only once.
+_ANCHORS: Final[tuple[str, ...]] = (r"\A", "^")
+_METACHARACTERS: Final[str] = ".^$*+?{}[]\\|()"
+_OPTIONAL_QUANTIFIERS: Final[str] = "*?{"
+
+
+class CommitRuleError(ValueError):
+    """Raised when a commit rule cannot be parsed or compiled."""
+
+
+@dataclass(frozen=True)
+class CommitRule:
+    r"""Regular expression that selects a bump strategy when it matches a commit message.
+
+    Patterns are matched in multiline mode, so ^ anchors to every line of the message
+    and \A to its start only.
+    Case-sensitive patterns scan faster; use (?i:...) around the part that needs it.
+    """
+
+    strategy: BumpStrategy
+    pattern: str
+    ignore_case: bool = False
+
+
+# Case-insensitive only after the literal "[#" so the scan keeps its literal prefix.
+MARKER_RULES: Final[tuple[CommitRule, ...]] = tuple(
+    CommitRule(strategy, rf"\[#(?i:{strategy.value})\]")
+    for strategy in STRATEGY_PRECEDENCE
+)
+
+_CONVENTIONAL_SCOPE: Final[str] = r"(?:\([^)\n]*\))?"
+# The type and ! only count in the header; BREAKING CHANGE is a footer on any line.
+CONVENTIONAL_COMMIT_RULES: Final[tuple[CommitRule, ...]] = (
+    CommitRule(BumpStrategy.MAJOR, rf"\A[A-Za-z]+{_CONVENTIONAL_SCOPE}!:"),
+    CommitRule(BumpStrategy.MAJOR, r"^BREAKING[ -]CHANGE:"),
+    CommitRule(BumpStrategy.MINOR, rf"\A(?i:feat){_CONVENTIONAL_SCOPE}:"),
+    CommitRule(BumpStrategy.PATCH, rf"\A(?i:fix){_CONVENTIONAL_SCOPE}:"),
+)
+
+
+def parse_commit_rules(value: str) -> tuple[CommitRule, ...]:
+    """Parse one <strategy>=<regex> rule per line; blank lines and # comments are ignored."""
+    rules: list[CommitRule] = []
+    for raw_line in value.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(_COMMENT_PREFIX):
+            continue
+        name, separator, pattern = line.partition(_RULE_SEPARATOR)
+        try:
+            strategy = BumpStrategy(name.strip().lower())
+        except ValueError:
+            strategy = None
+        if not separator or strategy is None or not pattern.strip():
+            message = f"Invalid commit rule {line!r}: expected <strategy>=<regex>."
+            raise CommitRuleError(message)
+        rules.append(CommitRule(strategy, pattern.strip()))
+    return tuple(rules)
+
+
+def _has_top_level_alternative(pattern: str) -> bool:
+    """Tell whether pattern has a | outside of any group or character class."""
+    depth = 0
+    in_class = escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char in "()":
+            depth += 1 if char == "(" else -1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+def _leading_anchor(pattern: str) -> str:
+    r"""Return the ^ or \A every match of pattern starts with, or "" when there is none."""
+    if _has_top_level_alternative(pattern):
+        return ""
+    return next((anchor for anchor in _ANCHORS if pattern.startswith(anchor)), "")
+
+
+def _first_literal(pattern: str) -> str:
+    r"""Return the character every match of pattern, without its anchor, starts with.
+
+    Only a plain or escaped punctuation character that no quantifier makes optional
+    qualifies; anything else (classes, groups, escapes such as \d) gives "".
+    """
+    if _has_top_level_alternative(pattern):
+        return ""
+    char, rest = pattern[:1], pattern[1:]
+    if char == "\\":
+        char, rest = rest[:1], rest[1:]
+        if not char or char.isalnum() or char == "_":
+            return ""
+    elif not char or char in _METACHARACTERS:
+        return ""
+    if rest and rest[0] in _OPTIONAL_QUANTIFIERS:
+        return ""
+    return char
+
+
+def _uses_group_references(pattern: str) -> bool:
+    r"""Tell whether pattern refers to a group by number (e.g. \1 or (?(1)...)).
+
+    Group numbers shift once patterns are joined, so such rules are matched alone.
+    """
+    in_class = escaped = False
+    for index, char in enumerate(pattern):
+        if escaped:
+            escaped = False
+            # In a character class, \1 is an octal escape.
+            if not in_class and char in "123456789":
+                return True
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif pattern.startswith("(?(", index):
+            return True
+    return False
+
+
+def _matches_within(rule: re.Pattern[str], message: str, start: int, end: int) -> bool:
+    """Tell whether rule matches message from a position in [start, end).
+
+    The combined matcher resumes its scan at end, so a rule overlapping a hit of
+    another one is only seen by searching inside the hit.
+    """
+    if rule.match(message, start):
+        return True
+    if end <= start + 1:
+        return False
+    inner = rule.search(message, start + 1)
+    return inner is not None and inner.start() < end
+
+
+def _compile(pattern: str, source: str) -> re.Pattern[str]:
+    """Compile a pattern built from the source rules, reporting errors as CommitRuleError."""
+    try:
+        return re.compile(pattern, re.MULTILINE)
+    except re.error as error:
+        message = f"Invalid commit rule pattern {source!r}: {error}"
+        raise CommitRuleError(message) from error
+
+
+_Rule = tuple[BumpStrategy, re.Pattern[str]]
+
+
+@dataclass
+class _RuleGroup:
+    """Rules joined into one combined matcher, indexed by the character they start with."""
+
+    matcher: re.Pattern[str]
+    by_first_char: dict[str, list[_Rule]] = field(default_factory=dict)
+    unindexed: list[_Rule] = field(default_factory=list)
+
+    def candidates(self, hit: str) -> Iterator[_Rule]:
+        """Yield the rules that may match from a position inside the hit."""
+        yield from self.unindexed
+        for char in set(hit):
+            yield from self.by_first_char.get(char, ())
+
+
+class CommitRuleEngine:
+    """Every rule compiled once into combined matchers scanned in a single pass per message.
+
+    Rules anchored to the message start (e.g. Conventional Commits headers), those
+    anchored to a line start (e.g. footers) and the others are joined in separate
+    alternations without capturing groups. Where a combined matcher hits, only the
+    rules of its alternation that can start inside the hit are tried one by one:
+    rules beginning with a literal character are indexed by it, so a hit costs the
+    few rules sharing its characters rather than the whole rule set. Rules referring
+    to groups by number are searched alone.
+    """
+
+    def __init__(self, rules: Sequence[CommitRule]) -> None:
+        """Compile the rules; an invalid pattern raises CommitRuleError."""
+        self.rules = tuple(rules)
+        self._standalone: list[_Rule] = []
+        members: dict[str, list[tuple[str, _Rule]]] = {
+            anchor: [] for anchor in (*_ANCHORS, "")
+        }
+        patterns: dict[str, list[str]] = {anchor: [] for anchor in members}
+        for rule in self.rules:
+            pattern = f"(?i:{rule.pattern})" if rule.ignore_case else rule.pattern
+            compiled = _compile(pattern, rule.pattern)
+            if compiled.groupindex:
+                message = (
+                    f"Commit rule pattern {rule.pattern!r} must not use named groups."
+                )
+                raise CommitRuleError(message)
+            try:
+                re.compile(f"(?:{rule.pattern})")
+            except re.error as error:
+                message = f"Commit rule pattern {rule.pattern!r} must not use global flags such as (?i); scope them as (?i:...)."
+                raise CommitRuleError(message) from error
+            if _uses_group_references(rule.pattern):
+                self._standalone.append((rule.strategy, compiled))
+                continue
+            anchor = _leading_anchor(rule.pattern)
+            body = rule.pattern[len(anchor) :]
+            first = "" if rule.ignore_case else _first_literal(body)
+            members[anchor].append((first, (rule.strategy, compiled)))
+            flags = "i" if rule.ignore_case else ""
+            patterns[anchor].append(f"(?{flags}:{body})")
+        self._groups: list[_RuleGroup] = []
+        for anchor, group_members in members.items():
+            if not group_members:
+                continue
+            # A single shared anchor makes every other position fail immediately.
+            joined = "|".join(patterns[anchor])
+            group = _RuleGroup(
+                _compile(f"{anchor}(?:{joined})" if anchor else joined, joined)
+            )
+            for first, member in group_members:
+                if first:
+                    group.by_first_char.setdefault(first, []).append(member)
+                else:
+                    group.unindexed.append(member)
+            self._groups.append(group)
+
+    def classify(self, message: str) -> set[BumpStrategy]:
+        """Return the strategies selected by a commit message."""
+        found = {
+            strategy
+            for strategy, rule in self._standalone
+            if rule.search(message) is not None
+        }
+        for group in self._groups:
+            for match in group.matcher.finditer(message):
+                start, end = match.span()
+                found.update(
+                    strategy
+                    for strategy, rule in group.candidates(message[start:end])
+                    if strategy not in found
+                    and _matches_within(rule, message, start, end)
+                )
+        return found
+
+    def bump_strategy(
+        self, commits: Iterable[Commit] | CommitBatch, default: BumpStrategy
+    ) -> BumpStrategy:
+        """Return the strongest strategy selected by commits, or default when none is.
+
+        Commits are consumed lazily and the scan stops at the first skip, which
+        settles the result, so the remaining pages are never requested.
+        """
+        messages: Iterable[str] = (
+            commits.messages
+            if isinstance(commits, CommitBatch)
+            else (commit.message for commit in commits)
+        )
+        found: set[BumpStrategy] = set()
+        for message in messages:
+            strategies = self.classify(message)
+            if BumpStrategy.SKIP in strategies:
+                return BumpStrategy.SKIP
+            found |= strategies
+        for strategy in STRATEGY_PRECEDENCE:
+            if strategy in found:
+                return strategy
+        return default
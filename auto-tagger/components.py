@@ -0,0 +1,63 @@
+"""Monorepo components tagged independently from a single commit listing."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_MAPPING_SEPARATOR: Final[str] = "="
+_COMMENT_PREFIX: Final[str] = "#"
+_ROOT_PATHS: Final[frozenset[str]] = frozenset({"", "."})
+
+
+class ComponentError(ValueError):
+    """Raised when a component mapping cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class Component:
+    """Directory of the repository released with its own tag prefix (e.g. api= api-v)."""
+
+    path: str
+    prefix: str
+
+    @property
+    def directory(self) -> str:
+        """Return the path without surrounding slashes; empty for the repository root."""
+        directory = self.path.strip().strip("/")
+        return "" if directory in _ROOT_PATHS else directory
+
+    def contains(self, filename: str) -> bool:
+        """Tell whether a changed file lives under the component directory."""
+        directory = self.directory
+        return (
+            not directory
+            or filename == directory
+            or filename.startswith(f"{directory}/")
+        )
+
+    def is_touched_by(self, filenames: Iterable[str] | None) -> bool:
+        """Tell whether a commit changing filenames (None when unknown) releases the component."""
+        return filenames is None or any(self.contains(name) for name in filenames)
+
+
+def parse_components(value: str) -> tuple[Component, ...]:
+    """Parse one <path>=<tag prefix> mapping per line; blank lines and # comments are ignored."""
+    components: list[Component] = []
+    for raw_line in value.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(_COMMENT_PREFIX):
+            continue
+        path, separator, prefix = line.partition(_MAPPING_SEPARATOR)
+        if not separator or not path.strip() or not prefix.strip():
+            message = f"Invalid component {line!r}: expected <path>=<tag prefix>."
+            raise ComponentError(message)
+        components.append(Component(path.strip(), prefix.strip()))
+    prefixes = [component.prefix for component in components]
+    if len(set(prefixes)) != len(prefixes):
+        message = "Component tag prefixes must be unique."
+        raise ComponentError(message)
+    return tuple(components)
@@ -4,14 +4,23 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
 
-    from github_resources import Commit
+    from github_resources import Commit, CommitBatch
 
-from github_resources import BumpStrategy
+from commit_rules import (
+    CONVENTIONAL_COMMIT_RULES,
+    MARKER_RULES,
+    CommitRuleEngine,
+    CommitRuleError,
+    parse_commit_rules,
+)
+from components import Component, ComponentError, parse_components
+from github_resources import BumpStrategy, CommitRange, RepositoryBackend
 
 _TRUE_VALUES = {"1", "true", "yes", "y", "on"}
 _FALSE_VALUES = {"0", "false", "no", "n", "off"}
@@ -22,6 +31,20 @@ _DEFAULT_PATH = "."
 _DEFAULT_PREFIX = "v"
 _DEFAULT_SUFFIX = ""
 _DEFAULT_DRY_RUN = False
+_DEFAULT_BACKEND = RepositoryBackend.REST
+_DEFAULT_COMMIT_RANGE = CommitRange.DATE
+_DEFAULT_CACHE_DIR = ""
+_DEFAULT_HTTP_CACHE_MAX_MB = 50
+_DEFAULT_PARALLEL_PAGES = 8
+_DEFAULT_RATE_LIMIT_RETRIES = 5
+_DEFAULT_HTTP_POOL_SIZE = 10
+_DEFAULT_HTTP_TIMEOUT = 15
+_DEFAULT_HTTP2 = False
+_DEFAULT_CONVENTIONAL_COMMITS = False
+_DEFAULT_COMMIT_RULES = ""
+_DEFAULT_TAGGER_NAME = ""
+_DEFAULT_TAGGER_EMAIL = ""
+_DEFAULT_COMPONENTS = ""
 
 
 class ConfigurationError(ValueError):
@@ -54,6 +77,18 @@ def _env_str(
     return stripped
 
 
+def _env_int(env: Mapping[str, str], var_name: str, default: int) -> int:
+    """Return a positive integer from env, falling back to default when invalid."""
+    value = env.get(var_name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value.strip())
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
 def _parse_bump_strategy(value: str | None, *, default: BumpStrategy) -> BumpStrategy:
     """Parse a bump strategy value; fall back to default when invalid."""
     if value is None:
@@ -64,6 +99,28 @@ def _parse_bump_strategy(value: str | None, *, default: BumpStrategy) -> BumpStr
         return default
 
 
+def _parse_backend(
+    value: str | None, *, default: RepositoryBackend
+) -> RepositoryBackend:
+    """Parse a repository backend value; fall back to default when invalid."""
+    if value is None:
+        return default
+    try:
+        return RepositoryBackend(value.strip().lower())
+    except ValueError:
+        return default
+
+
+def _parse_commit_range(value: str | None, *, default: CommitRange) -> CommitRange:
+    """Parse a commit range mode; fall back to default when invalid."""
+    if value is None:
+        return default
+    try:
+        return CommitRange(value.strip().lower())
+    except ValueError:
+        return default
+
+
 @dataclass
 class Configuration:
     """Configuration resource populated from the environment."""
@@ -76,6 +133,20 @@ class Configuration:
     REPOSITORY: str = ""
     SUFFIX: str = _DEFAULT_SUFFIX
     DRY_RUN: bool = _DEFAULT_DRY_RUN
+    BACKEND: RepositoryBackend = _DEFAULT_BACKEND
+    COMMIT_RANGE: CommitRange = _DEFAULT_COMMIT_RANGE
+    CACHE_DIR: str = _DEFAULT_CACHE_DIR
+    HTTP_CACHE_MAX_MB: int = _DEFAULT_HTTP_CACHE_MAX_MB
+    PARALLEL_PAGES: int = _DEFAULT_PARALLEL_PAGES
+    RATE_LIMIT_RETRIES: int = _DEFAULT_RATE_LIMIT_RETRIES
+    HTTP_POOL_SIZE: int = _DEFAULT_HTTP_POOL_SIZE
+    HTTP_TIMEOUT: int = _DEFAULT_HTTP_TIMEOUT
+    HTTP2: bool = _DEFAULT_HTTP2
+    CONVENTIONAL_COMMITS: bool = _DEFAULT_CONVENTIONAL_COMMITS
+    COMMIT_RULES: str = _DEFAULT_COMMIT_RULES
+    TAGGER_NAME: str = _DEFAULT_TAGGER_NAME
+    TAGGER_EMAIL: str = _DEFAULT_TAGGER_EMAIL
+    COMPONENTS: str = _DEFAULT_COMPONENTS
 
     @classmethod
     def from_env(cls, env: Mapping[str, str] | None = None) -> Configuration:
@@ -101,22 +172,64 @@ class Configuration:
                 environment, "INPUT_SUFFIX", _DEFAULT_SUFFIX, allow_empty=True
             ),
             DRY_RUN=_env_flag(environment, "INPUT_DRY_RUN", default=_DEFAULT_DRY_RUN),
+            BACKEND=_parse_backend(
+                environment.get("INPUT_BACKEND"), default=_DEFAULT_BACKEND
+            ),
+            COMMIT_RANGE=_parse_commit_range(
+                environment.get("INPUT_COMMIT_RANGE"), default=_DEFAULT_COMMIT_RANGE
+            ),
+            CACHE_DIR=_env_str(environment, "INPUT_CACHE_DIR", _DEFAULT_CACHE_DIR),
+            HTTP_CACHE_MAX_MB=_env_int(
+                environment, "INPUT_HTTP_CACHE_MAX_MB", _DEFAULT_HTTP_CACHE_MAX_MB
+            ),
+            PARALLEL_PAGES=_env_int(
+                environment, "INPUT_PARALLEL_PAGES", _DEFAULT_PARALLEL_PAGES
+            ),
+            RATE_LIMIT_RETRIES=_env_int(
+                environment, "INPUT_RATE_LIMIT_RETRIES", _DEFAULT_RATE_LIMIT_RETRIES
+            ),
+            HTTP_POOL_SIZE=_env_int(
+                environment, "INPUT_HTTP_POOL_SIZE", _DEFAULT_HTTP_POOL_SIZE
+            ),
+            HTTP_TIMEOUT=_env_int(
+                environment, "INPUT_HTTP_TIMEOUT", _DEFAULT_HTTP_TIMEOUT
+            ),
+            HTTP2=_env_flag(environment, "INPUT_HTTP2", default=_DEFAULT_HTTP2),
+            CONVENTIONAL_COMMITS=_env_flag(
+                environment,
+                "INPUT_CONVENTIONAL_COMMITS",
+                default=_DEFAULT_CONVENTIONAL_COMMITS,
+            ),
+            COMMIT_RULES=_env_str(
+                environment, "INPUT_COMMIT_RULES", _DEFAULT_COMMIT_RULES
+            ),
+            TAGGER_NAME=_env_str(
+                environment, "INPUT_TAGGER_NAME", _DEFAULT_TAGGER_NAME
+            ),
+            TAGGER_EMAIL=_env_str(
+                environment, "INPUT_TAGGER_EMAIL", _DEFAULT_TAGGER_EMAIL
+            ),
+            COMPONENTS=_env_str(environment, "INPUT_COMPONENTS", _DEFAULT_COMPONENTS),
         )
 
-    def get_bump_strategy_from_commits(self, commits: Iterable[Commit]) -> BumpStrategy:
-        """Return the bump strategy from commits using [#<strategy>] markers."""
-        strategies_in_commits: set[BumpStrategy] = set()
-        for commit in commits:
-            lowered_message = commit.message.lower()
-            for strategy in BumpStrategy:
-                if f"[#{strategy.value}]" in lowered_message:
-                    strategies_in_commits.add(strategy)
-        if BumpStrategy.SKIP in strategies_in_commits:
-            return BumpStrategy.SKIP
-        for strategy in (BumpStrategy.MAJOR, BumpStrategy.MINOR, BumpStrategy.PATCH):
-            if strategy in strategies_in_commits:
-                return strategy
-        return self.DEFAULT_BUMP_STRATEGY
+    @cached_property
+    def rule_engine(self) -> CommitRuleEngine:
+        """Return the marker, Conventional Commits and custom rules compiled into one matcher."""
+        rules = [*MARKER_RULES, *parse_commit_rules(self.COMMIT_RULES)]
+        if self.CONVENTIONAL_COMMITS:
+            rules.extend(CONVENTIONAL_COMMIT_RULES)
+        return CommitRuleEngine(rules)
+
+    @cached_property
+    def components(self) -> tuple[Component, ...]:
+        """Return the monorepo components tagged independently; empty for a single release."""
+        return parse_components(self.COMPONENTS)
+
+    def get_bump_strategy_from_commits(
+        self, commits: Iterable[Commit] | CommitBatch
+    ) -> BumpStrategy:
+        """Return the bump strategy selected by the commit rules, stopping at the first skip."""
+        return self.rule_engine.bump_strategy(commits, self.DEFAULT_BUMP_STRATEGY)
 
     @property
     def commit_path_filter(self) -> str | None:
@@ -134,3 +247,14 @@ class Configuration:
         if not self.DEFAULT_BRANCH:
             message = "default_branch must be provided."
             raise ConfigurationError(message)
+        try:
+            _ = self.rule_engine
+        except CommitRuleError as error:
+            raise ConfigurationError(str(error)) from error
+        try:
+            components = self.components
+        except ComponentError as error:
+            raise ConfigurationError(str(error)) from error
+        if components and self.commit_path_filter is not None:
+            message = "path cannot be combined with components: set each component path instead."
+            raise ConfigurationError(message)
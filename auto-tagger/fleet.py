@@ -0,0 +1,244 @@
+"""Fleet mode: tag many repositories concurrently from one process."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from configuration import Configuration, ConfigurationError
+from github_helpers import GitHubHelper, build_github_client
+from github_resources import RepositoryBackend
+from main import _configure_logging, run
+from transport import transport_stats
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Mapping, Sequence
+
+    from github_helpers import GitHubClient
+    from rate_limit import RateLimitScheduler
+
+_DEFAULT_WORKERS: Final[int] = 8
+_LOG_FORMAT: Final[str] = "%(levelname)s: %(name)s: %(message)s"
+# Variables of the sweep's own workflow run, meaningless for the other repositories.
+_RUN_VARIABLES: Final[frozenset[str]] = frozenset(
+    {"GITHUB_REPOSITORY", "GITHUB_SHA", "GITHUB_REF_NAME", "GITHUB_WORKSPACE"}
+)
+# Fleet file keys mapped to workflow variables instead of action inputs.
+_ENTRY_VARIABLES: Final[dict[str, str]] = {
+    "repository": "GITHUB_REPOSITORY",
+    "sha": "GITHUB_SHA",
+    "workspace": "GITHUB_WORKSPACE",
+}
+
+
+class FleetError(ValueError):
+    """Raised when the fleet file cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    """Outcome of the auto-tagger run of one repository."""
+
+    repository: str
+    exit_code: int
+    seconds: float
+    error: str = ""
+
+
+def _input_value(value: Any) -> str:
+    """Render a JSON value as an action input (e.g. true, 5)."""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def load_fleet(text: str, base_env: Mapping[str, str]) -> list[dict[str, str]]:
+    """Build the environment of every repository listed in a fleet file.
+
+    The file holds a list of repositories, or {"defaults": {...}, "repositories": [...]}.
+    A repository is a name, or an object of action inputs with its "repository" and
+    optionally the "sha" to tag and the "workspace" of its clone. Inputs of base_env
+    (e.g. INPUT_GITHUB_TOKEN) apply to every repository unless overridden.
+    """
+    try:
+        document = json.loads(text)
+    except json.JSONDecodeError as error:
+        message = f"Invalid fleet file: {error}"
+        raise FleetError(message) from error
+    if isinstance(document, list):
+        document = {"repositories": document}
+    if not isinstance(document, dict) or not isinstance(
+        document.get("repositories"), list
+    ):
+        message = "Invalid fleet file: expected a list of repositories."
+        raise FleetError(message)
+    defaults = document.get("defaults", {})
+    if not isinstance(defaults, dict):
+        message = "Invalid fleet file: defaults must be an object of inputs."
+        raise FleetError(message)
+    shared = {
+        name: value for name, value in base_env.items() if name not in _RUN_VARIABLES
+    }
+    environments: list[dict[str, str]] = []
+    for raw_entry in document["repositories"]:
+        entry = {"repository": raw_entry} if isinstance(raw_entry, str) else raw_entry
+        if not isinstance(entry, dict) or not entry.get("repository"):
+            message = f"Invalid fleet repository {raw_entry!r}: expected a name or an object with a repository."
+            raise FleetError(message)
+        environment = dict(shared)
+        for name, value in {**defaults, **entry}.items():
+            variable = _ENTRY_VARIABLES.get(name, f"INPUT_{name.upper()}")
+            environment[variable] = _input_value(value)
+        environments.append(environment)
+    return environments
+
+
+def load_repository_configuration(env: Mapping[str, str]) -> Configuration:
+    """Load and validate the configuration of a repository run outside its own workflow."""
+    config = Configuration.from_env(env)
+    config.validate()
+    if config.BACKEND is RepositoryBackend.LOCAL and not env.get("GITHUB_WORKSPACE"):
+        message = "The local backend needs the workspace of the repository clone."
+        raise ConfigurationError(message)
+    return config
+
+
+def _run_repository(
+    env: Mapping[str, str],
+    token: str,
+    client: GitHubClient,
+    rate_limit: RateLimitScheduler | None,
+    logger: logging.Logger,
+) -> FleetResult:
+    """Run the auto-tagger for one repository, turning failures into a result."""
+    repository = env["GITHUB_REPOSITORY"]
+    repository_logger = logger.getChild(repository)
+    started = time.perf_counter()
+    try:
+        config = load_repository_configuration(env)
+    except ConfigurationError as error:
+        repository_logger.exception("Invalid configuration.")
+        return FleetResult(repository, 2, time.perf_counter() - started, str(error))
+    try:
+        github = GitHubHelper(token, config, client, rate_limit=rate_limit, env=env)
+        exit_code = run(config, github, env, repository_logger)
+    except Exception as error:
+        repository_logger.exception("Auto-tagger failed.")
+        return FleetResult(repository, 1, time.perf_counter() - started, str(error))
+    return FleetResult(repository, exit_code, time.perf_counter() - started)
+
+
+def run_fleet(
+    environments: Sequence[Mapping[str, str]],
+    token: str,
+    client: GitHubClient,
+    rate_limit: RateLimitScheduler | None,
+    *,
+    logger: logging.Logger,
+    max_workers: int = _DEFAULT_WORKERS,
+) -> list[FleetResult]:
+    """Run the auto-tagger for every repository, max_workers at a time.
+
+    Every run shares the client, so its pooled session and its rate limit scheduler
+    pace the whole fleet against the same API budget.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                lambda env: _run_repository(env, token, client, rate_limit, logger),
+                environments,
+            )
+        )
+
+
+def _write_summary(
+    results: Sequence[FleetResult],
+    rate_limit: RateLimitScheduler | None,
+    env: Mapping[str, str],
+    logger: logging.Logger,
+) -> None:
+    """Log the per-repository results and write them to FLEET_SUMMARY and the step summary."""
+    for result in results:
+        logger.info(
+            "%s: exit code %d in %.1fs%s",
+            result.repository,
+            result.exit_code,
+            result.seconds,
+            f" ({result.error})" if result.error else "",
+        )
+    budget = rate_limit.budget if rate_limit is not None else None
+    if budget is not None:
+        logger.info("GitHub API rate limit: %s.", budget)
+    stats = transport_stats()
+    logger.info("GitHub API transport: %s.", stats)
+    summary_path = env.get("FLEET_SUMMARY")
+    if summary_path:
+        Path(summary_path).write_text(
+            json.dumps(
+                {
+                    "results": [asdict(result) for result in results],
+                    "rate_limit": str(budget) if budget is not None else None,
+                    "transport": asdict(stats),
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    step_summary = env.get("GITHUB_STEP_SUMMARY")
+    if step_summary:
+        rows = [
+            f"| {result.repository} | {result.exit_code} | {result.seconds:.1f}s | {result.error} |"
+            for result in results
+        ]
+        with Path(step_summary).open("a", encoding="utf-8") as summary:
+            summary.write(
+                "\n".join(
+                    [
+                        "| Repository | Exit code | Duration | Error |",
+                        "| --- | --- | --- | --- |",
+                        *rows,
+                        "",
+                    ]
+                )
+            )
+
+
+def run_fleet_from_env(env: Mapping[str, str] | None = None) -> int:
+    """Tag every repository of the FLEET_FILE with FLEET_WORKERS concurrent runs."""
+    environment = env or os.environ
+    logger = _configure_logging(environment, _LOG_FORMAT)
+
+    token = environment.get("INPUT_GITHUB_TOKEN", "").strip()
+    if not token:
+        logger.error(
+            "Missing INPUT_GITHUB_TOKEN; refusing to call the GitHub API without credentials."
+        )
+        return 1
+
+    try:
+        environments = load_fleet(
+            Path(environment.get("FLEET_FILE", "")).read_text(encoding="utf-8"),
+            environment,
+        )
+        workers = int(environment.get("FLEET_WORKERS", _DEFAULT_WORKERS))
+        if workers < 1:
+            message = "FLEET_WORKERS must be a positive integer."
+            raise FleetError(message)
+        # Transport settings (cache, retries, page workers) are shared by the fleet.
+        config = Configuration.from_env(environment)
+    except (OSError, ValueError):
+        logger.exception("Invalid fleet.")
+        return 2
+
+    client, rate_limit = build_github_client(
+        token, config, pool_size=workers * config.PARALLEL_PAGES
+    )
+    results = run_fleet(
+        environments, token, client, rate_limit, logger=logger, max_workers=workers
+    )
+    _write_summary(results, rate_limit, environment, logger)
+    return 0 if all(result.exit_code == 0 for result in results) else 1
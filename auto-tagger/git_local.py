@@ -0,0 +1,300 @@
+"""Repository operations answered from the local clone through the git CLI."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from github import InputGitAuthor
+
+    from github_helpers import (
+        GitAnnotatedTagPayload,
+        GitCommitAuthor,
+        GitCommitData,
+        GitCommitPayload,
+        GitFilePayload,
+        GitObjectPayload,
+        GitReference,
+        GitRepository,
+    )
+
+_TAGS_REF_PREFIX: Final[str] = "refs/tags/"
+_FIELD_SEPARATOR: Final[str] = "\x00"
+_RECORD_SEPARATOR: Final[str] = "\x1e"
+# hash, author name, author email, strict ISO author date, raw body
+_LOG_FORMAT: Final[str] = "%H%x00%an%x00%ae%x00%aI%x00%B%x1e"
+# record separator before each hash, the changed file names follow on their own lines
+_FILES_FORMAT: Final[str] = "%x1e%H"
+# tag name, object name, peeled object name (annotated tags only)
+_REF_FORMAT: Final[str] = "%(refname:strip=2)%00%(objectname)%00%(*objectname)"
+
+
+class LocalGitError(RuntimeError):
+    """Raised when a git command run against the local clone fails."""
+
+
+@dataclass
+class LocalAuthor:
+    """Commit author read from the local clone."""
+
+    name: str
+    email: str
+    date: datetime
+
+
+@dataclass
+class LocalCommitData:
+    """Commit data read from the local clone."""
+
+    author: GitCommitAuthor
+    message: str
+
+
+@dataclass
+class LocalCommit:
+    """Commit payload shaped like the PyGitHub one."""
+
+    sha: str
+    commit: GitCommitData
+    author: GitCommitAuthor | None
+
+
+@dataclass
+class LocalTag:
+    """Tag payload shaped like the PyGitHub one."""
+
+    name: str
+    commit: GitCommitPayload
+
+
+@dataclass
+class LocalObject:
+    """Object targeted by a reference."""
+
+    sha: str
+    type: str
+
+
+@dataclass
+class LocalRef:
+    """Tag reference peeled to its target commit."""
+
+    ref: str
+    object: GitObjectPayload
+
+
+@dataclass
+class LocalFile:
+    """File changed within a comparison."""
+
+    filename: str
+
+
+@dataclass
+class LocalComparison:
+    """Commits reachable from head but not from base, with the files they change."""
+
+    commits: Sequence[GitCommitPayload]
+    files: Sequence[GitFilePayload]
+
+
+@dataclass
+class LocalAnnotatedTag:
+    """Annotated tag peeled to the commit it tags."""
+
+    object: GitObjectPayload
+
+
+def _parse_log(output: str) -> list[LocalCommit]:
+    """Decode git log output produced with the record format."""
+    commits: list[LocalCommit] = []
+    for raw_record in output.split(_RECORD_SEPARATOR):
+        record = raw_record.lstrip("\n")
+        if not record:
+            continue
+        sha, name, email, date, message = record.split(_FIELD_SEPARATOR, 4)
+        author = LocalAuthor(name=name, email=email, date=datetime.fromisoformat(date))
+        commits.append(
+            LocalCommit(
+                sha=sha,
+                commit=LocalCommitData(author=author, message=message.rstrip("\n")),
+                author=author,
+            )
+        )
+    return commits
+
+
+class LocalGitRepository:
+    """Repository backend reading tags and history from the checked-out clone.
+
+    Reads cost local disk I/O only; writes are delegated to the REST repository.
+    """
+
+    def __init__(self, rest_repo: GitRepository, path: str, git: str) -> None:
+        """Bind the backend to a clone; git is the absolute path of the git executable."""
+        self.rest_repo = rest_repo
+        self.path = path
+        self.git = git
+
+    @classmethod
+    def open(cls, rest_repo: GitRepository, path: str) -> LocalGitRepository | None:
+        """Return a backend for the clone at path, or None when it is missing or shallow."""
+        git = shutil.which("git")
+        if git is None:
+            return None
+        repository = cls(rest_repo, path, git)
+        try:
+            shallow = repository._git("rev-parse", "--is-shallow-repository")
+        except LocalGitError:
+            return None
+        if shallow.strip() != "false":
+            return None
+        return repository
+
+    def _git(self, *args: str) -> str:
+        """Run a git command in the clone and return its standard output."""
+        # The workspace is usually owned by another user than the container one.
+        command = [self.git, "-c", "safe.directory=*", "-C", self.path, *args]
+        result = subprocess.run(  # noqa: S603
+            command, capture_output=True, text=True, check=False
+        )
+        if result.returncode != 0:
+            message = f"git {args[0]} failed: {result.stderr.strip()}"
+            raise LocalGitError(message)
+        return result.stdout
+
+    def _log(self, *args: str) -> list[LocalCommit]:
+        """Run git log with the record format."""
+        return _parse_log(self._git("log", f"--format={_LOG_FORMAT}", *args))
+
+    def _list_tag_refs(self) -> list[LocalRef]:
+        """List every tag peeled to the commit it points to."""
+        refs: list[LocalRef] = []
+        for line in self._git(
+            "for-each-ref", f"--format={_REF_FORMAT}", _TAGS_REF_PREFIX
+        ).splitlines():
+            name, sha, peeled = line.split(_FIELD_SEPARATOR)
+            refs.append(
+                LocalRef(
+                    ref=f"{_TAGS_REF_PREFIX}{name}",
+                    object=LocalObject(sha=peeled or sha, type="commit"),
+                )
+            )
+        return refs
+
+    def get_commits(
+        self,
+        *,
+        since: datetime | None = None,
+        sha: str | None = None,
+        path: str | None = None,
+    ) -> list[LocalCommit]:
+        """Return the history of sha (HEAD by default) after a timestamp for an optional path."""
+        args = [sha or "HEAD"]
+        if since is not None:
+            args.insert(0, f"--since={since.isoformat()}")
+        args.append("--")
+        if path is not None:
+            args.append(path)
+        return self._log(*args)
+
+    def get_commit(self, sha: str) -> LocalCommit:
+        """Read a commit by SHA or ref name."""
+        try:
+            commits = self._log("--no-walk", sha, "--")
+        except LocalGitError as error:
+            message = f"Commit {sha} not found"
+            raise ValueError(message) from error
+        return commits[0]
+
+    def get_changed_files(self, shas: Sequence[str]) -> dict[str, list[str] | None]:
+        """Return the files changed by each commit, read in a single git call.
+
+        Merge commits are compared to their first parent, and renames list both names.
+        """
+        if not shas:
+            return {}
+        output = self._git(
+            "log",
+            "--no-walk=unsorted",
+            "--diff-merges=first-parent",
+            "--no-renames",
+            "--name-only",
+            f"--format={_FILES_FORMAT}",
+            *shas,
+            "--",
+        )
+        changed: dict[str, list[str] | None] = {}
+        for record in output.split(_RECORD_SEPARATOR):
+            sha, *filenames = record.strip("\n").splitlines() or [""]
+            if sha:
+                changed[sha] = [name for name in filenames if name]
+        return changed
+
+    def compare(self, base: str, head: str) -> LocalComparison:
+        """List the commits after base up to head, oldest first, and the files they change."""
+        files = self._git("diff", "--name-only", f"{base}...{head}").splitlines()
+        return LocalComparison(
+            commits=self._log("--reverse", f"{base}..{head}", "--"),
+            files=[LocalFile(filename=filename) for filename in files],
+        )
+
+    def get_tags(self) -> list[LocalTag]:
+        """Return all tags with their target commits, read in a single git call."""
+        refs = self._list_tag_refs()
+        if not refs:
+            return []
+        shas = list(dict.fromkeys(ref.object.sha for ref in refs))
+        commits = {
+            commit.sha: commit
+            for commit in self._log("--no-walk=unsorted", *shas, "--")
+        }
+        return [
+            LocalTag(
+                name=ref.ref.removeprefix(_TAGS_REF_PREFIX),
+                commit=commits[ref.object.sha],
+            )
+            for ref in refs
+        ]
+
+    def get_git_matching_refs(self, ref: str) -> list[LocalRef]:
+        """Return tag references starting with the given name (e.g. tags/v)."""
+        prefix = f"refs/{ref}"
+        return [
+            tag_ref
+            for tag_ref in self._list_tag_refs()
+            if tag_ref.ref.startswith(prefix)
+        ]
+
+    def get_git_tag(self, sha: str) -> GitAnnotatedTagPayload:
+        """Peel an annotated tag object to the commit it tags."""
+        commit_sha = self._git("rev-parse", f"{sha}^{{commit}}").strip()
+        return LocalAnnotatedTag(object=LocalObject(sha=commit_sha, type="commit"))
+
+    def create_git_tag(
+        self,
+        *,
+        tag: str,
+        message: str,
+        object: str,  # noqa: A002
+        type: str,  # noqa: A002
+        tagger: InputGitAuthor,
+    ) -> None:
+        """Create a new annotated tag through REST."""
+        self.rest_repo.create_git_tag(
+            tag=tag, message=message, object=object, type=type, tagger=tagger
+        )
+
+    def create_git_ref(self, ref: str, sha: str) -> None:
+        """Create a reference through REST."""
+        self.rest_repo.create_git_ref(ref, sha)
+
+    def get_git_ref(self, ref: str) -> GitReference:
+        """Return a mutable reference object through REST."""
+        return self.rest_repo.get_git_ref(ref)
@@ -0,0 +1,335 @@
+"""GraphQL implementation of the repository operations used by the helper."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from github import InputGitAuthor
+
+    from github_helpers import (
+        GitAnnotatedTagPayload,
+        GitCommitAuthor,
+        GitCommitData,
+        GitCommitPayload,
+        GitComparison,
+        GitObjectPayload,
+        GitReference,
+        GitRepository,
+    )
+
+_PAGE_SIZE: Final[int] = 100
+_TAGS_REF_PREFIX: Final[str] = "refs/tags/"
+
+_COMMIT_FIELDS: Final[str] = """
+fragment CommitFields on Commit {
+  oid
+  message
+  committedDate
+  author { name email date }
+}
+"""
+
+_TAGS_QUERY: Final[str] = (
+    _COMMIT_FIELDS
+    + """
+query($owner: String!, $name: String!, $query: String, $head: String!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    head: object(expression: $head) { ...CommitFields }
+    refs(refPrefix: "refs/tags/", query: $query, first: $first, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        target {
+          __typename
+          oid
+          ...CommitFields
+          ... on Tag { target { ...CommitFields } }
+        }
+      }
+    }
+  }
+}
+"""
+)
+
+_HISTORY_QUERY: Final[str] = (
+    _COMMIT_FIELDS
+    + """
+query(
+  $owner: String!, $name: String!, $expression: String!, $since: GitTimestamp,
+  $path: String, $first: Int!, $after: String
+) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      ... on Commit {
+        history(first: $first, since: $since, path: $path, after: $after) {
+          pageInfo { hasNextPage endCursor }
+          nodes { ...CommitFields }
+        }
+      }
+    }
+  }
+}
+"""
+)
+
+_COMMIT_QUERY: Final[str] = (
+    _COMMIT_FIELDS
+    + """
+query($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) { ...CommitFields }
+  }
+}
+"""
+)
+
+
+class GraphQLRequester(Protocol):
+    """Subset of the PyGitHub requester able to run GraphQL queries."""
+
+    def graphql_query(
+        self, query: str, variables: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Run a GraphQL query and return the response headers and JSON payload."""
+
+
+class GraphQLClient(Protocol):
+    """GitHub client exposing the requester used for GraphQL calls."""
+
+    requester: GraphQLRequester
+
+
+@dataclass
+class GraphQLAuthor:
+    """Commit author decoded from a GraphQL response."""
+
+    name: str
+    email: str
+    date: datetime
+
+
+@dataclass
+class GraphQLCommitData:
+    """Commit data decoded from a GraphQL response."""
+
+    author: GitCommitAuthor
+    message: str
+
+
+@dataclass
+class GraphQLCommit:
+    """Commit payload shaped like the PyGitHub one."""
+
+    sha: str
+    commit: GitCommitData
+    author: GitCommitAuthor | None
+
+
+@dataclass
+class GraphQLTag:
+    """Tag payload shaped like the PyGitHub one."""
+
+    name: str
+    commit: GitCommitPayload
+
+
+@dataclass
+class GraphQLObject:
+    """Object targeted by a reference."""
+
+    sha: str
+    type: str
+
+
+@dataclass
+class GraphQLRef:
+    """Tag reference peeled to its target commit."""
+
+    ref: str
+    object: GitObjectPayload
+
+
+def _to_commit(node: dict[str, Any]) -> GraphQLCommit:
+    """Decode a CommitFields node into a commit payload."""
+    author_node = node.get("author") or {}
+    author = GraphQLAuthor(
+        name=author_node.get("name") or "",
+        email=author_node.get("email") or "",
+        date=datetime.fromisoformat(author_node.get("date") or node["committedDate"]),
+    )
+    return GraphQLCommit(
+        sha=node["oid"],
+        commit=GraphQLCommitData(author=author, message=node["message"]),
+        author=author,
+    )
+
+
+def _peel_commit(target: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the commit node behind a ref target, following annotated tags."""
+    if target.get("__typename") == "Tag":
+        target = target.get("target") or {}
+    if "committedDate" not in target:
+        return None
+    return target
+
+
+class GraphQLRepository:
+    """Repository backend that batches reads through the GraphQL API.
+
+    Tags are listed together with their peeled target commits and the head commit in
+    a single query, so later commit lookups are served from memory. Writes are
+    delegated to the REST repository.
+    """
+
+    def __init__(
+        self,
+        rest_repo: GitRepository,
+        requester: GraphQLRequester,
+        full_name: str,
+        head: str = "HEAD",
+    ) -> None:
+        """Bind the backend to a repository; head is the expression of the commit to prefetch."""
+        self.rest_repo = rest_repo
+        self.requester = requester
+        self.owner, _, self.name = full_name.partition("/")
+        self.head = head
+        self._commits: dict[str, GraphQLCommit] = {}
+
+    def _query(self, document: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a query against the bound repository and return its repository node."""
+        _, payload = self.requester.graphql_query(
+            document,
+            {"owner": self.owner, "name": self.name, "first": _PAGE_SIZE, **variables},
+        )
+        repository: dict[str, Any] = payload["data"]["repository"]
+        return repository
+
+    def _remember(self, node: dict[str, Any]) -> GraphQLCommit:
+        """Decode a commit node and keep it for later lookups."""
+        commit = _to_commit(node)
+        self._commits[commit.sha] = commit
+        return commit
+
+    def _list_tag_refs(self, prefix: str) -> list[GraphQLRef]:
+        """Page through tag refs under prefix, caching every target commit."""
+        refs: list[GraphQLRef] = []
+        after: str | None = None
+        while True:
+            repository = self._query(
+                _TAGS_QUERY,
+                {"query": prefix or None, "head": self.head, "after": after},
+            )
+            if repository.get("head") and "committedDate" in repository["head"]:
+                self._remember(repository["head"])
+            connection = repository["refs"]
+            for node in connection["nodes"]:
+                if not node["name"].startswith(prefix):
+                    continue
+                commit_node = _peel_commit(node["target"])
+                if commit_node is None:
+                    continue
+                commit = self._remember(commit_node)
+                refs.append(
+                    GraphQLRef(
+                        ref=f"{_TAGS_REF_PREFIX}{node['name']}",
+                        object=GraphQLObject(sha=commit.sha, type="commit"),
+                    )
+                )
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return refs
+            after = page_info["endCursor"]
+
+    def get_commits(
+        self,
+        *,
+        since: datetime | None = None,
+        sha: str | None = None,
+        path: str | None = None,
+    ) -> Iterator[GraphQLCommit]:
+        """Stream the history of sha (default branch by default) after a timestamp for an optional path.
+
+        Pages are requested as the commits are consumed, so a caller stopping early
+        (e.g. at the first commit or at a skip marker) never requests the rest.
+        """
+        after: str | None = None
+        while True:
+            repository = self._query(
+                _HISTORY_QUERY,
+                {
+                    "expression": sha or "HEAD",
+                    "since": since.isoformat() if since else None,
+                    "path": path,
+                    "after": after,
+                },
+            )
+            target = repository.get("object")
+            if not target:
+                return
+            history = target["history"]
+            for node in history["nodes"]:
+                yield self._remember(node)
+            page_info = history["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            after = page_info["endCursor"]
+
+    def compare(self, base: str, head: str) -> GitComparison:
+        """Compare two commits through REST."""
+        return self.rest_repo.compare(base, head)
+
+    def get_commit(self, sha: str) -> GraphQLCommit:
+        """Fetch a commit by SHA or ref name, answering from the prefetched commits when possible."""
+        if sha in self._commits:
+            return self._commits[sha]
+        node = self._query(_COMMIT_QUERY, {"expression": sha}).get("object")
+        if not node or "committedDate" not in node:
+            message = f"Commit {sha} not found"
+            raise ValueError(message)
+        return self._remember(node)
+
+    def get_tags(self) -> list[GraphQLTag]:
+        """Return all tags on the repository with their target commits."""
+        return [
+            GraphQLTag(
+                name=ref.ref.removeprefix(_TAGS_REF_PREFIX),
+                commit=self._commits[ref.object.sha],
+            )
+            for ref in self.get_git_matching_refs("tags/")
+        ]
+
+    def get_git_matching_refs(self, ref: str) -> list[GraphQLRef]:
+        """Return tag references starting with the given name (e.g. tags/v)."""
+        return self._list_tag_refs(ref.removeprefix("tags/"))
+
+    def get_git_tag(self, sha: str) -> GitAnnotatedTagPayload:
+        """Fetch an annotated tag object by SHA through REST (refs are already peeled)."""
+        return self.rest_repo.get_git_tag(sha)
+
+    def create_git_tag(
+        self,
+        *,
+        tag: str,
+        message: str,
+        object: str,  # noqa: A002
+        type: str,  # noqa: A002
+        tagger: InputGitAuthor,
+    ) -> None:
+        """Create a new annotated tag through REST."""
+        self.rest_repo.create_git_tag(
+            tag=tag, message=message, object=object, type=type, tagger=tagger
+        )
+
+    def create_git_ref(self, ref: str, sha: str) -> None:
+        """Create a reference through REST."""
+        self.rest_repo.create_git_ref(ref, sha)
+
+    def get_git_ref(self, ref: str) -> GitReference:
+        """Return a mutable reference object through REST."""
+        return self.rest_repo.get_git_ref(ref)
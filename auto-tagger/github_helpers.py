@@ -4,19 +4,47 @@ from __future__ import annotations
 
 import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Protocol, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
+    from components import Component
     from configuration import Configuration
+    from github_graphql import GraphQLClient
 
 from github import Github, InputGitAuthor
 from github.GithubException import GithubException
-from semver import Version, VersionInfo
-
-from github_resources import BumpStrategy, Commit, Tag
+from github.Repository import Repository
+from semver import Version
+
+from git_local import LocalGitRepository
+from github_graphql import GraphQLRepository
+from github_resources import (
+    BumpStrategy,
+    Commit,
+    CommitRange,
+    RepositoryBackend,
+    Tag,
+    TagRef,
+)
+from http_cache import ResponseCache
+from pagination import ParallelPagesRepository
+from rate_limit import RateLimitScheduler
+from tag_cache import TagCache
+from transport import TransportSettings, create_client
+from version_keys import VersionKey, version_key
+
+# The compare endpoint lists at most this many changed files.
+_COMPARE_FILES_LIMIT = 300
+_DEFAULT_TAGGER_NAME = "automation"
+_DEFAULT_TAGGER_EMAIL = "automation@users.noreply.github.com"
+# Statuses returned when updating a reference that does not exist.
+_MISSING_REF_STATUSES = frozenset({404, 422})
 
 
 class GitCommitAuthor(Protocol):
@@ -49,27 +77,94 @@ class GitTagPayload(Protocol):
     commit: GitCommitPayload
 
 
-class GitReference(Protocol):
+class GitObjectPayload(Protocol):
+    """Object a Git reference or an annotated tag points to."""
+
+    sha: str
+    type: str
+
+
+class GitAnnotatedTagPayload(Protocol):
+    """Annotated tag object returned by PyGitHub."""
+
+    object: GitObjectPayload
+
+
+class GitRefPayload(Protocol):
+    """Reference name and target object as listed by PyGitHub."""
+
+    ref: str
+    object: GitObjectPayload
+
+
+class GitReference(GitRefPayload, Protocol):
     """Lightweight interface for a Git reference."""
 
     def delete(self) -> None:
         """Delete the reference from the repository."""
 
+    def edit(self, sha: str, force: bool = ...) -> None:  # noqa: FBT001
+        """Point the reference to another SHA, even when not a fast-forward with force."""
+
+
+class GitFilePayload(Protocol):
+    """File changed within a comparison."""
+
+    filename: str
+
+
+class GitCommitFilesPayload(Protocol):
+    """Commit payload listing the files the commit changes."""
+
+    files: Iterable[GitFilePayload]
+
+
+@runtime_checkable
+class ChangedFilesLister(Protocol):
+    """Repository able to list the files changed by many commits in one go."""
+
+    def get_changed_files(self, shas: Sequence[str]) -> dict[str, list[str] | None]:
+        """Return the files changed by each commit; None when the list is incomplete."""
+
+
+@runtime_checkable
+class HeadCommitReader(Protocol):
+    """Repository able to read the newest commit without listing a page of history."""
+
+    def get_head_commit(self, path: str | None = None) -> GitCommitPayload | None:
+        """Return the newest commit of the default branch touching path, if any."""
+
+
+class GitComparison(Protocol):
+    """Comparison between two commits as returned by PyGitHub."""
+
+    commits: Sequence[GitCommitPayload]
+    files: Sequence[GitFilePayload]
+
 
 class GitRepository(Protocol):
     """Typed interface representing the subset of repository operations used by the helper."""
 
     def get_commits(
-        self, *, since: datetime, path: str | None = None
-    ) -> Sequence[GitCommitPayload]:
-        """Return commits after a specific timestamp for an optional path."""
+        self, *, since: datetime = ..., sha: str = ..., path: str | None = None
+    ) -> Iterable[GitCommitPayload]:
+        """Return commits reachable from sha (default branch by default) after a timestamp for an optional path."""
+
+    def compare(self, base: str, head: str) -> GitComparison:
+        """Compare two commits, listing the commits reachable from head but not from base."""
 
     def get_commit(self, sha: str) -> GitCommitPayload:
-        """Fetch a commit by SHA."""
+        """Fetch a commit by SHA or ref name."""
 
-    def get_tags(self) -> Sequence[GitTagPayload]:
+    def get_tags(self) -> Iterable[GitTagPayload]:
         """Return all tags on the repository."""
 
+    def get_git_matching_refs(self, ref: str) -> Iterable[GitRefPayload]:
+        """Return the references starting with the given name (e.g. tags/v)."""
+
+    def get_git_tag(self, sha: str) -> GitAnnotatedTagPayload:
+        """Fetch an annotated tag object by SHA."""
+
     def create_git_tag(
         self,
         *,
@@ -95,6 +190,30 @@ class GitHubClient(Protocol):
         """Return a typed repository instance."""
 
 
+@dataclass
+class TagIndex:
+    """Tags matching prefix and suffix, grouped by version format in a single listing pass."""
+
+    semver: list[tuple[VersionKey, TagRef]] = field(default_factory=list)
+    major: list[tuple[int, TagRef]] = field(default_factory=list)
+
+
+@dataclass
+class ComponentRelease:
+    """Commits touching a monorepo component since its last tag."""
+
+    component: Component
+    helper: GitHubHelper
+    last_tag: Tag
+    commits: list[Commit]
+
+
+def _released_after(commit: Commit, tag: Tag) -> bool:
+    """Tell whether a commit is newer than a tag, as the date commit range selects it."""
+    since = tag.date if tag.date.tzinfo else tag.date.replace(tzinfo=UTC)
+    return commit.date >= since + timedelta(seconds=1)
+
+
 def _parse_major_version(version_str: str) -> int | None:
     """Convert a major-only tag value to an int if it is strictly numeric."""
     try:
@@ -103,6 +222,55 @@ def _parse_major_version(version_str: str) -> int | None:
         return None
 
 
+def _comparison_touches_path(comparison: GitComparison, path: str) -> bool:
+    """Tell whether any file changed in the comparison lives under path."""
+    files = comparison.files
+    if len(files) >= _COMPARE_FILES_LIMIT:
+        return True
+    directory = path.strip("/")
+    return any(
+        file.filename == directory or file.filename.startswith(f"{directory}/")
+        for file in files
+    )
+
+
+def build_github_client(
+    token: str, config: Configuration, *, pool_size: int | None = None
+) -> tuple[GitHubClient, RateLimitScheduler]:
+    """Create the PyGitHub client, revalidating reads against the on-disk cache when enabled.
+
+    Requests are paced and retried by the returned rate limit scheduler, so PyGitHub's
+    own retries and fixed delays between requests are disabled. The cache and the
+    scheduler belong to this client only; clients with the same transport settings
+    share a keep-alive pool, and pool_size overrides the http_pool_size input when
+    several runs share it (fleet and service modes).
+    """
+    scheduler = RateLimitScheduler(max_retries=config.RATE_LIMIT_RETRIES)
+    # Lazy objects send no request until an attribute outside their URL is read.
+    client = create_client(
+        lambda: Github(
+            token,
+            lazy=True,
+            retry=None,
+            seconds_between_requests=None,
+            seconds_between_writes=None,
+        ),
+        ResponseCache(
+            Path(config.CACHE_DIR) / "http",
+            max_bytes=config.HTTP_CACHE_MAX_MB * 1024 * 1024,
+        )
+        if config.CACHE_DIR
+        else None,
+        scheduler,
+        TransportSettings(
+            pool_size=pool_size or config.HTTP_POOL_SIZE,
+            timeout=config.HTTP_TIMEOUT,
+            http2=config.HTTP2,
+        ),
+    )
+    return cast("GitHubClient", client), scheduler
+
+
 class GitHubHelper:
     """PyGitHub support class."""
 
@@ -111,20 +279,93 @@ class GitHubHelper:
         token: str,
         config: Configuration,
         github_client: GitHubClient | None = None,
+        *,
+        rate_limit: RateLimitScheduler | None = None,
+        env: Mapping[str, str] | None = None,
     ) -> None:
-        """Create the helper; a non-empty token is mandatory to avoid anonymous calls."""
+        """Create the helper; a non-empty token is mandatory to avoid anonymous calls.
+
+        A shared github_client comes with the rate_limit scheduler of its transport.
+        env provides the workflow variables (GITHUB_SHA, GITHUB_WORKSPACE) and
+        defaults to the process environment. No request is sent here: the repository
+        and its tags are resolved on first use.
+        """
         self.token = token.strip()
         if not self.token:
             message = "GitHub token must be provided for API access."
             raise ValueError(message)
         self.config = config
-        self.github_client: GitHubClient = cast(
-            "GitHubClient", github_client or Github(self.token)
-        )
-        self.repo: GitRepository = self.github_client.get_repo(self.config.REPOSITORY)
+        self.env: Mapping[str, str] = os.environ if env is None else env
+        self.rate_limit = rate_limit
+        if github_client is None:
+            github_client, self.rate_limit = build_github_client(self.token, config)
+        self.github_client: GitHubClient = github_client
+        self._repo: GitRepository | None = None
+        self._rest_repo: GitRepository | None = None
+        self._listed_tag_refs: list[TagRef] | None = None
+        self._last_available_tag: Tag | None = None
+        self._last_available_major_tag: Tag | None = None
         self._last_commit_cache: Commit | None = None
-        self.last_available_tag: Tag = self.get_latest_tag()
-        self.last_available_major_tag: Tag = self.get_latest_major_tag()
+        self._commit_cache: dict[str, Commit] = {}
+        self._tag_index: TagIndex | None = None
+        self.tag_cache: TagCache | None = (
+            TagCache.for_repository(
+                self.config.CACHE_DIR,
+                self.config.REPOSITORY,
+                self.config.PREFIX,
+                self.config.SUFFIX,
+            )
+            if self.config.CACHE_DIR
+            else None
+        )
+
+    @property
+    def repo(self) -> GitRepository:
+        """Return the repository backend, resolving it on first access."""
+        if self._repo is None:
+            self._repo = self._resolve_repository()
+        return self._repo
+
+    @property
+    def last_available_tag(self) -> Tag:
+        """Return the latest semver tag, looked up on first access."""
+        if self._last_available_tag is None:
+            self._last_available_tag = self.get_latest_tag()
+        return self._last_available_tag
+
+    @property
+    def last_available_major_tag(self) -> Tag:
+        """Return the latest major-only tag, looked up on first access."""
+        if self._last_available_major_tag is None:
+            self._last_available_major_tag = self.get_latest_major_tag()
+        return self._last_available_major_tag
+
+    def _resolve_repository(self) -> GitRepository:
+        """Return the repository backend selected by the configuration."""
+        rest_repo = self.github_client.get_repo(self.config.REPOSITORY)
+        self._rest_repo = rest_repo
+        if isinstance(rest_repo, Repository) and self.config.PARALLEL_PAGES > 1:
+            rest_repo = ParallelPagesRepository(
+                rest_repo,
+                rest_repo.requester,
+                rest_repo.url,
+                self.config.PARALLEL_PAGES,
+            )
+        if self.config.BACKEND is RepositoryBackend.GRAPHQL:
+            return GraphQLRepository(
+                rest_repo,
+                cast("GraphQLClient", self.github_client).requester,
+                self.config.REPOSITORY,
+                head=self.env.get("GITHUB_SHA", "HEAD"),
+            )
+        if self.config.BACKEND is RepositoryBackend.LOCAL:
+            # Shallow or missing clones cannot answer history queries: use the API.
+            local_repo = LocalGitRepository.open(
+                rest_repo, self.env.get("GITHUB_WORKSPACE", ".")
+            )
+            if local_repo is not None:
+                return local_repo
+        return rest_repo
 
     def bump_tag_version(self, strategy: BumpStrategy, tag: Tag) -> Tag:
         """Create a new Tag resource with the increased version number."""
@@ -142,74 +383,302 @@ class GitHubHelper:
 
         new_tag.name = f"{self.config.PREFIX}{new_version}{self.config.SUFFIX}"
         last_commit = self.get_last_commit()
-        new_tag.commit = os.environ.get("GITHUB_SHA", last_commit.sha)
+        new_tag.commit = self.env.get("GITHUB_SHA", last_commit.sha)
         new_tag.message = last_commit.message
+        # The tag is cached under its new ref: keep the date of the tagged commit,
+        # which the date commit range of the next run starts from.
+        new_tag.date = last_commit.date
         return new_tag
 
-    def get_commits_since(self, since: datetime) -> list[Commit]:
-        """Get commits since a predefined datetime."""
+    def get_commits_since(self, since: datetime) -> Iterator[Commit]:
+        """Stream commits since a predefined datetime, requesting pages as they are consumed."""
         if since.tzinfo is None:
             since = since.replace(tzinfo=UTC)
         path_filter = self.config.commit_path_filter
+        for commit in self.repo.get_commits(
+            since=since + timedelta(seconds=1), path=path_filter
+        ):
+            yield self._to_commit_resource(commit)
+
+    def get_release_commits(self, last_tag: Tag) -> Iterable[Commit]:
+        """Get the commits released since the last tag, following the configured range mode."""
+        if self.config.COMMIT_RANGE is CommitRange.COMPARE:
+            head_sha = self.env.get("GITHUB_SHA") or self.get_last_commit().sha
+            return self.get_commits_between(last_tag.commit, head_sha)
+        return self.get_commits_since(last_tag.date)
+
+    def get_commits_between(self, base: str, head: str) -> list[Commit]:
+        """Get the commits reachable from head but not from base, newest first."""
+        comparison = self.repo.compare(base, head)
+        range_commits = [
+            self._to_commit_resource(commit) for commit in comparison.commits
+        ]
+        path_filter = self.config.commit_path_filter
+        if path_filter is None or not range_commits:
+            return range_commits[::-1]
+        if not _comparison_touches_path(comparison, path_filter):
+            return []
+        # Path filtering is not available on the compare endpoint: walk the path
+        # history from head and keep the commits of the range. History is listed
+        # children first, so the first commit outside the range (the base or one of
+        # its ancestors) ends the walk; author dates, which rebases and backdated
+        # commits skew, are never compared.
+        in_range = {commit.sha: commit for commit in range_commits}
+        selected: list[Commit] = []
+        for commit in self.repo.get_commits(sha=head, path=path_filter):
+            if commit.sha not in in_range:
+                break
+            selected.append(in_range[commit.sha])
+        return selected
+
+    def get_changed_files(self, shas: Sequence[str]) -> dict[str, list[str] | None]:
+        """Return the files changed by each commit; None when the list is incomplete.
+
+        The local clone answers in a single git call; through the API, one request is
+        sent per commit, concurrently when pages are fetched in parallel.
+        """
+        repo = self.repo
+        source = repo if isinstance(repo, ChangedFilesLister) else self._rest_repo
+        if isinstance(source, ChangedFilesLister):
+            return source.get_changed_files(shas)
+        rest_repo = cast("GitRepository", source)
+        return {
+            sha: [
+                file.filename
+                for file in cast(
+                    "GitCommitFilesPayload", rest_repo.get_commit(sha)
+                ).files
+            ]
+            for sha in shas
+        }
+
+    def for_component(
+        self, component: Component, tag_refs: list[TagRef] | None = None
+    ) -> GitHubHelper:
+        """Return a helper releasing a monorepo component under its own tag prefix.
+
+        The client, repository and commit metadata are shared; tag_refs, when given,
+        are the already listed tags the component's ones are picked from.
+        """
+        helper: GitHubHelper = copy.copy(self)
+        helper.config = replace(
+            self.config, PATH=component.path, PREFIX=component.prefix, COMPONENTS=""
+        )
+        helper._listed_tag_refs = tag_refs
+        helper._tag_index = None
+        helper._last_available_tag = None
+        helper._last_available_major_tag = None
+        helper.tag_cache = (
+            TagCache.for_repository(
+                self.config.CACHE_DIR,
+                self.config.REPOSITORY,
+                component.prefix,
+                self.config.SUFFIX,
+            )
+            if self.config.CACHE_DIR
+            else None
+        )
+        return helper
+
+    def get_component_releases(
+        self, components: Sequence[Component]
+    ) -> list[ComponentRelease]:
+        """Split a single tag and commit listing between monorepo components.
+
+        Tags are listed once for every prefix and commits once since the oldest
+        component tag, or, in compare mode, once per distinct component tag commit so
+        that each range has the same boundary as the main one. Each commit's changed
+        files are then read once and matched against every component path in memory.
+        API calls grow with the number of commits, not with commits times components.
+        """
+        # Tag prefixes are compared character by character, not as paths.
+        prefix = os.path.commonprefix(  # noqa: RUF071
+            [component.prefix for component in components]
+        )
+        tag_refs = list(self.list_tag_refs(prefix))
+        helpers = [self.for_component(component, tag_refs) for component in components]
+        last_tags = [helper.last_available_tag for helper in helpers]
+        released: dict[str, set[str]] | None = None
+        if self.config.COMMIT_RANGE is CommitRange.COMPARE:
+            head_sha = self.env.get("GITHUB_SHA") or self.get_last_commit().sha
+            ranges = {
+                sha: self.get_commits_between(sha, head_sha)
+                for sha in dict.fromkeys(tag.commit for tag in last_tags)
+            }
+            released = {
+                sha: {commit.sha for commit in commits}
+                for sha, commits in ranges.items()
+            }
+            commits = list(
+                {
+                    commit.sha: commit
+                    for range_commits in ranges.values()
+                    for commit in range_commits
+                }.values()
+            )
+        else:
+            oldest = min(last_tags, key=lambda tag: tag.date)
+            commits = list(self.get_release_commits(oldest))
+        changed_files = self.get_changed_files([commit.sha for commit in commits])
         return [
-            self._to_commit_resource(commit)
-            for commit in self.repo.get_commits(
-                since=since + timedelta(seconds=1), path=path_filter
+            ComponentRelease(
+                component=component,
+                helper=helper,
+                last_tag=last_tag,
+                commits=[
+                    commit
+                    for commit in commits
+                    if (
+                        _released_after(commit, last_tag)
+                        if released is None
+                        else commit.sha in released[last_tag.commit]
+                    )
+                    and component.is_touched_by(changed_files.get(commit.sha))
+                ],
+            )
+            for component, helper, last_tag in zip(
+                components, helpers, last_tags, strict=True
             )
         ]
 
     def get_last_commit(self) -> Commit:
-        """Get the latest commit available on the repository."""
+        """Get the latest commit: GITHUB_SHA when set, otherwise the head of the default branch or path."""
         if self._last_commit_cache is not None:
             return self._last_commit_cache
+        target_sha = self.env.get("GITHUB_SHA")
+        if target_sha:
+            try:
+                self._last_commit_cache = self._get_commit_resource(target_sha)
+            except (GithubException, ValueError):
+                self._last_commit_cache = self._get_head_commit()
+        else:
+            self._last_commit_cache = self._get_head_commit()
+        return self._last_commit_cache
+
+    def _get_head_commit(self) -> Commit:
+        """Resolve the newest commit without listing the whole history."""
         path_filter = self.config.commit_path_filter
-        default_commit_list = self.repo.get_commits(
-            since=datetime.fromtimestamp(0, tz=UTC), path=path_filter
+        if path_filter is None:
+            try:
+                return self._get_commit_resource(self.config.DEFAULT_BRANCH)
+            except (GithubException, ValueError):
+                pass
+        # Concurrent listings use full pages: read a one-commit page when supported;
+        # otherwise only the first page of the listing is ever requested.
+        repo = self.repo
+        latest = (
+            repo.get_head_commit(path_filter)
+            if isinstance(repo, HeadCommitReader)
+            else next(iter(repo.get_commits(path=path_filter)), None)
         )
-        if not default_commit_list:
+        if latest is None:
             message = "Unable to resolve last commit: repository returned no commits."
             raise RuntimeError(message)
-        fallback_sha = default_commit_list[0].sha
-        target_sha = os.environ.get("GITHUB_SHA", fallback_sha)
-        try:
-            commit = self.repo.get_commit(target_sha)
-        except (GithubException, ValueError):
-            commit = default_commit_list[0]
-        self._last_commit_cache = self._to_commit_resource(commit)
-        return self._last_commit_cache
+        return self._remember_commit(latest)
+
+    @property
+    def tag_index(self) -> TagIndex:
+        """Return the tag index, listing the repository tags only on first access."""
+        if self._tag_index is None:
+            self._tag_index = self._build_tag_index()
+        return self._tag_index
+
+    def list_tag_refs(self, prefix: str | None = None) -> Iterator[TagRef]:
+        """List tag names and SHAs, asking the server only for tags under the prefix when set.
+
+        The prefix defaults to the configured one.
+        """
+        if prefix is None:
+            prefix = self.config.PREFIX
+        if not prefix:
+            for tag in self.repo.get_tags():
+                # Only the name and the SHA are read: touching the commit data of a
+                # PyGitHub tag triggers one lazy request per tag.
+                yield TagRef(name=tag.name, sha=tag.commit.sha)
+            return
+        for ref in self.repo.get_git_matching_refs(f"tags/{prefix}"):
+            yield TagRef(
+                name=ref.ref.removeprefix("refs/tags/"),
+                sha=ref.object.sha,
+                object_type=ref.object.type,
+            )
+
+    def _build_tag_index(self) -> TagIndex:
+        """Sort matching tags into semver-full and major-only groups with one listing."""
+        index = TagIndex()
+        refs = (
+            self.list_tag_refs()
+            if self._listed_tag_refs is None
+            else self._listed_tag_refs
+        )
+        for ref in refs:
+            self._add_to_index(index, ref)
+        if self.tag_cache is not None:
+            self.tag_cache.prune(ref for _, ref in [*index.semver, *index.major])
+        return index
+
+    def _add_to_index(self, index: TagIndex, ref: TagRef) -> None:
+        """File a tag matching prefix and suffix under its semver or major-only group."""
+        name = ref.name
+        if not (
+            name.startswith(self.config.PREFIX) and name.endswith(self.config.SUFFIX)
+        ):
+            return
+        version_str = name.removeprefix(self.config.PREFIX).removesuffix(
+            self.config.SUFFIX
+        )
+        key = version_key(version_str)
+        if key is not None:
+            index.semver.append((key, ref))
+            return
+        major = _parse_major_version(version_str)
+        if major is not None:
+            index.major.append((major, ref))
+
+    def _index_written_tag(self, ref: TagRef) -> None:
+        """Record a tag written by this helper in the index, when built, instead of listing again."""
+        index = self._tag_index
+        if index is None:
+            return
+        index.semver = [entry for entry in index.semver if entry[1].name != ref.name]
+        index.major = [entry for entry in index.major if entry[1].name != ref.name]
+        self._add_to_index(index, ref)
+        self._last_available_tag = None
+        self._last_available_major_tag = None
+
+    def knows_tag(self, name: str, sha: str) -> bool:
+        """Tell whether the tag index is built and already has name pointing to sha."""
+        if self._tag_index is None:
+            return False
+        ref = self._listed_ref(name)
+        return ref is not None and ref.sha == sha
+
+    def forget_tags(self) -> None:
+        """Drop the tag index and the latest tags, listed again on next access."""
+        self._tag_index = None
+        self._last_available_tag = None
+        self._last_available_major_tag = None
+
+    def record_push(self, commits: Iterable[Commit]) -> None:
+        """Keep the metadata of pushed commits and forget the previous head commit.
+
+        A long-lived helper then resolves the new head and its tagger without requests.
+        """
+        for commit in commits:
+            self._commit_cache[commit.sha] = commit
+        self._last_commit_cache = None
 
     def get_latest_tag(self) -> Tag:
         """Get the latest semver tag matching prefix and suffix on the repository (e.g. v0.2.1)."""
-        matching_tags: list[tuple[Version, Tag]] = []
-        for tag in self.repo.get_tags():
-            name = tag.name
-            if not name.startswith(self.config.PREFIX) or not name.endswith(
-                self.config.SUFFIX
-            ):
-                continue
-            version_str = name.removeprefix(self.config.PREFIX).removesuffix(
-                self.config.SUFFIX
-            )
-            if not VersionInfo.is_valid(version_str):
-                continue
-            version = Version.parse(version_str)
-            matching_tags.append(
-                (
-                    version,
-                    Tag(
-                        name=name,
-                        commit=tag.commit.sha,
-                        message=tag.commit.commit.message,
-                        date=tag.commit.commit.author.date,
-                    ),
-                )
-            )
-
-        if matching_tags:
-            _, latest_tag = max(
-                matching_tags, key=lambda candidate: (candidate[0], candidate[1].date)
-            )
-            return latest_tag
+        semver_tags = self.tag_index.semver
+        if semver_tags:
+            latest_key = max(key for key, _ in semver_tags)
+            # Commit metadata is fetched only for the winner, or for the tags sharing
+            # its exact version (e.g. differing build metadata) to break ties by date.
+            candidates = [
+                self._resolve_tag(ref) for key, ref in semver_tags if key == latest_key
+            ]
+            return max(candidates, key=lambda candidate: candidate.date)
 
         last_commit = self.get_last_commit()
         default_tag = Tag(
@@ -224,37 +693,10 @@ class GitHubHelper:
 
     def get_latest_major_tag(self) -> Tag:
         """Get the latest major-only tag matching prefix and suffix on the repository (e.g. v1)."""
-        valid_tags: list[tuple[int, Tag]] = []
-        for tag in self.repo.get_tags():
-            name = tag.name
-            if not (
-                name.startswith(self.config.PREFIX)
-                and name.endswith(self.config.SUFFIX)
-            ):
-                continue
-            version_str = name.removeprefix(self.config.PREFIX).removesuffix(
-                self.config.SUFFIX
-            )
-            if VersionInfo.is_valid(version_str):
-                continue
-            major = _parse_major_version(version_str)
-            if major is None:
-                continue
-            valid_tags.append(
-                (
-                    major,
-                    Tag(
-                        name=name,
-                        commit=tag.commit.sha,
-                        message=tag.commit.commit.message,
-                        date=tag.commit.commit.author.date,
-                    ),
-                )
-            )
-
-        if valid_tags:
-            _, latest_tag = max(valid_tags, key=lambda value: value[0])
-            return latest_tag
+        major_tags = self.tag_index.major
+        if major_tags:
+            _, latest_ref = max(major_tags, key=lambda value: value[0])
+            return self._resolve_tag(latest_ref)
 
         last_commit = self.get_last_commit()
         default_tag_name = f"{self.config.PREFIX}0{self.config.SUFFIX}"
@@ -269,20 +711,109 @@ class GitHubHelper:
         return initial_tag
 
     def create_git_tag(self, tag: Tag) -> None:
-        """Create a new tag on the repository bound to a specific commit."""
-        commit = self.repo.get_commit(tag.commit)
-        author = commit.author or commit.commit.author
-        author_name = getattr(author, "name", "automation")
-        author_email = getattr(author, "email", "automation@users.noreply.github.com")
-        tagger = InputGitAuthor(
-            name=str(author_name),
-            email=str(author_email),
-            date=str(datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")),
-        )
+        """Create a new tag on the repository bound to a specific commit (no-op in dry-run)."""
+        self.write_tags(created=[tag])
 
+    def move_git_tag(self, tag: Tag) -> None:
+        """Point an existing tag to a new commit with a forced ref update (no-op in dry-run).
+
+        The tag never disappears, unlike a delete followed by a create; it is created
+        when the reference does not exist yet.
+        """
+        self.write_tags(moved=[tag])
+
+    def write_tags(
+        self, created: Sequence[Tag] = (), moved: Sequence[Tag] = ()
+    ) -> None:
+        """Create and move tags with concurrent API calls (no-op in dry-run).
+
+        Tag objects and refs do not depend on each other, so every call is submitted at
+        once. When one fails, the refs already written are restored before raising.
+        """
         if self.config.DRY_RUN:
             return
+        writes = [(tag, False) for tag in created] + [(tag, True) for tag in moved]
+        if not writes:
+            return
+        taggers = {
+            sha: self._build_tagger(sha)
+            for sha in dict.fromkeys(tag.commit for tag, _ in writes)
+        }
+        with ThreadPoolExecutor(max_workers=2 * len(writes)) as pool:
+            objects = [
+                pool.submit(self._create_tag_object, tag, taggers[tag.commit])
+                for tag, _ in writes
+            ]
+            refs = {
+                pool.submit(self._write_ref, tag, move=move): (tag, move)
+                for tag, move in writes
+            }
+        errors = [
+            error
+            for future in [*objects, *refs]
+            if (error := future.exception()) is not None
+        ]
+        if errors:
+            written = [refs[future] for future in refs if future.exception() is None]
+            self._rollback_refs(written, errors[0])
+            raise errors[0]
+        for tag, _ in writes:
+            ref = TagRef(name=tag.name, sha=tag.commit)
+            self._cache_tag(ref, tag)
+            self._index_written_tag(ref)
+
+    def _write_ref(self, tag: Tag, *, move: bool) -> None:
+        """Create the tag ref, or force-update it when moving, creating it if missing."""
+        if move:
+            try:
+                self.repo.get_git_ref(f"tags/{tag.name}").edit(tag.commit, force=True)
+            except GithubException as error:
+                if error.status not in _MISSING_REF_STATUSES:
+                    raise
+            else:
+                return
+        self.repo.create_git_ref(f"refs/tags/{tag.name}", tag.commit)
+
+    def _rollback_refs(
+        self, written: Sequence[tuple[Tag, bool]], error: BaseException
+    ) -> None:
+        """Restore moved refs to their listed target and delete created ones."""
+        for tag, move in written:
+            previous = self._listed_ref(tag.name) if move else None
+            try:
+                ref = self.repo.get_git_ref(f"tags/{tag.name}")
+                if previous is None:
+                    ref.delete()
+                else:
+                    ref.edit(previous.sha, force=True)
+            except GithubException as rollback_error:
+                error.add_note(f"Rolling back tag {tag.name} failed: {rollback_error}")
+
+    def _listed_ref(self, name: str) -> TagRef | None:
+        """Return the ref listed for a tag name when the index was built."""
+        for _, ref in [*self.tag_index.semver, *self.tag_index.major]:
+            if ref.name == name:
+                return ref
+        return None
+
+    def _build_tagger(self, commit_sha: str) -> InputGitAuthor:
+        """Return the configured tagger, or the author of the tagged commit.
+
+        The commit metadata comes from the per-run cache, so a commit already read
+        (e.g. the last commit) costs no request.
+        """
+        name, email = self.config.TAGGER_NAME, self.config.TAGGER_EMAIL
+        if not name:
+            commit = self._get_commit_resource(commit_sha)
+            name, email = commit.author_name, commit.author_email
+        return InputGitAuthor(
+            name=name or _DEFAULT_TAGGER_NAME,
+            email=email or _DEFAULT_TAGGER_EMAIL,
+            date=datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
 
+    def _create_tag_object(self, tag: Tag, tagger: InputGitAuthor) -> None:
+        """Create the annotated tag object carrying the tag message."""
         self.repo.create_git_tag(
             tag=tag.name,
             message=tag.message,
@@ -290,7 +821,6 @@ class GitHubHelper:
             type="commit",
             tagger=tagger,
         )
-        self.repo.create_git_ref(f"refs/tags/{tag.name}", tag.commit)
 
     def delete_git_tag(self, tag_name: str) -> None:
         """Delete a tag on the repository (no-op in dry-run)."""
@@ -299,6 +829,42 @@ class GitHubHelper:
         ref = self.repo.get_git_ref(f"tags/{tag_name}")
         ref.delete()
 
+    def _get_commit_resource(self, sha: str) -> Commit:
+        """Fetch a commit by SHA (or ref name) once and keep its metadata for the rest of the run."""
+        if sha in self._commit_cache:
+            return self._commit_cache[sha]
+        return self._remember_commit(self.repo.get_commit(sha))
+
+    def _remember_commit(self, payload: GitCommitPayload) -> Commit:
+        """Convert a commit payload and keep it for later lookups by SHA."""
+        commit = self._to_commit_resource(payload)
+        self._commit_cache[commit.sha] = commit
+        return commit
+
+    def _resolve_tag(self, ref: TagRef) -> Tag:
+        """Build a Tag resource, fetching the commit metadata of the referenced SHA."""
+        if self.tag_cache is not None:
+            cached = self.tag_cache.lookup(ref)
+            if cached is not None:
+                return cached
+        commit_sha = ref.sha
+        if ref.object_type == "tag":
+            # Annotated tags listed through refs point to the tag object: peel it.
+            commit_sha = self.repo.get_git_tag(ref.sha).object.sha
+        commit = self._get_commit_resource(commit_sha)
+        tag = Tag(
+            name=ref.name, commit=commit_sha, message=commit.message, date=commit.date
+        )
+        self._cache_tag(ref, tag)
+        return tag
+
+    def _cache_tag(self, ref: TagRef, tag: Tag) -> None:
+        """Persist a resolved tag in the on-disk cache, when enabled."""
+        if self.tag_cache is None:
+            return
+        self.tag_cache.store(ref, tag)
+        self.tag_cache.save()
+
     @staticmethod
     def _to_commit_resource(commit: GitCommitPayload) -> Commit:
         """Convert a PyGitHub commit payload to a typed Commit resource."""
@@ -5,9 +5,20 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
-__all__ = ["BumpStrategy", "Commit", "Tag"]
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = [
+    "BumpStrategy",
+    "Commit",
+    "CommitBatch",
+    "CommitRange",
+    "RepositoryBackend",
+    "Tag",
+    "TagRef",
+]
 
 _DEFAULT_TAG_TYPE: Final[str] = "commit"
 _DEFAULT_BUMP_STRATEGY: Final[str] = "skip"
@@ -22,7 +33,22 @@ class BumpStrategy(StrEnum):
     SKIP = _DEFAULT_BUMP_STRATEGY
 
 
-@dataclass
+class RepositoryBackend(StrEnum):
+    """Enum containing the APIs the repository data can be read from."""
+
+    REST = "rest"
+    GRAPHQL = "graphql"
+    LOCAL = "local"
+
+
+class CommitRange(StrEnum):
+    """Enum containing the ways the commits released since the last tag are selected."""
+
+    DATE = "date"
+    COMPARE = "compare"
+
+
+@dataclass(frozen=True, slots=True)
 class Commit:
     """Commit resource."""
 
@@ -38,12 +64,46 @@ def now_utc() -> datetime:
     return datetime.now(UTC)
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
-    """Tag resource."""
+    """Tag resource; mutable as the major tag is rebound to new commits."""
 
     name: str
     commit: str
     message: str = ""
     type: str = _DEFAULT_TAG_TYPE
     date: datetime = field(default_factory=now_utc)
+
+
+@dataclass(frozen=True, slots=True)
+class TagRef:
+    """Bare tag reference: the tag name and the SHA it points to, without commit metadata."""
+
+    name: str
+    sha: str
+    object_type: str = _DEFAULT_TAG_TYPE
+
+
+@dataclass(slots=True)
+class CommitBatch:
+    """Columnar list of commits keeping only the SHAs and the messages read by the classifier."""
+
+    shas: list[str] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_commits(cls, commits: Iterable[Commit]) -> CommitBatch:
+        """Collect commits, dropping the fields the classifier does not read."""
+        batch = cls()
+        for commit in commits:
+            batch.append(commit)
+        return batch
+
+    def append(self, commit: Commit) -> None:
+        """Add a commit at the end of the batch."""
+        self.shas.append(commit.sha)
+        self.messages.append(commit.message)
+
+    def __len__(self) -> int:
+        """Return the number of commits in the batch."""
+        return len(self.shas)
@@ -0,0 +1,152 @@
+"""Size-bounded on-disk store of GitHub responses for conditional requests."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_ENTRY_SUFFIX: Final[str] = ".json"
+_ENTRY_FORMAT_VERSION: Final[int] = 1
+DEFAULT_MAX_BYTES: Final[int] = 50 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Validators, headers and body of a cached response."""
+
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: str
+
+    def validators(self) -> dict[str, str]:
+        """Return the headers turning a request into a conditional one."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _parse_entry(payload: object) -> CacheEntry | None:
+    """Return the entry stored in payload, or None when written by another format."""
+    if not (
+        isinstance(payload, dict)
+        and payload.get("version") == _ENTRY_FORMAT_VERSION
+        and all(
+            isinstance(payload.get(name), str | None)
+            for name in ("etag", "last_modified")
+        )
+        and isinstance(payload.get("body"), str)
+        and isinstance(headers := payload.get("headers"), dict)
+        and all(
+            isinstance(name, str) and isinstance(value, str)
+            for name, value in headers.items()
+        )
+    ):
+        return None
+    return CacheEntry(
+        etag=payload["etag"],
+        last_modified=payload["last_modified"],
+        headers=headers,
+        body=payload["body"],
+    )
+
+
+class ResponseCache:
+    """Responses keyed by URL, evicted least-recently-used beyond max_bytes.
+
+    Every entry is a file named after the URL hash whose modification time is its
+    last use: hits touch the file, so recency carries over to later runs and no
+    index can go stale.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Scan the cache directory; entries are loaded lazily on lookup."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, int]] = {}
+        if directory.is_dir():
+            for path in directory.glob(f"*{_ENTRY_SUFFIX}"):
+                stat = path.stat()
+                self._entries[path.name] = (stat.st_mtime, stat.st_size)
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes held on disk."""
+        return sum(size for _, size in self._entries.values())
+
+    @staticmethod
+    def _filename(url: str) -> str:
+        """Return the entry filename for a URL."""
+        return f"{hashlib.sha256(url.encode()).hexdigest()}{_ENTRY_SUFFIX}"
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the entry cached for url and mark it as recently used.
+
+        An unreadable entry, or one written by another format, is a miss and is removed.
+        """
+        filename = self._filename(url)
+        with self._lock:
+            if filename not in self._entries:
+                return None
+            path = self.directory / filename
+            try:
+                entry = _parse_entry(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                entry = None
+            if entry is None:
+                # Unreadable or from another format: a miss, replaced on next store.
+                path.unlink(missing_ok=True)
+                del self._entries[filename]
+                return None
+            now = time.time()
+            with contextlib.suppress(OSError):
+                os.utime(path, (now, now))
+            self._entries[filename] = (now, self._entries[filename][1])
+        return entry
+
+    def record_hit(self) -> None:
+        """Count a response served from the cache after a 304 validation."""
+        with self._lock:
+            self.hits += 1
+
+    def put(self, url: str, entry: CacheEntry) -> None:
+        """Store the entry for url, evicting the least recently used ones if needed."""
+        data = json.dumps(
+            {"version": _ENTRY_FORMAT_VERSION, **asdict(entry)}, separators=(",", ":")
+        )
+        filename = self._filename(url)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary = self.directory / f"{filename}.tmp"
+            temporary.write_text(data, encoding="utf-8")
+            temporary.replace(self.directory / filename)
+            self._entries[filename] = (time.time(), len(data.encode()))
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        total = sum(size for _, size in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for filename, (_, size) in sorted(
+            self._entries.items(), key=lambda item: item[1][0]
+        ):
+            (self.directory / filename).unlink(missing_ok=True)
+            del self._entries[filename]
+            total -= size
+            if total <= self.max_bytes:
+                return
@@ -4,26 +4,46 @@ from __future__ import annotations
 
 import logging
 import os
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
-from semver import Version
-
 from configuration import Configuration, ConfigurationError
-from github_helpers import GitHubHelper
 from github_resources import BumpStrategy
 
+# PyGitHub and semver are imported only once a run is certain to need them: a run
+# skipped because of its branch or of missing credentials never pays for them.
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
+
+    from github_helpers import GitHubHelper
+    from github_resources import Commit, Tag
 
 
-def _configure_logging(env: Mapping[str, str]) -> logging.Logger:
+def _configure_logging(
+    env: Mapping[str, str], log_format: str = "%(levelname)s: %(message)s"
+) -> logging.Logger:
     """Configure a simple, consistent logger for action output."""
     level_name = env.get("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
+    logging.basicConfig(level=level, format=log_format)
     return logging.getLogger("auto_tagger")
 
 
+def _runs_on_default_branch(
+    config: Configuration, env: Mapping[str, str], logger: logging.Logger
+) -> bool:
+    """Tell whether the workflow runs on the default branch, logging when it does not."""
+    ref_name = env.get("GITHUB_REF_NAME")
+    if ref_name and ref_name != config.DEFAULT_BRANCH:
+        logger.info(
+            "Not running from the default branch (%s != %s).",
+            ref_name,
+            config.DEFAULT_BRANCH,
+        )
+        return False
+    return True
+
+
 def run(
     config: Configuration,
     github: GitHubHelper,
@@ -34,54 +54,109 @@ def run(
     if config.DRY_RUN:
         logger.info("Running in dry-run mode.")
 
-    ref_name = env.get("GITHUB_REF_NAME")
-    if ref_name and ref_name != config.DEFAULT_BRANCH:
-        logger.info(
-            "Not running from the default branch (%s != %s).",
-            ref_name,
-            config.DEFAULT_BRANCH,
-        )
+    if not _runs_on_default_branch(config, env, logger):
+        return 0
+
+    if config.components:
+        # One tag and commit listing shared by every component.
+        for release in github.get_component_releases(config.components):
+            logger.info(
+                "Component %s: last available tag: %s",
+                release.component.path,
+                release.last_tag.name,
+            )
+            tag_release(
+                release.helper.config,
+                release.helper,
+                release.last_tag,
+                release.commits,
+                env=env,
+                logger=logger,
+            )
         return 0
 
     last_tag = github.last_available_tag
     logger.info("Last available tag: %s", last_tag.name)
+    tag_release(
+        config,
+        github,
+        last_tag,
+        github.get_release_commits(last_tag),
+        env=env,
+        logger=logger,
+    )
+    return 0
+
 
-    commits = github.get_commits_since(last_tag.date)
+def tag_release(
+    config: Configuration,
+    github: GitHubHelper,
+    last_tag: Tag,
+    commits: Iterable[Commit],
+    *,
+    env: Mapping[str, str],
+    logger: logging.Logger,
+) -> Tag | None:
+    """Tag the release selected by the commits since last_tag, with its major tag when bound.
+
+    Return the new tag, or None when the commits skip the release.
+    """
     bump_strategy = config.get_bump_strategy_from_commits(commits)
 
     if bump_strategy is BumpStrategy.SKIP:
         logger.info("No need to create a new tag, skipping.")
-        return 0
+        return None
 
     new_tag = github.bump_tag_version(bump_strategy, last_tag)
     logger.info("Creating new tag version: %s", new_tag.name)
-    github.create_git_tag(new_tag)
+    if not config.BIND_TO_MAJOR:
+        github.create_git_tag(new_tag)
+        return new_tag
+
+    last_commit = github.get_last_commit()
+    # A copy, so the cached major tag still describes the ref as it is until written.
+    last_major_tag = replace(
+        github.last_available_major_tag,
+        commit=env.get("GITHUB_SHA", last_commit.sha),
+        message=last_commit.message,
+        date=last_commit.date,
+    )
+
+    # Both tags are written together and rolled back together.
+    if bump_strategy is not BumpStrategy.MAJOR:
+        logger.info(
+            "Binding major tag %s to latest commit: %s",
+            last_major_tag.name,
+            last_major_tag.commit,
+        )
+        github.write_tags(created=[new_tag], moved=[last_major_tag])
+        return new_tag
 
-    if config.BIND_TO_MAJOR:
-        last_commit = github.get_last_commit()
-        last_major_tag = github.last_available_major_tag
-        last_major_tag.commit = env.get("GITHUB_SHA", last_commit.sha)
-        last_major_tag.message = last_commit.message
+    from semver import Version  # noqa: PLC0415
 
-        if bump_strategy is not BumpStrategy.MAJOR:
-            github.delete_git_tag(last_major_tag.name)
-            logger.info(
-                "Binding major tag %s to latest commit: %s",
-                last_major_tag.name,
-                last_major_tag.commit,
-            )
-            github.create_git_tag(last_major_tag)
-            return 0
+    version_str = new_tag.name.removeprefix(config.PREFIX).removesuffix(config.SUFFIX)
+    major_version = Version.parse(version_str).major
+    last_major_tag.name = f"{config.PREFIX}{major_version}{config.SUFFIX}"
+    logger.info("Creating new major tag %s", last_major_tag.name)
+    github.write_tags(created=[new_tag, last_major_tag])
+    return new_tag
 
-        version_str = new_tag.name.removeprefix(config.PREFIX).removesuffix(
-            config.SUFFIX
-        )
-        major_version = Version.parse(version_str).major
-        last_major_tag.name = f"{config.PREFIX}{major_version}{config.SUFFIX}"
-        logger.info("Creating new major tag %s", last_major_tag.name)
-        github.create_git_tag(last_major_tag)
 
-    return 0
+def _log_rate_limit(github: GitHubHelper, logger: logging.Logger) -> None:
+    """Log the API budget left, the requests retried and the connections reused."""
+    from transport import transport_stats  # noqa: PLC0415
+
+    stats = transport_stats()
+    if stats.requests:
+        logger.info("GitHub API transport: %s.", stats)
+    scheduler = github.rate_limit
+    if scheduler is None or scheduler.budget is None:
+        return
+    logger.info(
+        "GitHub API rate limit: %s (%d request(s) retried).",
+        scheduler.budget,
+        scheduler.retries,
+    )
 
 
 def run_from_env(env: Mapping[str, str] | None = None) -> int:
@@ -103,8 +178,13 @@ def run_from_env(env: Mapping[str, str] | None = None) -> int:
         )
         return 1
 
+    if not _runs_on_default_branch(config, environment, logger):
+        return 0
+
+    from github_helpers import GitHubHelper  # noqa: PLC0415
+
     try:
-        github = GitHubHelper(token, config)
+        github = GitHubHelper(token, config, env=environment)
     except Exception:
         logger.exception("Failed to initialise GitHub helper.")
         return 1
@@ -114,10 +194,23 @@ def run_from_env(env: Mapping[str, str] | None = None) -> int:
     except Exception:
         logger.exception("Auto-tagger failed.")
         return 1
+    finally:
+        _log_rate_limit(github, logger)
 
 
 def main() -> int:
-    """CLI entrypoint for the GitHub Action container."""
+    """CLI entrypoint for the GitHub Action container.
+
+    FLEET_FILE switches to a fleet sweep, SERVICE_PORT to the webhook service.
+    """
+    if os.environ.get("SERVICE_PORT"):
+        from service import run_service_from_env  # noqa: PLC0415
+
+        return run_service_from_env()
+    if os.environ.get("FLEET_FILE"):
+        from fleet import run_fleet_from_env  # noqa: PLC0415
+
+        return run_fleet_from_env()
     return run_from_env()
 
 
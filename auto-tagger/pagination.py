@@ -0,0 +1,217 @@
+"""Concurrent pagination of GitHub REST listings."""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from github.Commit import Commit
+from github.GitRef import GitRef
+from github.Tag import Tag
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from datetime import datetime
+
+    from github import InputGitAuthor
+    from github.Requester import Requester
+
+    from github_helpers import (
+        GitAnnotatedTagPayload,
+        GitCommitPayload,
+        GitComparison,
+        GitReference,
+        GitRepository,
+    )
+
+    # PyGitHub object classes are built from (requester, headers, attributes).
+    ContentClass = Callable[[Requester, dict[str, Any], dict[str, Any]], Any]
+
+MAX_PAGE_SIZE: Final[int] = 100
+# The commit endpoint lists at most this many changed files.
+_COMMIT_FILES_LIMIT: Final[int] = 300
+_LAST_PAGE_LINK = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+
+def _last_page(headers: dict[str, Any]) -> int:
+    """Return the number of the last page advertised by the Link header."""
+    match = _LAST_PAGE_LINK.search(str(headers.get("link", "")))
+    if match is None:
+        return 1
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(match.group(1)).query)
+    return int(query.get("page", ["1"])[0])
+
+
+class ParallelPages:
+    """Listing that reads the page count from the first page and fetches the rest concurrently.
+
+    Items are yielded in page order. Nothing beyond the first page is requested until
+    the consumer iterates past it, and pending pages are cancelled when it stops early.
+    """
+
+    def __init__(
+        self,
+        requester: Requester,
+        content_class: ContentClass,
+        url: str,
+        parameters: dict[str, Any],
+        max_workers: int,
+    ) -> None:
+        """Describe the listing; no request is sent before iteration."""
+        self.requester = requester
+        self.content_class = content_class
+        self.url = url
+        self.parameters = {**parameters, "per_page": MAX_PAGE_SIZE}
+        self.max_workers = max_workers
+
+    def _fetch(self, page: int) -> tuple[list[Any], int]:
+        """Fetch one page and return its items with the last page number."""
+        headers, data = self.requester.requestJsonAndCheck(
+            "GET", self.url, parameters={**self.parameters, "page": page}
+        )
+        items = [self.content_class(self.requester, headers, item) for item in data]
+        return items, _last_page(headers)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield every item of the listing in order."""
+        items, last_page = self._fetch(1)
+        yield from items
+        if last_page <= 1:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(self._fetch, page) for page in range(2, last_page + 1)
+            ]
+            try:
+                for future in futures:
+                    yield from future.result()[0]
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+class ParallelPagesRepository:
+    """REST repository whose tag, ref and commit listings are fetched concurrently.
+
+    Single-object reads and writes are delegated to the PyGitHub repository.
+    """
+
+    def __init__(
+        self, repo: GitRepository, requester: Requester, url: str, max_workers: int
+    ) -> None:
+        """Wrap the PyGitHub repository at url; max_workers bounds the concurrent page requests."""
+        self.repo = repo
+        self.requester = requester
+        self.url = url
+        self.max_workers = max_workers
+
+    def _pages(
+        self,
+        content_class: ContentClass,
+        path: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> ParallelPages:
+        """Return a concurrent listing of a repository sub-resource."""
+        return ParallelPages(
+            self.requester,
+            content_class,
+            f"{self.url}/{path}",
+            parameters or {},
+            self.max_workers,
+        )
+
+    def get_commits(
+        self,
+        *,
+        since: datetime | None = None,
+        sha: str | None = None,
+        path: str | None = None,
+    ) -> ParallelPages:
+        """Return commits reachable from sha after a timestamp for an optional path."""
+        parameters: dict[str, Any] = {}
+        if since is not None:
+            parameters["since"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if sha is not None:
+            parameters["sha"] = sha
+        if path is not None:
+            parameters["path"] = path
+        return self._pages(Commit, "commits", parameters)
+
+    def get_head_commit(self, path: str | None = None) -> GitCommitPayload | None:
+        """Return the newest commit of the default branch touching path, from a one-item page."""
+        parameters: dict[str, Any] = {"per_page": 1}
+        if path is not None:
+            parameters["path"] = path
+        headers, data = self.requester.requestJsonAndCheck(
+            "GET", f"{self.url}/commits", parameters=parameters
+        )
+        if not data:
+            return None
+        return cast("GitCommitPayload", Commit(self.requester, headers, data[0]))
+
+    def get_tags(self) -> ParallelPages:
+        """Return all tags on the repository."""
+        return self._pages(Tag, "tags")
+
+    def get_git_matching_refs(self, ref: str) -> ParallelPages:
+        """Return the references starting with the given name (e.g. tags/v)."""
+        return self._pages(
+            GitRef, f"git/matching-refs/{urllib.parse.quote(ref, safe='')}"
+        )
+
+    def get_commit(self, sha: str) -> GitCommitPayload:
+        """Fetch a commit by SHA or ref name."""
+        return self.repo.get_commit(sha)
+
+    def get_changed_files(self, shas: Sequence[str]) -> dict[str, list[str] | None]:
+        """Return the files changed by each commit, fetching the commits concurrently.
+
+        None marks a commit whose file list is truncated by the API.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(shas, pool.map(self._changed_files, shas), strict=True))
+
+    def _changed_files(self, sha: str) -> list[str] | None:
+        """Return the files changed by a commit, renamed ones under both names."""
+        _, data = self.requester.requestJsonAndCheck("GET", f"{self.url}/commits/{sha}")
+        files: list[dict[str, Any]] = data.get("files", [])
+        if len(files) >= _COMMIT_FILES_LIMIT:
+            return None
+        return [
+            name
+            for file in files
+            for name in (file["filename"], file.get("previous_filename"))
+            if name
+        ]
+
+    def compare(self, base: str, head: str) -> GitComparison:
+        """Compare two commits."""
+        return self.repo.compare(base, head)
+
+    def get_git_tag(self, sha: str) -> GitAnnotatedTagPayload:
+        """Fetch an annotated tag object by SHA."""
+        return self.repo.get_git_tag(sha)
+
+    def create_git_tag(
+        self,
+        *,
+        tag: str,
+        message: str,
+        object: str,  # noqa: A002
+        type: str,  # noqa: A002
+        tagger: InputGitAuthor,
+    ) -> None:
+        """Create a new annotated tag."""
+        self.repo.create_git_tag(
+            tag=tag, message=message, object=object, type=type, tagger=tagger
+        )
+
+    def create_git_ref(self, ref: str, sha: str) -> None:
+        """Create a reference pointing to a specific SHA."""
+        self.repo.create_git_ref(ref, sha)
+
+    def get_git_ref(self, ref: str) -> GitReference:
+        """Return a mutable reference object."""
+        return self.repo.get_git_ref(ref)
@@ -0,0 +1,204 @@
+"""Scheduling of GitHub API requests against the primary and secondary rate limits."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+DEFAULT_MAX_RETRIES: Final[int] = 5
+DEFAULT_MAX_WAIT: Final[float] = 600.0
+# Below this many remaining requests, the rest of the budget is spread until the reset.
+DEFAULT_LOW_BUDGET: Final[int] = 100
+_BASE_DELAY: Final[float] = 1.0
+_MAX_BACKOFF: Final[float] = 60.0
+# GitHub asks for at least one second between writes once secondary limits trigger.
+_WRITE_INTERVAL: Final[float] = 1.0
+_RATE_LIMITED_STATUSES: Final[frozenset[int]] = frozenset({403, 429})
+_TRANSIENT_STATUSES: Final[frozenset[int]] = frozenset({500, 502, 503, 504})
+_READ_VERBS: Final[frozenset[str]] = frozenset({"GET", "HEAD"})
+# GraphQL queries are sent with POST; the helper never sends mutations.
+_GRAPHQL_PATH: Final[str] = "/graphql"
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitBudget:
+    """Primary rate limit budget reported by the last response."""
+
+    remaining: int
+    limit: int
+    reset: datetime
+
+    def __str__(self) -> str:
+        """Describe the budget for the action log."""
+        return f"{self.remaining}/{self.limit} requests left, reset at {self.reset:%H:%M:%S} UTC"
+
+
+def is_read(verb: str, url: str = "") -> bool:
+    """Tell whether a request only reads: GET, HEAD or a GraphQL query."""
+    return verb in _READ_VERBS or url.partition("?")[0].endswith(_GRAPHQL_PATH)
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    """Return a header value whatever the case of its name."""
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
+class RateLimitScheduler:
+    """Shared by every connection: spaces requests out and decides when to retry.
+
+    The X-RateLimit-* headers of each response keep the budget up to date. When it runs
+    low, requests are spread until the reset instead of exhausting it in a burst.
+    Rate-limited responses are retried after Retry-After or the reset, and transient
+    server errors on reads and connection failures after a jittered exponential
+    backoff.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        low_budget: int = DEFAULT_LOW_BUDGET,
+        *,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        """Configure the retry bounds; clock, sleep and jitter are replaceable for tests."""
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.low_budget = low_budget
+        self.clock = clock
+        self.sleep = sleep
+        self.jitter = jitter
+        self.retries = 0
+        self._lock = threading.Lock()
+        self._budget: RateLimitBudget | None = None
+        self._next_request = 0.0
+        self._next_write = 0.0
+        self._space_writes = False
+
+    @property
+    def budget(self) -> RateLimitBudget | None:
+        """Return the budget reported by the last response, if any."""
+        return self._budget
+
+    def before_request(self, verb: str, url: str = "") -> None:
+        """Wait for the slot of the next request when the budget or the writes must be paced."""
+        with self._lock:
+            now = self.clock()
+            start = now
+            interval = self._request_interval(now)
+            if interval > 0:
+                start = max(start, self._next_request)
+                self._next_request = start + interval
+            if self._space_writes and not is_read(verb, url):
+                start = max(start, self._next_write)
+                self._next_write = start + _WRITE_INTERVAL
+        if start > now:
+            self.sleep(start - now)
+
+    def _request_interval(self, now: float) -> float:
+        """Return the spacing that makes the remaining budget last until the reset."""
+        budget = self._budget
+        if budget is None or budget.remaining > self.low_budget:
+            return 0.0
+        window = budget.reset.timestamp() - now
+        if window <= 0:
+            return 0.0
+        return min(window / max(budget.remaining, 1), self.max_wait)
+
+    def retry_delay(
+        self,
+        verb: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: str,
+        attempt: int,
+        *,
+        url: str = "",
+    ) -> float | None:
+        """Record the budget of a response and return how long to wait before retrying it.
+
+        None means the response is final: successful, not retryable, or retrying would
+        exceed max_retries or max_wait.
+        """
+        self._record_budget(headers)
+        delay = self._rate_limit_delay(status, headers, body, attempt)
+        if delay is None and status in _TRANSIENT_STATUSES and is_read(verb, url):
+            delay = self._backoff(attempt)
+        return self._accept_retry(delay, attempt)
+
+    def error_delay(
+        self, verb: str, attempt: int, *, url: str = "", maybe_sent: bool
+    ) -> float | None:
+        """Return how long to wait before retrying a request that failed without a response.
+
+        A write is retried only when it certainly never reached the server, e.g. its
+        connection could not be opened; maybe_sent writes (e.g. read timeouts) are final.
+        """
+        if maybe_sent and not is_read(verb, url):
+            return None
+        return self._accept_retry(self._backoff(attempt), attempt)
+
+    def _accept_retry(self, delay: float | None, attempt: int) -> float | None:
+        """Count and return delay unless it exceeds max_retries or max_wait."""
+        if delay is None or attempt >= self.max_retries or delay > self.max_wait:
+            return None
+        with self._lock:
+            self.retries += 1
+        return delay
+
+    def _rate_limit_delay(
+        self, status: int, headers: Mapping[str, str], body: str, attempt: int
+    ) -> float | None:
+        """Return the wait imposed by a primary or secondary rate limit response."""
+        if status not in _RATE_LIMITED_STATUSES:
+            return None
+        retry_after = _header(headers, "Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            self._space_writes = True
+            return int(retry_after) + self.jitter() * _BASE_DELAY
+        if (
+            _header(headers, "X-RateLimit-Remaining") == "0"
+            and self._budget is not None
+        ):
+            return (
+                max(self._budget.reset.timestamp() - self.clock(), 0.0) + self.jitter()
+            )
+        if "secondary rate limit" in body.lower():
+            self._space_writes = True
+            return max(self._backoff(attempt), _BASE_DELAY * 60)
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        """Return a fully jittered exponential backoff."""
+        return self.jitter() * min(_MAX_BACKOFF, _BASE_DELAY * 2.0**attempt)
+
+    def _record_budget(self, headers: Mapping[str, str]) -> None:
+        """Update the budget from the X-RateLimit-* headers of a response."""
+        remaining = _header(headers, "X-RateLimit-Remaining")
+        limit = _header(headers, "X-RateLimit-Limit")
+        reset = _header(headers, "X-RateLimit-Reset")
+        if remaining is None or limit is None or reset is None:
+            return
+        try:
+            budget = RateLimitBudget(
+                remaining=int(remaining),
+                limit=int(limit),
+                reset=datetime.fromtimestamp(int(reset), tz=UTC),
+            )
+        except ValueError:
+            return
+        with self._lock:
+            self._budget = budget
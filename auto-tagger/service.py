@@ -0,0 +1,334 @@
+"""Webhook service mode: tag repositories on push events with warm per-repository state."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Final
+
+from components import Component
+from configuration import Configuration, ConfigurationError
+from fleet import load_repository_configuration
+from github_helpers import GitHubHelper, build_github_client
+from github_resources import Commit
+from main import _configure_logging, run, tag_release
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Mapping
+
+    from github_helpers import GitHubClient
+    from rate_limit import RateLimitScheduler
+
+_DEFAULT_HOST: Final[str] = "0.0.0.0"  # noqa: S104 - the service runs in a container
+_DEFAULT_WORKERS: Final[int] = 8
+_LOG_FORMAT: Final[str] = "%(levelname)s: %(name)s: %(message)s"
+# GitHub caps the payload size of webhook deliveries.
+_MAX_PAYLOAD_BYTES: Final[int] = 25 * 1024 * 1024
+# Push payloads list at most this many commits: a full list may be truncated.
+_PAYLOAD_COMMITS_LIMIT: Final[int] = 20
+_SIGNATURE_PREFIX: Final[str] = "sha256="
+_BRANCH_REF_PREFIX: Final[str] = "refs/heads/"
+_TAG_REF_PREFIX: Final[str] = "refs/tags/"
+_FILE_LISTS: Final[tuple[str, ...]] = ("added", "modified", "removed")
+
+
+def _touches_path(payload: Mapping[str, Any], path: str) -> bool:
+    """Tell whether a commit of a push payload changes a file under path."""
+    files = [name for key in _FILE_LISTS for name in payload.get(key, [])]
+    return Component(path, "").is_touched_by(files)
+
+
+def _to_commit(payload: Mapping[str, Any]) -> Commit:
+    """Convert a commit of a push payload to a typed Commit resource."""
+    return Commit(
+        sha=payload["id"],
+        author_name=payload["author"]["name"],
+        author_email=payload["author"].get("email", ""),
+        message=payload["message"],
+        date=datetime.fromisoformat(payload["timestamp"]),
+    )
+
+
+@dataclass
+class RepositoryState:
+    """Warm state of one repository, updated from its push events.
+
+    unreleased holds the commits pushed since the last tag while every push since
+    then was seen; None means they must be listed again.
+    """
+
+    helper: GitHubHelper
+    config: Configuration
+    env: dict[str, str]
+    head: str | None = None
+    unreleased: list[Commit] | None = None
+    events: deque[dict[str, Any]] = field(default_factory=deque)
+    running: bool = False
+
+    def go_cold(self) -> None:
+        """Forget the tags and commits, rediscovered on the next push."""
+        self.helper.forget_tags()
+        self.head = None
+        self.unreleased = None
+
+
+class WebhookService:
+    """Run the tagging workflow for push events, one repository at a time each.
+
+    Events of a repository are queued and handled in order by a single worker at a
+    time, while different repositories are handled in parallel. Tags, their commits
+    and the unreleased commits stay in memory between pushes, so a warm push costs
+    only the tag writes.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        secret: bytes,
+        client: GitHubClient,
+        rate_limit: RateLimitScheduler | None,
+        *,
+        env: Mapping[str, str],
+        logger: logging.Logger,
+        max_workers: int = _DEFAULT_WORKERS,
+    ) -> None:
+        """Share the client between repositories; env holds the inputs common to all."""
+        self.token = token
+        self.secret = secret
+        self.client = client
+        self.rate_limit = rate_limit
+        self.env = env
+        self.logger = logger
+        self.states: dict[str, RepositoryState] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def verify(self, body: bytes, signature: str | None) -> bool:
+        """Check the X-Hub-Signature-256 header of a delivery against the secret."""
+        expected = hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(f"{_SIGNATURE_PREFIX}{expected}", signature or "")
+
+    def submit(self, payload: dict[str, Any]) -> None:
+        """Queue a push event behind the pending ones of its repository."""
+        repository = payload["repository"]
+        with self._lock:
+            state = self.states.get(repository["full_name"])
+            if state is None:
+                state = self._new_state(repository)
+                self.states[repository["full_name"]] = state
+            state.events.append(payload)
+            if state.running:
+                return
+            state.running = True
+        self._pool.submit(self._drain, state)
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event is handled; False when timeout expires first."""
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: not any(state.running for state in self.states.values()),
+                timeout,
+            )
+
+    def close(self) -> None:
+        """Finish the queued events and stop the workers."""
+        self._pool.shutdown(wait=True)
+
+    def _new_state(self, repository: Mapping[str, Any]) -> RepositoryState:
+        """Create the cold state of a repository; no request is sent."""
+        env = {
+            **self.env,
+            "GITHUB_REPOSITORY": repository["full_name"],
+            "INPUT_DEFAULT_BRANCH": repository.get("default_branch")
+            or self.env.get("INPUT_DEFAULT_BRANCH", "main"),
+        }
+        config = load_repository_configuration(env)
+        helper = GitHubHelper(
+            self.token, config, self.client, rate_limit=self.rate_limit, env=env
+        )
+        return RepositoryState(helper=helper, config=config, env=env)
+
+    def _drain(self, state: RepositoryState) -> None:
+        """Handle the events of a repository in order until its queue is empty."""
+        logger = self.logger.getChild(state.config.REPOSITORY)
+        while True:
+            with self._lock:
+                if not state.events:
+                    state.running = False
+                    self._idle.notify_all()
+                    return
+                payload = state.events.popleft()
+            try:
+                self._handle_push(state, payload, logger)
+            except Exception:
+                logger.exception("Auto-tagger failed.")
+                state.go_cold()
+
+    def _handle_push(
+        self,
+        state: RepositoryState,
+        payload: dict[str, Any],
+        logger: logging.Logger,
+    ) -> None:
+        """Update the warm state from a push and tag the default branch head."""
+        ref: str = payload.get("ref", "")
+        if ref.startswith(_TAG_REF_PREFIX):
+            self._handle_tag_push(state, payload)
+            return
+        branch = ref.removeprefix(_BRANCH_REF_PREFIX)
+        if branch != state.config.DEFAULT_BRANCH or payload.get("deleted"):
+            return
+        env = {**state.env, "GITHUB_SHA": payload["after"], "GITHUB_REF_NAME": branch}
+        state.helper.env = env
+        entries = list(reversed(payload["commits"]))
+        pushed = [_to_commit(entry) for entry in entries]
+        state.helper.record_push(pushed)
+        if state.config.components:
+            # Components list their tags and commits once per push: nothing stays warm.
+            run(state.config, state.helper, env, logger)
+            return
+
+        path = state.config.commit_path_filter
+        if path is not None:
+            # Keep only the pushed commits a path-filtered listing would return.
+            pushed = [
+                commit
+                for commit, entry in zip(pushed, entries, strict=True)
+                if _touches_path(entry, path)
+            ]
+        last_tag = state.helper.last_available_tag
+        logger.info("Last available tag: %s", last_tag.name)
+        # The pushed commits complete the known ones only when no push was missed.
+        unreleased = (
+            pushed + state.unreleased
+            if state.unreleased is not None
+            and state.head == payload["before"]
+            and not payload.get("forced")
+            and len(entries) < _PAYLOAD_COMMITS_LIMIT
+            else list(state.helper.get_release_commits(last_tag))
+        )
+        new_tag = tag_release(
+            state.config, state.helper, last_tag, unreleased, env=env, logger=logger
+        )
+        state.head = payload["after"]
+        state.unreleased = (
+            [] if new_tag is not None and not state.config.DRY_RUN else unreleased
+        )
+
+    def _handle_tag_push(self, state: RepositoryState, payload: dict[str, Any]) -> None:
+        """Go cold when a tag is created, moved or deleted by someone else."""
+        name = payload["ref"].removeprefix(_TAG_REF_PREFIX)
+        head_commit = payload.get("head_commit") or {}
+        if not payload.get("deleted") and state.helper.knows_tag(
+            name, head_commit.get("id", "")
+        ):
+            return
+        state.go_cold()
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """HTTP server delivering GitHub webhooks to the service."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: WebhookService) -> None:
+        """Listen on address and hand push events to service."""
+        super().__init__(address, _WebhookHandler)
+        self.service = service
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Validate webhook deliveries and queue push events."""
+
+    server: WebhookServer
+
+    def do_POST(self) -> None:
+        """Accept a delivery: 202 for queued pushes, 204 for ignored events."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > _MAX_PAYLOAD_BYTES:
+            self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return
+        body = self.rfile.read(length)
+        service = self.server.service
+        if not service.verify(body, self.headers.get("X-Hub-Signature-256")):
+            self.send_error(HTTPStatus.UNAUTHORIZED)
+            return
+        event = self.headers.get("X-GitHub-Event")
+        if event != "push":
+            self._reply(HTTPStatus.OK if event == "ping" else HTTPStatus.NO_CONTENT)
+            return
+        try:
+            payload = json.loads(body)
+            service.submit(payload)
+        except (ValueError, KeyError, TypeError, ConfigurationError) as error:
+            service.logger.warning("Rejected push delivery: %s", error)
+            self.send_error(HTTPStatus.BAD_REQUEST)
+            return
+        self._reply(HTTPStatus.ACCEPTED)
+
+    def _reply(self, status: HTTPStatus) -> None:
+        """Send an empty response."""
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Route the access log to the service logger at debug level."""
+        self.server.service.logger.debug(format, *args)
+
+
+def run_service_from_env(env: Mapping[str, str] | None = None) -> int:
+    """Serve push webhooks on SERVICE_PORT until interrupted."""
+    environment = env or os.environ
+    logger = _configure_logging(environment, _LOG_FORMAT)
+
+    token = environment.get("INPUT_GITHUB_TOKEN", "").strip()
+    secret = environment.get("WEBHOOK_SECRET", "")
+    if not token or not secret:
+        logger.error(
+            "INPUT_GITHUB_TOKEN and WEBHOOK_SECRET are required to serve webhooks."
+        )
+        return 1
+    try:
+        port = int(environment.get("SERVICE_PORT", ""))
+        workers = int(environment.get("SERVICE_WORKERS", _DEFAULT_WORKERS))
+        config = Configuration.from_env(environment)
+    except ValueError:
+        logger.exception("Invalid service configuration.")
+        return 2
+
+    client, rate_limit = build_github_client(
+        token, config, pool_size=workers * config.PARALLEL_PAGES
+    )
+    service = WebhookService(
+        token,
+        secret.encode(),
+        client,
+        rate_limit,
+        env=environment,
+        logger=logger,
+        max_workers=workers,
+    )
+    server = WebhookServer(
+        (environment.get("SERVICE_HOST", _DEFAULT_HOST), port), service
+    )
+    logger.info("Serving push webhooks on port %d.", server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping.")
+    finally:
+        server.server_close()
+        service.close()
+    return 0
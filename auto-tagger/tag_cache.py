@@ -0,0 +1,123 @@
+"""On-disk tag index cache refreshed incrementally from the tag listing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from github_resources import Tag
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from github_resources import TagRef
+
+_CACHE_FORMAT_VERSION: Final[int] = 1
+_CACHE_KEY_LENGTH: Final[int] = 16
+_ENTRY_FIELDS: Final[int] = 4
+
+
+def _is_entry(value: object) -> bool:
+    """Tell whether value is a [ref_sha, commit_sha, message, date] list."""
+    if not (
+        isinstance(value, list)
+        and len(value) == _ENTRY_FIELDS
+        and all(isinstance(field, str) for field in value)
+    ):
+        return False
+    try:
+        datetime.fromisoformat(value[3])
+    except ValueError:
+        return False
+    return True
+
+
+class TagCache:
+    """Resolved tags keyed by name and the SHA their ref points to.
+
+    A cached tag is reused only while its ref still points to the same object, so new
+    or moved tags are resolved again while unchanged ones cost no API call.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load the cache stored at path; a missing or unreadable file starts empty."""
+        self.path = path
+        self._entries: dict[str, tuple[str, str, str, str]] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_repository(
+        cls, cache_dir: str, repository: str, prefix: str, suffix: str
+    ) -> TagCache:
+        """Return the cache file of a repository and tag format inside cache_dir."""
+        key = hashlib.sha256(f"{repository}\0{prefix}\0{suffix}".encode()).hexdigest()[
+            :_CACHE_KEY_LENGTH
+        ]
+        return cls(Path(cache_dir) / f"tags-{key}.json")
+
+    def _load(self) -> None:
+        """Read the entries from disk; any other format or malformed payload starts empty."""
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not (
+            isinstance(payload, dict)
+            and payload.get("version") == _CACHE_FORMAT_VERSION
+            and isinstance(payload.get("tags"), dict)
+            and all(_is_entry(entry) for entry in payload["tags"].values())
+        ):
+            return
+        self._entries = {
+            name: (ref_sha, commit_sha, message, date)
+            for name, (ref_sha, commit_sha, message, date) in payload["tags"].items()
+        }
+
+    def __len__(self) -> int:
+        """Return the number of cached tags."""
+        return len(self._entries)
+
+    def lookup(self, ref: TagRef) -> Tag | None:
+        """Return the cached tag for ref, or None when unknown or moved."""
+        entry = self._entries.get(ref.name)
+        if entry is None or entry[0] != ref.sha:
+            return None
+        _, commit_sha, message, date = entry
+        return Tag(
+            name=ref.name,
+            commit=commit_sha,
+            message=message,
+            date=datetime.fromisoformat(date),
+        )
+
+    def store(self, ref: TagRef, tag: Tag) -> None:
+        """Remember the resolved tag for the SHA its ref points to."""
+        entry = (ref.sha, tag.commit, tag.message, tag.date.isoformat())
+        if self._entries.get(ref.name) != entry:
+            self._entries[ref.name] = entry
+            self._dirty = True
+
+    def prune(self, refs: Iterable[TagRef]) -> None:
+        """Drop the tags that are no longer listed on the repository."""
+        listed = {ref.name for ref in refs}
+        stale = self._entries.keys() - listed
+        for name in stale:
+            del self._entries[name]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the entries to disk atomically when they changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": _CACHE_FORMAT_VERSION, "tags": self._entries}
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(
+            json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+        )
+        temporary.replace(self.path)
+        self._dirty = False
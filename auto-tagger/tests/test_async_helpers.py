@@ -0,0 +1,99 @@
+"""Tests for the asyncio front end of the GitHub helper."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, cast
+
+from async_helpers import AsyncGitHubHelper, run_async
+from configuration import Configuration
+from tests.test_github_helpers import (
+    DummyCommit,
+    DummyGithub,
+    DummyRef,
+    DummyRepo,
+    DummyTag,
+    build_commit,
+)
+
+if TYPE_CHECKING:
+    from github_helpers import GitHubClient
+
+_HEAD = "sha-3"
+
+
+class OverlapRepo(DummyRepo):
+    """Repository whose tag listing and head lookup only return once both are pending."""
+
+    def __init__(self, tags: list[DummyTag], commits: list[DummyCommit]) -> None:
+        """Make the two independent reads wait for each other."""
+        super().__init__(tags, commits)
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def get_git_matching_refs(self, ref: str) -> list[DummyRef]:
+        """List the tags once the head lookup is in flight."""
+        self.barrier.wait()
+        return super().get_git_matching_refs(ref)
+
+    def get_commit(self, sha: str) -> DummyCommit:
+        """Look up the head once the tag listing is in flight."""
+        if sha == _HEAD and _HEAD not in self.commit_lookups:
+            self.barrier.wait()
+        return super().get_commit(sha)
+
+
+def build_repo(
+    repo_class: type[DummyRepo] = DummyRepo, *, tagged: bool = True
+) -> DummyRepo:
+    """Return a repository tagged v1.0.0 and v1 (unless untagged) with two unreleased commits."""
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit("1", start, "initial"),
+        build_commit("2", start + timedelta(hours=1), "feat [#minor]"),
+        build_commit("3", start + timedelta(hours=2), "fix [#patch]"),
+    ]
+    tags = [
+        DummyTag(name="v1.0.0", commit=commits[0]),
+        DummyTag(name="v1", commit=commits[0]),
+    ]
+    return repo_class(tags=tags if tagged else [], commits=commits)
+
+
+def run(repo: DummyRepo, config: Configuration) -> int:
+    """Run the async workflow against repo for GITHUB_SHA sha-3."""
+    env = {"GITHUB_SHA": _HEAD}
+    github = AsyncGitHubHelper(
+        "token", config, cast("GitHubClient", DummyGithub(repo)), env=env
+    )
+    return asyncio.run(
+        run_async(config, github, env, logging.getLogger("test_async_helpers"))
+    )
+
+
+def test_run_async_reads_tags_and_head_together() -> None:
+    """Start the tag listing and the head lookup at once, then tag the release."""
+    repo = build_repo(OverlapRepo)
+    config = Configuration(REPOSITORY="octo/repo", BIND_TO_MAJOR=True)
+
+    assert run(repo, config) == 0
+
+    assert repo.created_refs == [("refs/tags/v1.1.0", _HEAD)]
+    assert repo.refs["tags/v1"].edits == [(_HEAD, True)]
+    assert repo.tag_listings == 1
+    assert repo.history_listings == 1
+
+
+def test_run_async_writes_default_tag_before_release() -> None:
+    """Create the missing default tag first, as the synchronous run does."""
+    repo = build_repo(tagged=False)
+    config = Configuration(REPOSITORY="octo/repo")
+
+    assert run(repo, config) == 0
+
+    assert repo.created_refs == [("refs/tags/v0.0.0", _HEAD)]
+    assert repo.commit_lookups.count(_HEAD) == 1
@@ -0,0 +1,169 @@
+"""Tests for the compiled commit rule engine."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from commit_rules import (
+    CONVENTIONAL_COMMIT_RULES,
+    MARKER_RULES,
+    CommitRule,
+    CommitRuleEngine,
+    CommitRuleError,
+    parse_commit_rules,
+)
+from configuration import Configuration, ConfigurationError
+from github_resources import BumpStrategy, Commit
+
+
+def build_commit(message: str) -> Commit:
+    """Build a commit carrying only a message."""
+    return Commit(
+        sha="1",
+        author_name="test",
+        author_email="test@example.com",
+        message=message,
+        date=datetime.now(UTC),
+    )
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("feat(api): add endpoint", {BumpStrategy.MINOR}),
+        ("fix: handle empty tag list", {BumpStrategy.PATCH}),
+        ("refactor(core)!: drop legacy input", {BumpStrategy.MAJOR}),
+        (
+            "feat: x\n\nBREAKING CHANGE: removed option",
+            {BumpStrategy.MAJOR, BumpStrategy.MINOR},
+        ),
+        ("feat: x\n\nbreaking change: lowercase footer", {BumpStrategy.MINOR}),
+        ("chore: bump deps [#SKIP]", {BumpStrategy.SKIP}),
+        ("docs: prefix fix: is not a type", set()),
+        ("docs: update readme\n\nWarning!: run migrations first", set()),
+        ("chore: bump deps\n\nfix: was wrong before", set()),
+        ("chore: x\nfeat(api): body line", set()),
+    ],
+)
+def test_conventional_commit_rules_classify_messages(
+    message: str, expected: set[BumpStrategy]
+) -> None:
+    """Select strategies from Conventional Commits headers, footers and markers."""
+    engine = CommitRuleEngine([*MARKER_RULES, *CONVENTIONAL_COMMIT_RULES])
+
+    assert engine.classify(message) == expected
+
+
+def test_custom_rules_are_parsed_from_configuration() -> None:
+    """Parse one strategy=regex rule per line, ignoring blanks and comments."""
+    rules = parse_commit_rules(
+        "# custom rules\nminor = ^feature/\n\npatch=\\bhotfix\\b\n"
+    )
+
+    assert rules == (
+        CommitRule(BumpStrategy.MINOR, "^feature/"),
+        CommitRule(BumpStrategy.PATCH, r"\bhotfix\b"),
+    )
+    engine = Configuration(COMMIT_RULES="minor=^feature/").rule_engine
+    assert engine.classify("feature/login") == {BumpStrategy.MINOR}
+
+
+def test_anchored_rules_keep_their_alternatives() -> None:
+    """Match a top-level alternative of a ^ rule anywhere in the message."""
+    engine = CommitRuleEngine(
+        [
+            CommitRule(BumpStrategy.PATCH, "^release|hotfix"),
+            CommitRule(BumpStrategy.MINOR, "^feature/"),
+            CommitRule(BumpStrategy.MAJOR, "breaking", ignore_case=True),
+        ]
+    )
+
+    assert engine.classify("urgent hotfix") == {BumpStrategy.PATCH}
+    assert engine.classify("see feature/login") == set()
+    assert engine.classify("x\nfeature/login BREAKING") == {
+        BumpStrategy.MINOR,
+        BumpStrategy.MAJOR,
+    }
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        "minor",
+        "huge=^x",
+        "patch=",
+        "patch=(unclosed",
+        "patch=(?P<name>x)",
+        "minor=(?i)feature",
+    ],
+)
+def test_invalid_custom_rules_fail_validation(rules: str) -> None:
+    """Report malformed rules as configuration errors."""
+    config = Configuration(REPOSITORY="octo/repo", COMMIT_RULES=rules)
+
+    with pytest.raises(ConfigurationError):
+        config.validate()
+
+
+def test_rule_engine_prefers_the_strongest_strategy() -> None:
+    """Apply skip over major over minor over patch across all commits."""
+    config = Configuration(
+        CONVENTIONAL_COMMITS=True, DEFAULT_BUMP_STRATEGY=BumpStrategy.SKIP
+    )
+    commits = [
+        build_commit("fix: a"),
+        build_commit("feat!: b"),
+        build_commit("feat: c"),
+    ]
+
+    assert config.get_bump_strategy_from_commits(commits) is BumpStrategy.MAJOR
+    assert config.get_bump_strategy_from_commits([]) is BumpStrategy.SKIP
+
+
+def test_empty_rule_engine_matches_nothing() -> None:
+    """Fall back to the default strategy without rules."""
+    with pytest.raises(CommitRuleError):
+        parse_commit_rules("patch")
+    engine = CommitRuleEngine([])
+
+    assert engine.classify("fix: x [#major]") == set()
+    assert (
+        engine.bump_strategy([build_commit("x")], BumpStrategy.PATCH)
+        is BumpStrategy.PATCH
+    )
+
+
+def test_overlapping_rules_are_all_found() -> None:
+    """Report a rule matching inside the hit of another one."""
+    engine = CommitRuleEngine(parse_commit_rules("patch=abc\nminor=bcd"))
+
+    assert engine.classify("abcd") == {BumpStrategy.PATCH, BumpStrategy.MINOR}
+    assert engine.classify("xbcd") == {BumpStrategy.MINOR}
+
+
+def test_numbered_backreferences_keep_their_group() -> None:
+    """Match backreferences against the rule's own groups."""
+    engine = CommitRuleEngine(parse_commit_rules("patch=(b)\\1\nminor=(a)x"))
+
+    assert engine.classify("bb") == {BumpStrategy.PATCH}
+    assert engine.classify("ax") == {BumpStrategy.MINOR}
+    assert engine.classify("ba") == set()
+
+
+def test_rules_are_found_behind_other_hits() -> None:
+    """Find rules starting inside the hit of another rule, whatever their first character."""
+    engine = CommitRuleEngine(
+        parse_commit_rules("patch=x*\nminor=ab\nmajor=\\[a\nskip=JIRA-\\d+")
+    )
+
+    assert engine.classify("ab") == {BumpStrategy.PATCH, BumpStrategy.MINOR}
+    assert engine.classify("[ab") == {
+        BumpStrategy.PATCH,
+        BumpStrategy.MAJOR,
+        BumpStrategy.MINOR,
+    }
+    assert engine.classify("see JIRA-12") == {BumpStrategy.PATCH, BumpStrategy.SKIP}
@@ -2,12 +2,14 @@
 
 # ruff: noqa: S101
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 import pytest
 
-from configuration import Configuration
-from github_resources import BumpStrategy, Commit
+from components import Component
+from configuration import Configuration, ConfigurationError
+from github_resources import BumpStrategy, Commit, RepositoryBackend
 
 
 def test_configuration_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -19,6 +21,7 @@ def test_configuration_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("INPUT_PREFIX", "release-")
     monkeypatch.setenv("INPUT_SUFFIX", "-beta")
     monkeypatch.setenv("INPUT_DRY_RUN", "true")
+    monkeypatch.setenv("INPUT_BACKEND", "GraphQL")
     monkeypatch.setenv("GITHUB_REPOSITORY", "octocat/hello-world")
 
     config = Configuration.from_env()
@@ -31,6 +34,7 @@ def test_configuration_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
     assert config.SUFFIX == "-beta"
     assert config.DRY_RUN is True
     assert config.REPOSITORY == "octocat/hello-world"
+    assert config.BACKEND is RepositoryBackend.GRAPHQL
 
 
 def test_get_bump_strategy_from_commits_detects_keyword() -> None:
@@ -108,6 +112,30 @@ def test_get_bump_strategy_from_commits_skip_takes_precedence() -> None:
     assert strategy is BumpStrategy.SKIP
 
 
+def test_get_bump_strategy_from_commits_stops_at_skip() -> None:
+    """Stop consuming commits once a skip marker settles the result."""
+    config = Configuration(DEFAULT_BUMP_STRATEGY=BumpStrategy.MINOR)
+    consumed: list[str] = []
+
+    def stream() -> Iterator[Commit]:
+        for sha, message in (
+            ("1", "fix: bug [#PATCH]"),
+            ("2", "[#Skip] wip"),
+            ("3", "x"),
+        ):
+            consumed.append(sha)
+            yield Commit(
+                sha=sha,
+                author_name="test",
+                author_email="test@example.com",
+                message=message,
+                date=datetime.now(UTC),
+            )
+
+    assert config.get_bump_strategy_from_commits(stream()) is BumpStrategy.SKIP
+    assert consumed == ["1", "2"]
+
+
 def test_configuration_invalid_strategy_falls_back(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -116,3 +144,22 @@ def test_configuration_invalid_strategy_falls_back(
     config = Configuration.from_env()
 
     assert config.DEFAULT_BUMP_STRATEGY is BumpStrategy.SKIP
+
+
+def test_components_are_parsed_and_validated() -> None:
+    """Parse path=prefix mappings and reject malformed or conflicting ones."""
+    config = Configuration(
+        REPOSITORY="octo/repo",
+        COMPONENTS="# services\nservices/api = api-v\n\nweb=web-v\n",
+    )
+
+    config.validate()
+    assert config.components == (
+        Component("services/api", "api-v"),
+        Component("web", "web-v"),
+    )
+    for components, path in [("api", "."), ("a=v\nb=v", "."), ("a=x", "src")]:
+        with pytest.raises(ConfigurationError):
+            Configuration(
+                REPOSITORY="octo/repo", COMPONENTS=components, PATH=path
+            ).validate()
@@ -0,0 +1,102 @@
+"""Tests for the fleet mode running many repositories from one process."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from fleet import FleetError, load_fleet, run_fleet
+from tests.test_github_helpers import DummyRepo, DummyTag, build_commit
+
+if TYPE_CHECKING:
+    from github_helpers import GitHubClient, GitRepository
+
+
+class FleetGithub:
+    """Client serving one dummy repository per name."""
+
+    def __init__(self, repos: dict[str, DummyRepo]) -> None:
+        """Hold the repositories by full name."""
+        self.repos = repos
+
+    def get_repo(self, full_name_or_id: str) -> GitRepository:
+        """Return the dummy repository of a name."""
+        return cast("GitRepository", self.repos[full_name_or_id])
+
+
+def test_load_fleet_builds_one_environment_per_repository() -> None:
+    """Merge the base inputs, the defaults and each repository's own inputs."""
+    base_env = {
+        "INPUT_GITHUB_TOKEN": "token",
+        "INPUT_PREFIX": "v",
+        "GITHUB_SHA": "sweep-sha",
+        "GITHUB_REPOSITORY": "octo/sweep",
+    }
+    fleet = """
+    {
+      "defaults": {"bind_to_major": true, "parallel_pages": 4},
+      "repositories": [
+        "octo/api",
+        {"repository": "octo/web", "prefix": "web-v", "sha": "abc"}
+      ]
+    }
+    """
+
+    api, web = load_fleet(fleet, base_env)
+
+    assert api == {
+        "INPUT_GITHUB_TOKEN": "token",
+        "INPUT_PREFIX": "v",
+        "INPUT_BIND_TO_MAJOR": "true",
+        "INPUT_PARALLEL_PAGES": "4",
+        "GITHUB_REPOSITORY": "octo/api",
+    }
+    assert web["INPUT_PREFIX"] == "web-v"
+    assert web["GITHUB_SHA"] == "abc"
+
+
+@pytest.mark.parametrize("fleet", ["{", '{"repositories": {}}', '[{"prefix": "v"}]'])
+def test_load_fleet_rejects_malformed_files(fleet: str) -> None:
+    """Report files without a list of named repositories."""
+    with pytest.raises(FleetError):
+        load_fleet(fleet, {})
+
+
+def test_run_fleet_reports_every_repository() -> None:
+    """Run each repository on the shared client and collect its exit code."""
+    commit_time = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [build_commit("1", commit_time, "release")]
+    repos = {
+        "octo/api": DummyRepo(
+            tags=[DummyTag(name="v1.0.0", commit=commits[0])], commits=commits
+        ),
+        "octo/web": DummyRepo(
+            tags=[DummyTag(name="v2.0.0", commit=commits[0])], commits=commits
+        ),
+    }
+    environments = load_fleet(
+        '{"defaults": {"dry_run": true}, "repositories": '
+        '["octo/api", "octo/web", {"repository": "octo/bad", "backend": "local"}]}',
+        {"INPUT_GITHUB_TOKEN": "token"},
+    )
+
+    results = run_fleet(
+        environments,
+        "token",
+        cast("GitHubClient", FleetGithub(repos)),
+        None,
+        logger=logging.getLogger("test_fleet"),
+        max_workers=2,
+    )
+
+    assert [(result.repository, result.exit_code) for result in results] == [
+        ("octo/api", 0),
+        ("octo/web", 0),
+        ("octo/bad", 2),
+    ]
+    assert all(repo.tag_listings == 1 for repo in repos.values())
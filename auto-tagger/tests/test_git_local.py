@@ -0,0 +1,146 @@
+"""Tests for the local git repository backend."""
+
+# ruff: noqa: S101, S603
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from configuration import Configuration
+from git_local import LocalGitRepository
+from github_helpers import GitHubHelper, GitRepository
+from github_resources import CommitRange, RepositoryBackend
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+GIT = shutil.which("git")
+
+pytestmark = pytest.mark.skipif(GIT is None, reason="git is not installed")
+
+REST_REPO = cast("GitRepository", object())
+
+
+def git(path: Path, *args: str, date: str = "2025-01-01T12:00:00+00:00") -> str:
+    """Run git in path with a fixed identity and commit date."""
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "dev",
+        "GIT_AUTHOR_EMAIL": "dev@example.com",
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_NAME": "dev",
+        "GIT_COMMITTER_EMAIL": "dev@example.com",
+        "GIT_COMMITTER_DATE": date,
+    }
+    result = subprocess.run(
+        [cast("str", GIT), "-C", str(path), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return result.stdout.strip()
+
+
+def commit(path: Path, filename: str, message: str, day: int) -> str:
+    """Commit a change to filename and return the new SHA."""
+    target = path / filename
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(f"{message}\n")
+    date = f"2025-01-{day:02d}T12:00:00+00:00"
+    git(path, "add", filename, date=date)
+    git(path, "commit", "-q", "-m", message, date=date)
+    return git(path, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def clone(tmp_path: Path) -> Path:
+    """Create a clone with a lightweight tag, an annotated tag and later commits."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q", "-b", "main")
+    commit(path, "api/main.py", "initial", 1)
+    git(path, "tag", "v1.0.0")
+    commit(path, "api/main.py", "feat: api [#minor]", 2)
+    git(
+        path,
+        "tag",
+        "-a",
+        "v1.1.0",
+        "-m",
+        "release 1.1.0",
+        date="2025-01-02T12:00:00+00:00",
+    )
+    git(path, "tag", "v1")
+    commit(path, "web/index.html", "docs: web", 3)
+    commit(path, "api/routes.py", "fix: routes [#patch]", 4)
+    return path
+
+
+def test_open_rejects_shallow_clones(clone: Path, tmp_path: Path) -> None:
+    """Fall back to the API when the checkout has no full history."""
+    shallow = tmp_path / "shallow"
+    git(tmp_path, "clone", "-q", "--depth", "1", f"file://{clone}", str(shallow))
+
+    assert LocalGitRepository.open(REST_REPO, str(clone)) is not None
+    assert LocalGitRepository.open(REST_REPO, str(shallow)) is None
+    assert LocalGitRepository.open(REST_REPO, str(tmp_path / "missing")) is None
+
+
+def test_local_backend_reads_tags_and_history(
+    clone: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Resolve tags, peeled commits and release ranges from the clone only."""
+    head = git(clone, "rev-parse", "HEAD")
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(clone))
+    monkeypatch.setenv("GITHUB_SHA", head)
+
+    class OfflineClient:
+        """Client whose REST repository must never be read."""
+
+        def get_repo(self, full_name_or_id: str) -> GitRepository:
+            """Return the placeholder REST repository."""
+            _ = full_name_or_id
+            return REST_REPO
+
+    helper = GitHubHelper(
+        "token",
+        Configuration(
+            DRY_RUN=True,
+            BACKEND=RepositoryBackend.LOCAL,
+            COMMIT_RANGE=CommitRange.COMPARE,
+            PATH="api",
+        ),
+        github_client=OfflineClient(),
+    )
+
+    assert isinstance(helper.repo, LocalGitRepository)
+    last_tag = helper.last_available_tag
+    assert last_tag.name == "v1.1.0"
+    assert last_tag.commit == git(clone, "rev-parse", "v1.1.0^{commit}")
+    assert last_tag.message == "feat: api [#minor]"
+    assert last_tag.date == datetime(2025, 1, 2, 12, 0, tzinfo=UTC)
+    assert helper.last_available_major_tag.name == "v1"
+    assert helper.get_last_commit().sha == head
+    release = helper.get_release_commits(last_tag)
+    assert [c.message for c in release] == ["fix: routes [#patch]"]
+    since = helper.get_commits_since(datetime(2025, 1, 2, 12, 0, tzinfo=UTC))
+    assert [c.message for c in since] == ["fix: routes [#patch]"]
+
+
+def test_changed_files_are_read_in_one_call(clone: Path) -> None:
+    """List the files changed by several commits with a single git call."""
+    repository = LocalGitRepository(REST_REPO, str(clone), cast("str", GIT))
+    head, previous = git(clone, "rev-list", "-2", "HEAD").splitlines()
+
+    assert repository.get_changed_files([head, previous]) == {
+        head: ["api/routes.py"],
+        previous: ["web/index.html"],
+    }
+    assert repository.get_changed_files([]) == {}
@@ -0,0 +1,160 @@
+"""Tests for the GraphQL repository backend."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from configuration import Configuration
+from github_graphql import GraphQLRepository
+from github_helpers import GitHubHelper, GitRepository
+from github_resources import RepositoryBackend
+
+
+def commit_node(oid: str, message: str, date: str) -> dict[str, Any]:
+    """Build a CommitFields node as returned by the GraphQL API."""
+    return {
+        "__typename": "Commit",
+        "oid": oid,
+        "message": message,
+        "committedDate": date,
+        "author": {"name": "dev", "email": "dev@example.com", "date": date},
+    }
+
+
+class FakeRequester:
+    """Requester stub answering GraphQL queries from canned pages."""
+
+    def __init__(
+        self, tag_pages: list[dict[str, Any]], history_pages: list[dict[str, Any]]
+    ) -> None:
+        """Store the pages returned for tag and history queries."""
+        self.tag_pages = tag_pages
+        self.history_pages = history_pages
+        self.queries: list[dict[str, Any]] = []
+
+    def graphql_query(
+        self, query: str, variables: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return the next canned page for the query kind."""
+        self.queries.append(variables)
+        if "refs(" in query:
+            page = self.tag_pages[len([v for v in self.queries if "head" in v]) - 1]
+            return {}, {"data": {"repository": page}}
+        if "history(" in query:
+            page = self.history_pages[
+                len([v for v in self.queries if "since" in v]) - 1
+            ]
+            return {}, {"data": {"repository": page}}
+        return {}, {"data": {"repository": {"object": None}}}
+
+
+class FakeClient:
+    """GitHub client stub exposing a REST repository and a requester."""
+
+    def __init__(self, requester: FakeRequester) -> None:
+        """Hold the requester used by the GraphQL backend."""
+        self.requester = requester
+
+    def get_repo(self, full_name_or_id: str) -> GitRepository:
+        """Return a placeholder REST repository; reads never reach it."""
+        _ = full_name_or_id
+        return cast("GitRepository", object())
+
+
+def tags_page(
+    nodes: list[dict[str, Any]], *, cursor: str | None = None
+) -> dict[str, Any]:
+    """Build a repository node with one page of tag refs."""
+    return {
+        "head": commit_node("head", "latest", "2025-01-03T12:00:00Z"),
+        "refs": {
+            "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+            "nodes": nodes,
+        },
+    }
+
+
+def test_graphql_backend_resolves_tags_and_commits_in_one_query() -> None:
+    """List tags with their peeled commits and serve commit lookups from memory."""
+    requester = FakeRequester(
+        tag_pages=[
+            tags_page(
+                [
+                    {
+                        "name": "v1.0.0",
+                        "target": commit_node("c1", "first", "2025-01-01T12:00:00Z"),
+                    },
+                    {
+                        "name": "v1.1.0",
+                        "target": {
+                            "__typename": "Tag",
+                            "oid": "tag-object",
+                            "target": commit_node(
+                                "c2", "second", "2025-01-02T12:00:00Z"
+                            ),
+                        },
+                    },
+                    {"name": "v1", "target": commit_node("c2", "second", "2025-01-02")},
+                ]
+            )
+        ],
+        history_pages=[],
+    )
+    helper = GitHubHelper(
+        "token",
+        Configuration(
+            DRY_RUN=True, BACKEND=RepositoryBackend.GRAPHQL, REPOSITORY="octo/repo"
+        ),
+        github_client=FakeClient(requester),
+    )
+
+    assert isinstance(helper.repo, GraphQLRepository)
+    assert helper.last_available_tag.name == "v1.1.0"
+    assert helper.last_available_tag.commit == "c2"
+    assert helper.last_available_tag.message == "second"
+    assert helper.last_available_major_tag.name == "v1"
+    assert len(requester.queries) == 1
+    assert requester.queries[0]["owner"] == "octo"
+    assert requester.queries[0]["query"] == "v"
+
+
+def test_graphql_backend_pages_through_history() -> None:
+    """Follow history cursors lazily and return commits newest first."""
+    requester = FakeRequester(
+        tag_pages=[],
+        history_pages=[
+            {
+                "object": {
+                    "history": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "next"},
+                        "nodes": [commit_node("c3", "third", "2025-01-03")],
+                    }
+                }
+            },
+            {
+                "object": {
+                    "history": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [commit_node("c2", "second", "2025-01-02")],
+                    }
+                }
+            },
+        ],
+    )
+    repo = GraphQLRepository(
+        cast("GitRepository", object()), requester, "octo/repo", head="main"
+    )
+
+    commits = repo.get_commits(since=datetime(2025, 1, 1, tzinfo=UTC), path="src")
+
+    assert next(iter(commits)).sha == "c3"
+    assert len(requester.queries) == 1
+    assert [commit.sha for commit in commits] == ["c2"]
+    assert requester.queries[1]["after"] == "next"
+    assert requester.queries[0]["path"] == "src"
+    assert requester.queries[0]["expression"] == "HEAD"
+    assert repo.get_commit("c2").commit.message == "second"
+    assert len(requester.queries) == len(requester.history_pages)
@@ -4,13 +4,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import cast
+from http import HTTPStatus
+from typing import TYPE_CHECKING, cast
 
+import pytest
+from github.GithubException import GithubException
+
+from components import Component
 from configuration import Configuration
 from github_helpers import GitHubHelper, GitRepository
-from github_resources import BumpStrategy, Tag
+from github_resources import BumpStrategy, CommitRange, Tag
+from main import run
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from github import InputGitAuthor
 
 
 @dataclass
@@ -47,15 +60,53 @@ class DummyTag:
     commit: DummyCommit
 
 
+@dataclass
+class DummyGitObject:
+    """Object targeted by a reference or an annotated tag."""
+
+    sha: str
+    type: str
+
+
+@dataclass
+class DummyAnnotatedTag:
+    """Annotated tag object pointing to a commit."""
+
+    object: DummyGitObject
+
+
+@dataclass
+class DummyFile:
+    """File changed within a comparison."""
+
+    filename: str
+
+
+@dataclass
+class DummyComparison:
+    """Comparison listing the commits of a range and their changed files."""
+
+    commits: list[DummyCommit]
+    files: list[DummyFile]
+
+
+@dataclass
 class DummyRef:
     """Test reference that tracks deletion."""
 
+    ref: str = ""
+    object: DummyGitObject | None = None
     deleted: bool = False
+    edits: list[tuple[str, bool]] = field(default_factory=list)
 
     def delete(self) -> None:
         """Mark the reference as deleted."""
         self.deleted = True
 
+    def edit(self, sha: str, force: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Record the forced update of the reference."""
+        self.edits.append((sha, force))
+
 
 class DummyRepo:
     """In-memory repository fake used to test helper behavior."""
@@ -68,28 +119,95 @@ class DummyRepo:
         )
         self.created_refs: list[tuple[str, str]] = []
         self.created_tags: list[str] = []
+        self.refs: dict[str, DummyRef] = {}
+        self.missing_refs: set[str] = set()
+        self.failing_refs: set[str] = set()
+        self.taggers: list[tuple[str, str]] = []
+        self.annotated_tags: dict[str, DummyAnnotatedTag] = {}
+        self.annotated_names: dict[str, str] = {}
+        self.changed_files: dict[str, list[str]] = {}
+        self.branch_heads = {"main": self._commits[0].sha} if self._commits else {}
+        self.history_listings = 0
+        self.tag_listings = 0
+        self.commit_lookups: list[str] = []
+        self.changed_files_lookups = 0
 
     def get_commits(
-        self, *, since: datetime, path: str | None = None
+        self,
+        *,
+        since: datetime | None = None,
+        sha: str | None = None,
+        path: str | None = None,
     ) -> list[DummyCommit]:
-        """Return commits newer than the requested timestamp."""
-        _ = path
-        return [
-            commit for commit in self._commits if commit.commit.author.date >= since
-        ]
+        """Return commits newer than the requested timestamp, from sha, touching path."""
+        self.history_listings += 1
+        commits = self._commits
+        if sha is not None:
+            commits = commits[[commit.sha for commit in commits].index(sha) :]
+        if since is not None:
+            commits = [c for c in commits if c.commit.author.date >= since]
+        if path is not None:
+            commits = [
+                c
+                for c in commits
+                if any(f.startswith(f"{path}/") for f in self.changed_files[c.sha])
+            ]
+        return commits
+
+    def compare(self, base: str, head: str) -> DummyComparison:
+        """Return the commits after base up to head, oldest first, on a linear history."""
+        shas = [commit.sha for commit in self._commits]
+        commits = self._commits[shas.index(head) : shas.index(base)][::-1]
+        files = {f for c in commits for f in self.changed_files.get(c.sha, [])}
+        return DummyComparison(
+            commits=commits, files=[DummyFile(filename=f) for f in sorted(files)]
+        )
 
     def get_commit(self, sha: str) -> DummyCommit:
-        """Find a commit by SHA or raise."""
+        """Find a commit by SHA or branch name, or raise."""
+        self.commit_lookups.append(sha)
+        sha = self.branch_heads.get(sha, sha)
         for commit in self._commits:
             if commit.sha == sha:
                 return commit
         message = f"Commit {sha} not found"
         raise ValueError(message)
 
+    def get_changed_files(self, shas: list[str]) -> dict[str, list[str] | None]:
+        """Return the files changed by each commit in a single call."""
+        self.changed_files_lookups += 1
+        return {sha: self.changed_files.get(sha, []) for sha in shas}
+
     def get_tags(self) -> list[DummyTag]:
         """Return all available tags."""
+        self.tag_listings += 1
         return self._tags
 
+    def get_git_matching_refs(self, ref: str) -> list[DummyRef]:
+        """Return lightweight tag references whose name starts with the given ref."""
+        self.tag_listings += 1
+        prefix = ref.removeprefix("tags/")
+        refs = [
+            DummyRef(
+                ref=f"refs/tags/{tag.name}",
+                object=DummyGitObject(sha=tag.commit.sha, type="commit"),
+            )
+            for tag in self._tags
+            if tag.name.startswith(prefix)
+        ]
+        refs.extend(
+            DummyRef(
+                ref=f"refs/tags/{name}", object=DummyGitObject(sha=sha, type="tag")
+            )
+            for sha, name in self.annotated_names.items()
+            if name.startswith(prefix)
+        )
+        return refs
+
+    def get_git_tag(self, sha: str) -> DummyAnnotatedTag:
+        """Return an annotated tag object by SHA."""
+        return self.annotated_tags[sha]
+
     def create_git_tag(
         self,
         *,
@@ -97,20 +215,25 @@ class DummyRepo:
         message: str,
         object: str,  # noqa: A002
         type: str,  # noqa: A002
-        tagger: object,
+        tagger: InputGitAuthor,
     ) -> None:
         """Record a created tag without mutating remote state."""
-        _ = (message, object, type, tagger)
+        _ = (message, object, type)
+        identity = tagger._identity  # noqa: SLF001
+        self.taggers.append((identity["name"], identity["email"]))
         self.created_tags.append(tag)
 
     def create_git_ref(self, ref: str, sha: str) -> None:
-        """Record a created reference."""
+        """Record a created reference, failing for the configured names."""
+        if ref.removeprefix("refs/tags/") in self.failing_refs:
+            raise GithubException(HTTPStatus.UNPROCESSABLE_ENTITY, None, None)
         self.created_refs.append((ref, sha))
 
     def get_git_ref(self, ref: str) -> DummyRef:
-        """Return a fresh dummy reference instance."""
-        _ = ref
-        return DummyRef()
+        """Return the dummy reference, failing like GitHub for missing tags."""
+        if ref.removeprefix("tags/") in self.missing_refs:
+            raise GithubException(HTTPStatus.UNPROCESSABLE_ENTITY, None, None)
+        return self.refs.setdefault(ref, DummyRef(ref=f"refs/{ref}"))
 
 
 class DummyGithub:
@@ -119,10 +242,12 @@ class DummyGithub:
     def __init__(self, repo: DummyRepo) -> None:
         """Hold a reference to the dummy repository."""
         self.repo = repo
+        self.repo_lookups = 0
 
     def get_repo(self, full_name_or_id: str) -> GitRepository:
         """Return the configured dummy repository."""
         _ = full_name_or_id
+        self.repo_lookups += 1
         return cast("GitRepository", self.repo)
 
 
@@ -159,6 +284,7 @@ def test_bump_tag_version_uses_latest_commit() -> None:
     assert new_tag.name == "v0.1.1"
     assert new_tag.commit == "sha-2"
     assert new_tag.message == "follow-up"
+    assert new_tag.date == commit_time + timedelta(minutes=5)
 
 
 def test_get_latest_major_tag_prefers_highest_numeric_value() -> None:
@@ -193,3 +319,521 @@ def test_get_latest_tag_prefers_highest_semver() -> None:
     )
 
     assert helper.last_available_tag.name == "v1.10.0"
+
+
+def test_tag_listing_is_shared_by_latest_and_major_tags() -> None:
+    """List the repository tags once for both the full and the major-only lookups."""
+    commit_time = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [build_commit("1", commit_time, "initial")]
+    tags = [
+        DummyTag(name="v1.2.3", commit=commits[0]),
+        DummyTag(name="v1", commit=commits[0]),
+        DummyTag(name="other-1.0.0", commit=commits[0]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+
+    assert helper.last_available_tag.name == "v1.2.3"
+    assert helper.last_available_major_tag.name == "v1"
+    assert repo.tag_listings == 1
+
+
+def test_get_latest_tag_fetches_commit_metadata_for_winner_only() -> None:
+    """Pick tags by version first and resolve only the winning tag's commit."""
+    commit_time = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit(str(index), commit_time + timedelta(minutes=index), "release")
+        for index in range(4)
+    ]
+    tags = [
+        DummyTag(name="v1.0.0", commit=commits[0]),
+        DummyTag(name="v1.1.0", commit=commits[1]),
+        DummyTag(name="v1.0.1", commit=commits[2]),
+        DummyTag(name="v1.2.0", commit=commits[3]),
+        DummyTag(name="v1", commit=commits[3]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+
+    assert helper.last_available_tag.name == "v1.2.0"
+    assert helper.last_available_tag.date == commit_time + timedelta(minutes=3)
+    assert repo.commit_lookups == ["sha-3"]
+
+
+def test_get_latest_tag_breaks_exact_version_ties_by_date() -> None:
+    """Resolve every tag sharing the highest version and prefer the newest one."""
+    older = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    newer = datetime(2025, 1, 2, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit("1", older, "older"),
+        build_commit("2", newer, "newer"),
+        build_commit("3", older, "lower"),
+    ]
+    tags = [
+        DummyTag(name="v1.0.0+build.1", commit=commits[1]),
+        DummyTag(name="v1.0.0+build.2", commit=commits[0]),
+        DummyTag(name="v0.9.0", commit=commits[2]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+
+    assert helper.last_available_tag.name == "v1.0.0+build.1"
+    assert "sha-3" not in repo.commit_lookups
+
+
+def test_prefix_lists_only_matching_refs() -> None:
+    """Ask the server for refs under the prefix instead of paging through every tag."""
+    commit_time = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [build_commit("1", commit_time, "initial")]
+    tags = [
+        DummyTag(name="api-v1.0.0", commit=commits[0]),
+        DummyTag(name="web-v2.0.0", commit=commits[0]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, PREFIX="api-v"),
+        github_client=DummyGithub(repo),
+    )
+
+    assert [ref.name for ref in helper.list_tag_refs()] == ["api-v1.0.0"]
+    assert helper.last_available_tag.name == "api-v1.0.0"
+
+
+def test_annotated_tag_refs_are_peeled_to_their_commit() -> None:
+    """Resolve annotated tags listed through refs to the commit they tag."""
+    commit_time = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [build_commit("1", commit_time, "initial")]
+    repo = DummyRepo(tags=[], commits=commits)
+    repo.annotated_names["tag-object-sha"] = "v3.0.0"
+    repo.annotated_tags["tag-object-sha"] = DummyAnnotatedTag(
+        object=DummyGitObject(sha="sha-1", type="commit")
+    )
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+
+    assert helper.last_available_tag.name == "v3.0.0"
+    assert helper.last_available_tag.commit == "sha-1"
+    assert helper.last_available_tag.message == "initial"
+
+
+def build_linear_repo() -> DummyRepo:
+    """Build a linear history of five commits tagged v1.0.0 and v1 on the second one."""
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit(str(index), start + timedelta(hours=index), f"change {index}")
+        for index in range(5)
+    ]
+    tags = [
+        DummyTag(name="v1.0.0", commit=commits[1]),
+        DummyTag(name="v1", commit=commits[1]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    repo.changed_files = {
+        "sha-0": ["api/main.py"],
+        "sha-1": ["api/main.py"],
+        "sha-2": ["web/index.html"],
+        "sha-3": ["api/routes.py"],
+        "sha-4": ["README.md"],
+    }
+    return repo
+
+
+def test_get_release_commits_compares_last_tag_with_head(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Select the release range by SHA instead of by date."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-4")
+    repo = build_linear_repo()
+    helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, COMMIT_RANGE=CommitRange.COMPARE),
+        github_client=DummyGithub(repo),
+    )
+    listings_before = repo.history_listings
+
+    commits = helper.get_release_commits(helper.last_available_tag)
+
+    assert [commit.sha for commit in commits] == ["sha-4", "sha-3", "sha-2"]
+    assert repo.history_listings == listings_before
+
+
+def test_get_release_commits_applies_path_filter_to_range(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep only the commits of the range that touch the configured path."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-4")
+    repo = build_linear_repo()
+    helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, COMMIT_RANGE=CommitRange.COMPARE, PATH="api"),
+        github_client=DummyGithub(repo),
+    )
+
+    commits = helper.get_release_commits(helper.last_available_tag)
+
+    assert [commit.sha for commit in commits] == ["sha-3"]
+
+
+class WalkRecordingRepo(DummyRepo):
+    """Repository recording the commits read from its history listings."""
+
+    def __init__(self, tags: list[DummyTag], commits: list[DummyCommit]) -> None:
+        """Start with no commit read."""
+        super().__init__(tags, commits)
+        self.walked: list[str] = []
+
+    def get_commits(  # type: ignore[override]
+        self,
+        *,
+        since: datetime | None = None,
+        sha: str | None = None,
+        path: str | None = None,
+    ) -> Iterator[DummyCommit]:
+        """Yield the listed commits one by one, recording each SHA read."""
+        for commit in super().get_commits(since=since, sha=sha, path=path):
+            self.walked.append(commit.sha)
+            yield commit
+
+
+def test_get_release_commits_bounds_the_path_walk_by_sha(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stop the path walk at the range boundary even when author dates are skewed."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-4")
+    linear = build_linear_repo()
+    repo = WalkRecordingRepo(tags=linear._tags, commits=linear._commits)  # noqa: SLF001
+    repo.changed_files = linear.changed_files
+    # A rebased commit keeps an author date older than the whole history.
+    repo.get_commit("sha-3").commit.author.date = datetime(2020, 1, 1, tzinfo=UTC)
+    helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, COMMIT_RANGE=CommitRange.COMPARE, PATH="api"),
+        github_client=DummyGithub(repo),
+    )
+
+    commits = helper.get_release_commits(helper.last_available_tag)
+
+    assert [commit.sha for commit in commits] == ["sha-3"]
+    assert repo.walked == ["sha-3", "sha-1"]
+
+
+def test_get_release_commits_skips_history_when_path_is_untouched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Return no commits without listing history when the range leaves the path alone."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-4")
+    repo = build_linear_repo()
+    helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, COMMIT_RANGE=CommitRange.COMPARE, PATH="docs"),
+        github_client=DummyGithub(repo),
+    )
+    listings_before = repo.history_listings
+
+    assert helper.get_release_commits(helper.last_available_tag) == []
+    assert repo.history_listings == listings_before
+
+
+def test_get_last_commit_fetches_github_sha_directly(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Resolve GITHUB_SHA with a single lookup and no history listing."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-2")
+    repo = build_linear_repo()
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+
+    assert helper.get_last_commit().sha == "sha-2"
+    assert repo.history_listings == 0
+
+
+def test_get_last_commit_without_github_sha_reads_branch_head(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Fall back to the default branch head, or the newest commit touching the path."""
+    monkeypatch.delenv("GITHUB_SHA", raising=False)
+    repo = build_linear_repo()
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+    path_helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, PATH="api"),
+        github_client=DummyGithub(repo),
+    )
+
+    assert helper.get_last_commit().sha == "sha-4"
+    assert repo.history_listings == 0
+    assert path_helper.get_last_commit().sha == "sha-3"
+    assert repo.history_listings == 1
+
+
+def test_tag_cache_skips_commit_lookups_for_unchanged_tags(tmp_path: Path) -> None:
+    """Reuse tags resolved by a previous run while their refs did not move."""
+    repo = build_linear_repo()
+    config = Configuration(DRY_RUN=True, CACHE_DIR=str(tmp_path))
+    first = GitHubHelper("token", config, github_client=DummyGithub(repo))
+    _ = (first.last_available_tag, first.last_available_major_tag)
+    repo.commit_lookups.clear()
+
+    second = GitHubHelper("token", config, github_client=DummyGithub(repo))
+
+    assert second.last_available_tag == first.last_available_tag
+    assert second.last_available_major_tag == first.last_available_major_tag
+    assert repo.commit_lookups == []
+
+
+def test_cached_written_tags_keep_the_tagged_commit_date(tmp_path: Path) -> None:
+    """Start the next run's date range at the commit of the tag written by this one."""
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit("0", start, "initial"),
+        build_commit("1", start + timedelta(hours=1), "rewrite [#major]"),
+        build_commit("2", start + timedelta(hours=2), "fix [#patch]"),
+    ]
+    config = Configuration(CACHE_DIR=str(tmp_path))
+    logger = logging.getLogger("test_github_helpers")
+    released = [DummyTag(name="v1.0.0", commit=commits[0])]
+    first_repo = DummyRepo(tags=released, commits=commits)
+    first_env = {"GITHUB_SHA": "sha-1"}
+    first = GitHubHelper(
+        "token", config, github_client=DummyGithub(first_repo), env=first_env
+    )
+    run(config, first, first_env, logger)
+
+    second_repo = DummyRepo(
+        tags=[*released, DummyTag(name="v2.0.0", commit=commits[1])], commits=commits
+    )
+    second_env = {"GITHUB_SHA": "sha-2"}
+    second = GitHubHelper(
+        "token", config, github_client=DummyGithub(second_repo), env=second_env
+    )
+    run(config, second, second_env, logger)
+
+    assert first_repo.created_refs == [("refs/tags/v2.0.0", "sha-1")]
+    assert second_repo.created_refs == [("refs/tags/v2.0.1", "sha-2")]
+
+
+@pytest.mark.parametrize("strategy", [BumpStrategy.MINOR, BumpStrategy.MAJOR])
+def test_dry_run_leaves_the_cached_major_tag_untouched(strategy: BumpStrategy) -> None:
+    """Rebind a copy of the major tag, not the tag listed by the helper."""
+    repo = build_linear_repo()
+    config = Configuration(
+        DRY_RUN=True, BIND_TO_MAJOR=True, DEFAULT_BUMP_STRATEGY=strategy
+    )
+    env = {"GITHUB_SHA": "sha-4"}
+    helper = GitHubHelper("token", config, github_client=DummyGithub(repo), env=env)
+    major_tag = helper.last_available_major_tag
+
+    run(config, helper, env, logging.getLogger("test_github_helpers"))
+
+    assert helper.last_available_major_tag is major_tag
+    assert (major_tag.name, major_tag.commit) == ("v1", "sha-1")
+    assert repo.created_refs == []
+
+
+def test_move_git_tag_force_updates_the_existing_ref() -> None:
+    """Move the major tag with one forced update instead of delete and create."""
+    repo = build_linear_repo()
+    helper = GitHubHelper("token", Configuration(), github_client=DummyGithub(repo))
+
+    helper.move_git_tag(Tag(name="v1", commit="sha-4", message="release"))
+
+    assert repo.refs["tags/v1"].edits == [("sha-4", True)]
+    assert not repo.refs["tags/v1"].deleted
+    assert repo.created_tags == ["v1"]
+    assert repo.created_refs == []
+
+
+def test_move_git_tag_creates_a_missing_ref() -> None:
+    """Fall back to creating the reference when the tag does not exist."""
+    repo = build_linear_repo()
+    repo.missing_refs.add("v2")
+    helper = GitHubHelper("token", Configuration(), github_client=DummyGithub(repo))
+
+    helper.move_git_tag(Tag(name="v2", commit="sha-4", message="release"))
+
+    assert repo.created_refs == [("refs/tags/v2", "sha-4")]
+
+
+def test_write_tags_creates_and_moves_tags_together() -> None:
+    """Write the full and the major tag in a single batch."""
+    repo = build_linear_repo()
+    helper = GitHubHelper("token", Configuration(), github_client=DummyGithub(repo))
+    repo.commit_lookups.clear()
+
+    helper.write_tags(
+        created=[Tag(name="v1.1.0", commit="sha-4")],
+        moved=[Tag(name="v1", commit="sha-4")],
+    )
+
+    assert sorted(repo.created_tags) == ["v1", "v1.1.0"]
+    assert repo.created_refs == [("refs/tags/v1.1.0", "sha-4")]
+    assert repo.refs["tags/v1"].edits == [("sha-4", True)]
+    assert repo.commit_lookups == ["sha-4"]
+
+
+def test_write_tags_rolls_back_written_refs_on_failure() -> None:
+    """Restore the moved major tag when creating the full tag fails."""
+    repo = build_linear_repo()
+    repo.failing_refs.add("v1.1.0")
+    helper = GitHubHelper("token", Configuration(), github_client=DummyGithub(repo))
+
+    with pytest.raises(GithubException):
+        helper.write_tags(
+            created=[Tag(name="v1.1.0", commit="sha-4")],
+            moved=[Tag(name="v1", commit="sha-4")],
+        )
+
+    assert repo.refs["tags/v1"].edits == [("sha-4", True), ("sha-1", True)]
+
+
+def test_tagger_reuses_cached_commit_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Build the tagger from the last commit already read, without another lookup."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-4")
+    repo = build_linear_repo()
+    helper = GitHubHelper("token", Configuration(), github_client=DummyGithub(repo))
+    helper.get_last_commit()
+    repo.commit_lookups.clear()
+
+    helper.create_git_tag(Tag(name="v1.1.0", commit="sha-4"))
+
+    assert repo.commit_lookups == []
+    assert repo.created_refs == [("refs/tags/v1.1.0", "sha-4")]
+
+
+def test_fixed_tagger_needs_no_commit_lookup() -> None:
+    """Use the configured tagger identity as is."""
+    repo = build_linear_repo()
+    helper = GitHubHelper(
+        "token",
+        Configuration(TAGGER_NAME="release-bot", TAGGER_EMAIL="bot@example.com"),
+        github_client=DummyGithub(repo),
+    )
+    repo.commit_lookups.clear()
+
+    helper.create_git_tag(Tag(name="v1.1.0", commit="sha-3"))
+
+    assert repo.commit_lookups == []
+    assert repo.taggers == [("release-bot", "bot@example.com")]
+
+
+def test_helper_defers_repository_and_tag_lookups() -> None:
+    """Send no request until the repository or the tags are used."""
+    repo = build_linear_repo()
+    client = DummyGithub(repo)
+    helper = GitHubHelper("token", Configuration(), github_client=client)
+
+    assert client.repo_lookups == 0
+    assert repo.tag_listings == 0
+    assert helper.last_available_tag.name == "v1.0.0"
+    assert client.repo_lookups == 1
+    assert repo.tag_listings == 1
+    assert repo.commit_lookups == ["sha-1"]
+
+
+def test_component_releases_share_one_tag_and_commit_listing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Split a single listing between components by path and by their own last tag."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-5")
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit("1", start, "initial"),
+        build_commit("2", start + timedelta(days=1), "api [#minor]"),
+        build_commit("3", start + timedelta(days=2), "web [#patch]"),
+        build_commit("4", start + timedelta(days=3), "web [#major]"),
+        build_commit("5", start + timedelta(days=4), "docs [#major]"),
+    ]
+    tags = [
+        DummyTag(name="api-v1.0.0", commit=commits[0]),
+        DummyTag(name="web-v0.1.0", commit=commits[0]),
+        DummyTag(name="web-v0.1.1", commit=commits[2]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    repo.changed_files = {
+        "sha-2": ["services/api/app.py"],
+        "sha-3": ["services/web/index.html"],
+        "sha-4": ["services/web/app.js", "services/apix/other.py"],
+        "sha-5": ["README.md"],
+    }
+    helper = GitHubHelper(
+        "token", Configuration(DRY_RUN=True), github_client=DummyGithub(repo)
+    )
+    components = [
+        Component("services/api", "api-v"),
+        Component("services/web/", "web-v"),
+    ]
+
+    releases = helper.get_component_releases(components)
+
+    assert [release.last_tag.name for release in releases] == [
+        "api-v1.0.0",
+        "web-v0.1.1",
+    ]
+    assert [[commit.sha for commit in release.commits] for release in releases] == [
+        ["sha-2"],
+        ["sha-4"],
+    ]
+    assert releases[1].helper.config.PREFIX == "web-v"
+    assert (
+        releases[1]
+        .helper.bump_tag_version(BumpStrategy.MAJOR, releases[1].last_tag)
+        .name
+        == "web-v1.0.0"
+    )
+    assert repo.tag_listings == 1
+    assert repo.history_listings == 1
+    assert repo.changed_files_lookups == 1
+
+
+def test_component_releases_compare_each_component_tag_with_head(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Select component ranges by SHA in compare mode, whatever the author dates."""
+    monkeypatch.setenv("GITHUB_SHA", "sha-5")
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    commits = [
+        build_commit(str(index), start + timedelta(days=index), f"change {index}")
+        for index in range(1, 6)
+    ]
+    tags = [
+        DummyTag(name="api-v1.0.0", commit=commits[0]),
+        DummyTag(name="web-v0.1.1", commit=commits[2]),
+    ]
+    repo = DummyRepo(tags=tags, commits=commits)
+    repo.changed_files = {
+        "sha-2": ["services/api/app.py"],
+        "sha-3": ["services/web/index.html"],
+        "sha-4": ["services/web/app.js"],
+        "sha-5": ["services/api/routes.py"],
+    }
+    # Rebased after the web release, sha-4 keeps an author date older than it.
+    commits[3].commit.author.date = start
+    helper = GitHubHelper(
+        "token",
+        Configuration(DRY_RUN=True, COMMIT_RANGE=CommitRange.COMPARE),
+        github_client=DummyGithub(repo),
+    )
+    components = [
+        Component("services/api", "api-v"),
+        Component("services/web", "web-v"),
+    ]
+
+    releases = helper.get_component_releases(components)
+
+    assert [[commit.sha for commit in release.commits] for release in releases] == [
+        ["sha-5", "sha-2"],
+        ["sha-4"],
+    ]
+    assert repo.history_listings == 0
+    assert repo.changed_files_lookups == 1
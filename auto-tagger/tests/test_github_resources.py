@@ -0,0 +1,47 @@
+"""Tests for the resource models."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import UTC, datetime
+
+import pytest
+
+from configuration import Configuration
+from github_resources import BumpStrategy, Commit, CommitBatch, Tag
+
+
+def build_commit(sha: str, message: str) -> Commit:
+    """Build a commit with fixed author data."""
+    return Commit(
+        sha=sha,
+        author_name="test",
+        author_email="test@example.com",
+        message=message,
+        date=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+
+def test_resources_are_slotted() -> None:
+    """Keep no per-instance dictionary; commits are immutable, tags are not."""
+    commit = build_commit("1", "fix: x")
+    tag = Tag(name="v1", commit="1")
+
+    assert not hasattr(commit, "__dict__")
+    assert not hasattr(tag, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        commit.message = "changed"  # type: ignore[misc]
+    tag.commit = "2"
+    assert tag.commit == "2"
+
+
+def test_commit_batch_feeds_the_classifier() -> None:
+    """Classify a columnar batch like the equivalent list of commits."""
+    commits = [build_commit("1", "fix: x [#patch]"), build_commit("2", "[#minor] y")]
+    batch = CommitBatch.from_commits(commits)
+
+    assert len(batch) == len(commits)
+    assert batch.shas == ["1", "2"]
+    assert Configuration().get_bump_strategy_from_commits(batch) is BumpStrategy.MINOR
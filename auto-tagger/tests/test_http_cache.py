@@ -0,0 +1,241 @@
+"""Tests for the conditional-request response cache."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+import requests
+from github import Github
+
+from http_cache import CacheEntry, ResponseCache
+from rate_limit import RateLimitScheduler
+from transport import (
+    CachingHTTPConnection,
+    TransportSettings,
+    build_session,
+    create_client,
+    transport_stats,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def build_entry(body: str) -> CacheEntry:
+    """Build a cache entry validated by ETag."""
+    return CacheEntry(etag='"etag"', last_modified=None, headers={}, body=body)
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Drop the entries used least recently once the size bound is exceeded."""
+    cache = ResponseCache(tmp_path, max_bytes=300)
+    cache.put("https://api/a", build_entry("a" * 60))
+    cache.put("https://api/b", build_entry("b" * 60))
+    assert cache.get("https://api/a") is not None
+
+    cache.put("https://api/c", build_entry("c" * 60))
+
+    assert cache.size <= cache.max_bytes
+    assert cache.get("https://api/b") is None
+    assert cache.get("https://api/a") == build_entry("a" * 60)
+    reloaded = ResponseCache(tmp_path, max_bytes=300)
+    assert reloaded.get("https://api/c") == build_entry("c" * 60)
+
+
+def test_response_cache_recency_spans_runs(tmp_path: Path) -> None:
+    """Keep an entry read by a previous run over an older, never read one."""
+    first = ResponseCache(tmp_path, max_bytes=300)
+    first.put("https://api/a", build_entry("a" * 60))
+    first.put("https://api/b", build_entry("b" * 60))
+    for name in ("a", "b"):
+        path = tmp_path / ResponseCache._filename(f"https://api/{name}")  # noqa: SLF001
+        os.utime(path, (1_000_000, 1_000_000))
+
+    assert ResponseCache(tmp_path, max_bytes=300).get("https://api/a") is not None
+    third = ResponseCache(tmp_path, max_bytes=300)
+    third.put("https://api/c", build_entry("c" * 60))
+
+    assert third.get("https://api/a") is not None
+    assert third.get("https://api/b") is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "{not json",
+        '{"etag": "x"}',
+        '{"etag": null, "last_modified": null, "headers": {}, "body": ""}',
+        '{"version": 1, "etag": 1, "last_modified": null, "headers": {}, "body": ""}',
+        '{"version": 1, "etag": null, "last_modified": null, "headers": [], "body": ""}',
+    ],
+)
+def test_response_cache_drops_malformed_entries(tmp_path: Path, content: str) -> None:
+    """Treat entries of another format as misses and remove them."""
+    path = tmp_path / ResponseCache._filename("https://api/a")  # noqa: SLF001
+    path.write_text(content, encoding="utf-8")
+    cache = ResponseCache(tmp_path)
+
+    assert cache.get("https://api/a") is None
+    assert not path.exists()
+    assert cache.size == 0
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serve a fixed JSON body and answer 304 when the ETag matches."""
+
+    seen_validators: ClassVar[list[str | None]] = []
+
+    def do_GET(self) -> None:
+        """Reply with the body or with Not Modified."""
+        validator = self.headers.get("If-None-Match")
+        self.seen_validators.append(validator)
+        if validator == '"v1"':
+            self.send_response(304)
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.end_headers()
+            return
+        body = b'{"name": "v1.0.0"}'
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    """Run the ETag server on a free local port."""
+    ETagHandler.seen_validators = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+
+
+def test_connection_revalidates_cached_get_requests(
+    server: ThreadingHTTPServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Send If-None-Match for cached URLs and replay the body on 304."""
+    cache = ResponseCache(tmp_path)
+    monkeypatch.setattr(CachingHTTPConnection, "cache", cache)
+    port = server.server_address[1]
+
+    responses = []
+    for _ in range(2):
+        connection = CachingHTTPConnection("127.0.0.1", port)
+        connection.request("GET", "/repos/octo/repo/tags", None, {})
+        responses.append(connection.getresponse())
+
+    assert ETagHandler.seen_validators == [None, '"v1"']
+    assert [response.status for response in responses] == [200, 200]
+    assert responses[1].read() == '{"name": "v1.0.0"}'
+    assert dict(responses[1].getheaders())["X-RateLimit-Remaining"] == "4999"
+    assert cache.hits == 1
+
+
+class KeepAliveHandler(ETagHandler):
+    """Serve the ETag responses over persistent HTTP/1.1 connections."""
+
+    protocol_version = "HTTP/1.1"
+
+
+def test_connections_are_reused_and_counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Send every request over the pooled keep-alive connection and count the reuse."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(CachingHTTPConnection, "cache", None)
+    monkeypatch.setattr(CachingHTTPConnection, "scheduler", None)
+    session = build_session(TransportSettings(pool_size=1, timeout=5))
+    before = transport_stats()
+
+    for _ in range(3):
+        connection = CachingHTTPConnection("127.0.0.1", httpd.server_address[1])
+        connection.session = session
+        connection.request("GET", "/repos/octo/repo/tags", None, {})
+        assert connection.getresponse().status == 200  # noqa: PLR2004
+    httpd.shutdown()
+
+    after = transport_stats()
+    assert after.requests - before.requests == 3  # noqa: PLR2004
+    assert after.connections - before.connections == 1
+
+
+def test_refused_connections_are_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Back off and retry a write whose connection could not be opened."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    sleeps: list[float] = []
+    scheduler = RateLimitScheduler(
+        max_retries=2, sleep=sleeps.append, jitter=lambda: 0.5
+    )
+    monkeypatch.setattr(CachingHTTPConnection, "cache", None)
+    monkeypatch.setattr(CachingHTTPConnection, "scheduler", scheduler)
+
+    connection = CachingHTTPConnection("127.0.0.1", port)
+    connection.session = build_session(TransportSettings(timeout=5))
+    connection.request("POST", "/repos/octo/repo/git/refs", "{}", {})
+    with pytest.raises(requests.ConnectionError):
+        connection.getresponse()
+
+    assert sleeps == [0.5, 1.0]
+
+
+class BudgetHandler(BaseHTTPRequestHandler):
+    """Report the remaining budget found at the end of the requested path."""
+
+    def do_GET(self) -> None:
+        """Reply with an empty JSON object and the rate limit headers."""
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("X-RateLimit-Remaining", self.path.rsplit("/", 1)[-1])
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Reset", "1700000000")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Keep the test output quiet."""
+
+
+def test_clients_keep_their_own_scheduler() -> None:
+    """Pace each client's requests with the scheduler it was created with."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), BudgetHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    schedulers = [RateLimitScheduler(), RateLimitScheduler()]
+    clients = [
+        create_client(
+            lambda: Github(
+                base_url=f"http://127.0.0.1:{httpd.server_address[1]}", retry=None
+            ),
+            scheduler=scheduler,
+            settings=TransportSettings(timeout=5),
+        )
+        for scheduler in schedulers
+    ]
+
+    for remaining, client in enumerate(clients, start=1):
+        client.requester.requestJsonAndCheck("GET", f"/budget/{remaining}")
+    httpd.shutdown()
+
+    assert [
+        scheduler.budget.remaining if scheduler.budget else None
+        for scheduler in schedulers
+    ] == [1, 2]
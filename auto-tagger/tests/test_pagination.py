@@ -0,0 +1,130 @@
+"""Tests for the concurrent pagination of REST listings."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+from pagination import ParallelPages, ParallelPagesRepository, _last_page
+
+if TYPE_CHECKING:
+    from github.Requester import Requester
+
+    from github_helpers import GitRepository
+
+_ITEMS_PER_PAGE = 3
+
+
+class PagedRequester:
+    """Serve numbered items over a fixed number of pages with GitHub Link headers."""
+
+    def __init__(self, pages: int) -> None:
+        """Record every requested page number."""
+        self.pages = pages
+        self.requested: list[int] = []
+        self._lock = threading.Lock()
+
+    def requestJsonAndCheck(  # noqa: N802
+        self, verb: str, url: str, parameters: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[dict[str, int]]]:
+        """Return one page of items and the Link header pointing to the last page."""
+        assert verb == "GET"
+        page = parameters["page"]
+        with self._lock:
+            self.requested.append(page)
+        headers: dict[str, Any] = {}
+        if self.pages > 1:
+            headers["link"] = (
+                f'<{url}?per_page=100&page={min(page + 1, self.pages)}>; rel="next", '
+                f'<{url}?per_page=100&page={self.pages}>; rel="last"'
+            )
+        first = (page - 1) * _ITEMS_PER_PAGE
+        return headers, [{"n": first + offset} for offset in range(_ITEMS_PER_PAGE)]
+
+
+def build_pages(requester: PagedRequester) -> ParallelPages:
+    """List the numbers served by the requester."""
+    return ParallelPages(
+        cast("Requester", requester),
+        lambda _requester, _headers, element: element["n"],
+        "https://api.github.com/repos/octo/repo/tags",
+        {},
+        max_workers=4,
+    )
+
+
+def test_last_page_reads_the_link_header() -> None:
+    """Fall back to a single page when no last link is advertised."""
+    assert _last_page({}) == 1
+    assert (
+        _last_page(
+            {
+                "link": '<https://api/x?page=2>; rel="next", <https://api/x?page=7>; rel="last"'
+            }
+        )
+        == 7  # noqa: PLR2004
+    )
+
+
+def test_parallel_pages_yield_every_item_in_order() -> None:
+    """Keep the listing order while later pages are fetched concurrently."""
+    requester = PagedRequester(pages=5)
+
+    items = list(build_pages(requester))
+
+    assert items == list(range(5 * _ITEMS_PER_PAGE))
+    assert sorted(requester.requested) == [1, 2, 3, 4, 5]
+    assert requester.requested[0] == 1
+
+
+def test_parallel_pages_stop_after_the_first_page() -> None:
+    """Request a single page when the consumer only reads the first item."""
+    requester = PagedRequester(pages=5)
+
+    assert next(iter(build_pages(requester))) == 0
+    assert requester.requested == [1]
+
+
+class HeadRequester:
+    """Serve a single commit and record the parameters of each request."""
+
+    # Read by PyGitHub objects built from the responses.
+    per_page = 30
+    is_lazy = True
+    is_not_lazy = False
+
+    def __init__(self) -> None:
+        """Start with no request."""
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+
+    def requestJsonAndCheck(  # noqa: N802
+        self, verb: str, url: str, parameters: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[dict[str, str]]]:
+        """Return a page holding the head commit."""
+        assert verb == "GET"
+        self.requests.append((url, parameters))
+        return {}, [{"sha": "abc"}]
+
+
+def test_head_commit_is_read_from_a_one_item_page() -> None:
+    """Read the newest commit without requesting a full page of history."""
+    requester = HeadRequester()
+    repo = ParallelPagesRepository(
+        cast("GitRepository", None),
+        cast("Requester", requester),
+        "https://api.github.com/repos/octo/repo",
+        max_workers=4,
+    )
+
+    head = repo.get_head_commit("api")
+
+    assert head is not None
+    assert head.sha == "abc"
+    assert requester.requests == [
+        (
+            "https://api.github.com/repos/octo/repo/commits",
+            {"per_page": 1, "path": "api"},
+        )
+    ]
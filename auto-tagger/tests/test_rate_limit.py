@@ -0,0 +1,138 @@
+"""Tests for the rate limit aware request scheduler."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from rate_limit import RateLimitScheduler
+
+_NOW = 1_700_000_000.0
+
+
+class FakeClock:
+    """Clock advanced only by the scheduler's sleeps."""
+
+    def __init__(self) -> None:
+        """Start at a fixed instant."""
+        self.now = _NOW
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record the sleep and advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def build_scheduler(clock: FakeClock, max_retries: int = 3) -> RateLimitScheduler:
+    """Build a scheduler on the fake clock with a constant jitter of zero."""
+    return RateLimitScheduler(
+        max_retries=max_retries,
+        max_wait=600.0,
+        low_budget=10,
+        clock=clock.time,
+        sleep=clock.sleep,
+        jitter=lambda: 0.0,
+    )
+
+
+def budget_headers(remaining: int, reset_in: int) -> dict[str, str]:
+    """Return the X-RateLimit-* headers of a response."""
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Reset": str(int(_NOW) + reset_in),
+    }
+
+
+def test_successful_responses_update_the_budget() -> None:
+    """Record the budget without pacing requests while it is comfortable."""
+    clock = FakeClock()
+    scheduler = build_scheduler(clock)
+
+    assert scheduler.retry_delay("GET", 200, budget_headers(4999, 3600), "", 0) is None
+    scheduler.before_request("GET")
+
+    assert scheduler.budget is not None
+    assert scheduler.budget.remaining == 4999  # noqa: PLR2004
+    assert "4999/5000 requests left" in str(scheduler.budget)
+    assert clock.sleeps == []
+
+
+def test_low_budget_spreads_requests_until_the_reset() -> None:
+    """Space requests evenly over the window left when few requests remain."""
+    clock = FakeClock()
+    scheduler = build_scheduler(clock)
+    scheduler.retry_delay("GET", 200, budget_headers(5, 100), "", 0)
+
+    for _ in range(3):
+        scheduler.before_request("GET")
+
+    assert clock.sleeps == [20.0, 20.0]
+
+
+def test_rate_limited_responses_wait_for_retry_after_or_the_reset() -> None:
+    """Retry secondary limits after Retry-After and primary ones after the reset."""
+    clock = FakeClock()
+    scheduler = build_scheduler(clock)
+
+    secondary = {**budget_headers(4000, 3600), "Retry-After": "30"}
+    assert scheduler.retry_delay("POST", 403, secondary, "", 0) == 30.0  # noqa: PLR2004
+    assert scheduler.retry_delay("GET", 403, budget_headers(0, 120), "", 0) == 120.0  # noqa: PLR2004
+    assert scheduler.retry_delay("GET", 429, {}, "secondary rate limit", 0) == 60.0  # noqa: PLR2004
+    assert scheduler.retry_delay("GET", 403, {}, "Resource not accessible", 0) is None
+    assert scheduler.retries == 3  # noqa: PLR2004
+
+
+def test_writes_are_spaced_after_a_secondary_limit() -> None:
+    """Keep one second between writes once GitHub asked to slow down."""
+    clock = FakeClock()
+    scheduler = build_scheduler(clock)
+    scheduler.retry_delay("POST", 429, {"Retry-After": "1"}, "", 0)
+
+    scheduler.before_request("POST")
+    scheduler.before_request("GET")
+    scheduler.before_request("POST", "/graphql")
+    scheduler.before_request("PATCH")
+
+    assert clock.sleeps == [1.0]
+
+
+def test_transient_errors_are_retried_on_reads_only() -> None:
+    """Back off exponentially on 5xx reads, never replaying a write."""
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(
+        max_retries=2, clock=clock.time, sleep=clock.sleep, jitter=lambda: 1.0
+    )
+
+    assert scheduler.retry_delay("GET", 502, {}, "", 0) == 1.0
+    assert scheduler.retry_delay("GET", 503, {}, "", 1) == 2.0  # noqa: PLR2004
+    assert scheduler.retry_delay("GET", 503, {}, "", 2) is None
+    assert scheduler.retry_delay("POST", 502, {}, "", 0) is None
+    assert scheduler.retry_delay("POST", 500, {}, "", 0, url="/graphql") == 1.0
+
+
+def test_connection_errors_are_retried_unless_a_write_may_have_been_sent() -> None:
+    """Retry failed connections, and reads whatever happened to the request."""
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(
+        max_retries=1, clock=clock.time, sleep=clock.sleep, jitter=lambda: 1.0
+    )
+
+    assert scheduler.error_delay("GET", 0, maybe_sent=True) == 1.0
+    assert scheduler.error_delay("POST", 0, url="/graphql", maybe_sent=True) == 1.0
+    assert scheduler.error_delay("POST", 0, maybe_sent=False) == 1.0
+    assert scheduler.error_delay("POST", 0, maybe_sent=True) is None
+    assert scheduler.error_delay("GET", 1, maybe_sent=False) is None
+
+
+def test_waits_beyond_the_bound_are_not_retried() -> None:
+    """Give up instead of sleeping past max_wait."""
+    clock = FakeClock()
+    scheduler = build_scheduler(clock)
+
+    assert scheduler.retry_delay("GET", 403, budget_headers(0, 3600), "", 0) is None
+    assert scheduler.retries == 0
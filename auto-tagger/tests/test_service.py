@@ -0,0 +1,220 @@
+"""Tests for the webhook service mode, driven by a local stand-in webhook sender."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from service import WebhookServer, WebhookService
+from tests.test_github_helpers import DummyCommit, DummyRepo, DummyTag, build_commit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from github_helpers import GitHubClient, GitRepository
+
+_SECRET = b"webhook-secret"
+_REPOSITORY = "octo/repo"
+
+
+class ServiceGithub:
+    """Client serving a single dummy repository."""
+
+    def __init__(self, repo: DummyRepo) -> None:
+        """Hold the repository."""
+        self.repo = repo
+
+    def get_repo(self, full_name_or_id: str) -> GitRepository:
+        """Return the dummy repository."""
+        assert full_name_or_id == _REPOSITORY
+        return cast("GitRepository", self.repo)
+
+
+def send(url: str, event: str, payload: dict[str, Any], secret: bytes = _SECRET) -> int:
+    """Deliver a signed webhook like GitHub does and return the response status."""
+    body = json.dumps(payload).encode()
+    signature = hmac.new(secret, body, hashlib.sha256).hexdigest()
+    request = urllib.request.Request(  # noqa: S310
+        url,
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-GitHub-Event": event,
+            "X-Hub-Signature-256": f"sha256={signature}",
+        },
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request) as response:  # noqa: S310
+            return cast("int", response.status)
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+def push(
+    ref: str,
+    before: str,
+    commits: list[DummyCommit],
+    changed_files: dict[str, list[str]] | None = None,
+) -> dict[str, Any]:
+    """Build the push payload of commits, oldest first."""
+    entries = [
+        {
+            "id": commit.sha,
+            "message": commit.commit.message,
+            "timestamp": commit.commit.author.date.isoformat(),
+            "author": {"name": "dev", "email": "dev@example.com"},
+            "added": [],
+            "modified": (changed_files or {}).get(commit.sha, []),
+            "removed": [],
+        }
+        for commit in commits
+    ]
+    return {
+        "ref": ref,
+        "before": before,
+        "after": commits[-1].sha,
+        "forced": False,
+        "deleted": False,
+        "commits": entries,
+        "head_commit": entries[-1],
+        "repository": {"full_name": _REPOSITORY, "default_branch": "main"},
+    }
+
+
+@pytest.fixture
+def commits() -> list[DummyCommit]:
+    """Return a tagged commit followed by two pushed ones."""
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    return [
+        build_commit("1", start, "initial"),
+        build_commit("2", start + timedelta(hours=1), "feat [#minor]"),
+        build_commit("3", start + timedelta(hours=2), "fix [#patch]"),
+    ]
+
+
+@pytest.fixture
+def repo(commits: list[DummyCommit]) -> DummyRepo:
+    """Return a repository tagged v1.0.0 on its first commit."""
+    return DummyRepo(tags=[DummyTag(name="v1.0.0", commit=commits[0])], commits=commits)
+
+
+@contextmanager
+def serve(
+    repo: DummyRepo, env: dict[str, str] | None = None
+) -> Iterator[tuple[WebhookService, str]]:
+    """Serve webhooks for repo on a free local port, with extra inputs from env."""
+    service = WebhookService(
+        "token",
+        _SECRET,
+        cast("GitHubClient", ServiceGithub(repo)),
+        None,
+        env={"INPUT_GITHUB_TOKEN": "token", **(env or {})},
+        logger=logging.getLogger("test_service"),
+    )
+    server = WebhookServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield service, f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+@pytest.fixture
+def service_url(repo: DummyRepo) -> Iterator[tuple[WebhookService, str]]:
+    """Serve webhooks on a free local port."""
+    with serve(repo) as served:
+        yield served
+
+
+def test_warm_pushes_only_write_tags(
+    repo: DummyRepo,
+    commits: list[DummyCommit],
+    service_url: tuple[WebhookService, str],
+) -> None:
+    """Discover tags once, then tag later pushes from the events alone."""
+    service, url = service_url
+
+    assert send(url, "ping", {"zen": "hi"}) == 200  # noqa: PLR2004
+    assert send(url, "push", push("refs/heads/main", "sha-1", commits[1:2])) == 202  # noqa: PLR2004
+    assert service.join(timeout=5)
+    # GitHub also notifies the tag the service just created: nothing changes.
+    tag_push = push("refs/tags/v1.1.0", "0" * 40, commits[1:2])
+    assert send(url, "push", tag_push) == 202  # noqa: PLR2004
+    assert service.join(timeout=5)
+    listings = (repo.tag_listings, repo.history_listings, len(repo.commit_lookups))
+
+    assert send(url, "push", push("refs/heads/main", "sha-2", commits[2:3])) == 202  # noqa: PLR2004
+    assert service.join(timeout=5)
+
+    assert repo.created_refs == [
+        ("refs/tags/v1.1.0", "sha-2"),
+        ("refs/tags/v1.1.1", "sha-3"),
+    ]
+    assert (repo.tag_listings, repo.history_listings, len(repo.commit_lookups)) == (
+        listings
+    )
+
+
+def test_foreign_tags_and_bad_signatures(
+    repo: DummyRepo,
+    commits: list[DummyCommit],
+    service_url: tuple[WebhookService, str],
+) -> None:
+    """Rediscover tags pushed by someone else and reject unsigned deliveries."""
+    service, url = service_url
+    payload = push("refs/heads/main", "sha-1", commits[1:2])
+
+    assert send(url, "push", payload, secret=b"wrong") == 401  # noqa: PLR2004
+    assert send(url, "push", payload) == 202  # noqa: PLR2004
+    assert send(url, "push", push("refs/tags/v9.0.0", "0" * 40, commits[1:2])) == 202  # noqa: PLR2004
+    assert service.join(timeout=5)
+
+    assert repo.tag_listings == 1
+    assert service.states[_REPOSITORY].unreleased is None
+
+
+def test_warm_pushes_apply_the_path_filter(
+    repo: DummyRepo, commits: list[DummyCommit]
+) -> None:
+    """Ignore warm pushed commits outside path, as the cold listing does."""
+    repo.changed_files = {"sha-1": [], "sha-2": ["other/x"], "sha-3": ["other/y"]}
+
+    with serve(repo, {"INPUT_PATH": "sub"}) as (service, url):
+        for before, pushed in (("sha-1", commits[1:2]), ("sha-2", commits[2:3])):
+            payload = push("refs/heads/main", before, pushed, repo.changed_files)
+            assert send(url, "push", payload) == 202  # noqa: PLR2004
+            assert service.join(timeout=5)
+
+        assert repo.created_refs == []
+        assert repo.history_listings == 1
+        assert service.states[_REPOSITORY].unreleased == []
+
+
+def test_components_run_the_full_workflow(
+    repo: DummyRepo, commits: list[DummyCommit]
+) -> None:
+    """Tag every component touched by a push through the component releases."""
+    repo.changed_files = {"sha-1": [], "sha-2": ["api/x"], "sha-3": ["api/y"]}
+
+    with serve(repo, {"INPUT_COMPONENTS": "api=v"}) as (service, url):
+        payload = push("refs/heads/main", "sha-1", commits[1:3], repo.changed_files)
+        assert send(url, "push", payload) == 202  # noqa: PLR2004
+        assert service.join(timeout=5)
+
+    assert repo.created_refs == [("refs/tags/v1.1.0", "sha-3")]
@@ -0,0 +1,42 @@
+"""Import-time guard for the container entry point."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+HEAVY_PACKAGES = ("github", "semver", "requests", "urllib3")
+
+
+def imported_modules(module: str) -> list[str]:
+    """Return the modules imported by a fresh interpreter importing module, from -X importtime."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines read "import time: <self us> | <cumulative us> | <indented module name>".
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()[1:]
+        if line.startswith("import time:")
+    ]
+
+
+def test_entry_point_defers_heavy_imports() -> None:
+    """Keep PyGitHub and semver out of the modules loaded before the branch check."""
+    modules = imported_modules("main")
+
+    assert "main" in modules
+    assert not [module for module in modules if module.split(".")[0] in HEAVY_PACKAGES]
+
+
+def test_guard_detects_heavy_imports() -> None:
+    """Make sure the guard sees PyGitHub where it is actually imported."""
+    assert "github" in imported_modules("github_helpers")
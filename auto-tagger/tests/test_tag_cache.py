@@ -0,0 +1,82 @@
+"""Tests for the on-disk tag index cache."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from github_resources import Tag, TagRef
+from tag_cache import TagCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def build_tag(name: str, commit: str) -> Tag:
+    """Build a resolved tag with a fixed date."""
+    return Tag(
+        name=name,
+        commit=commit,
+        message=f"release {name}",
+        date=datetime(2025, 1, 1, 12, 0, tzinfo=UTC),
+    )
+
+
+def test_tag_cache_round_trips_through_disk(tmp_path: Path) -> None:
+    """Reload stored tags from the file written by a previous run."""
+    cache = TagCache.for_repository(str(tmp_path), "octo/repo", "v", "")
+    cache.store(TagRef(name="v1.0.0", sha="c1"), build_tag("v1.0.0", "c1"))
+    cache.save()
+
+    reloaded = TagCache.for_repository(str(tmp_path), "octo/repo", "v", "")
+
+    assert reloaded.lookup(TagRef(name="v1.0.0", sha="c1")) == build_tag("v1.0.0", "c1")
+    assert (
+        TagCache.for_repository(str(tmp_path), "octo/repo", "api-v", "").lookup(
+            TagRef(name="v1.0.0", sha="c1")
+        )
+        is None
+    )
+
+
+def test_tag_cache_misses_moved_tags_and_prunes_deleted_ones(tmp_path: Path) -> None:
+    """Resolve moved tags again and forget tags no longer listed."""
+    cache = TagCache(tmp_path / "tags.json")
+    cache.store(TagRef(name="v1", sha="c1"), build_tag("v1", "c1"))
+    cache.store(TagRef(name="v0", sha="c0"), build_tag("v0", "c0"))
+
+    assert cache.lookup(TagRef(name="v1", sha="c2")) is None
+
+    cache.prune([TagRef(name="v1", sha="c2")])
+
+    assert len(cache) == 1
+    assert cache.lookup(TagRef(name="v0", sha="c0")) is None
+
+
+def test_tag_cache_ignores_unreadable_files(tmp_path: Path) -> None:
+    """Start empty when the cache file is corrupt."""
+    path = tmp_path / "tags.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert len(TagCache(path)) == 0
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        '{"version": 1, "tags": []}',
+        '{"version": 1, "tags": {"v1": ["a"]}}',
+        '{"version": 1, "tags": {"v1": ["a", "b", "c", "not a date"]}}',
+    ],
+)
+def test_tag_cache_ignores_malformed_payloads(tmp_path: Path, content: str) -> None:
+    """Start empty when the cache file is valid JSON of another shape."""
+    path = tmp_path / "tags.json"
+    path.write_text(content, encoding="utf-8")
+
+    assert len(TagCache(path)) == 0
@@ -0,0 +1,47 @@
+"""Tests for the SemVer version keys."""
+
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import pytest
+from semver import Version
+
+from version_keys import version_key
+
+VERSIONS = [
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.0.0+build.5",
+    "1.0.1",
+    "1.2.0",
+    "1.10.0",
+    "2.0.0-0",
+    "2.0.0",
+    "10.0.0",
+]
+
+
+def test_version_keys_sort_like_semver() -> None:
+    """Order keys by SemVer precedence, ignoring build metadata."""
+    by_semver = sorted(VERSIONS, key=Version.parse)
+    keys = {value: key for value in VERSIONS if (key := version_key(value)) is not None}
+    by_key = sorted(keys, key=keys.__getitem__)
+
+    assert by_key == by_semver
+    assert version_key("1.0.0") == version_key("1.0.0+build.5")
+
+
+@pytest.mark.parametrize(
+    "value", ["1", "1.0", "01.0.0", "1.0.0-", "1.0.0-01", "1.0.0+", "v1.0.0", "1.0.0 "]
+)
+def test_version_key_rejects_invalid_versions(value: str) -> None:
+    """Reject the strings semver refuses to parse."""
+    assert version_key(value) is None
+    assert not Version.is_valid(value)
@@ -0,0 +1,528 @@
+"""HTTP connection classes plugged into PyGitHub's requester."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Final
+
+import requests
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+    RequestsResponse,
+)
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+
+from http_cache import CacheEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, ItemsView, Iterator, Mapping
+
+    from github import Github
+    from urllib3._base_connection import BaseHTTPConnection, BaseHTTPSConnection
+
+    from http_cache import ResponseCache
+    from rate_limit import RateLimitScheduler
+
+DEFAULT_POOL_SIZE: Final[int] = 10
+DEFAULT_TIMEOUT: Final[int] = 15
+
+_HTTP_OK = 200
+_HTTP_NOT_MODIFIED = 304
+_HTTP_FORBIDDEN = 403
+# httpcore trace event emitted once per new TCP connection.
+_CONNECT_EVENT: Final[str] = "connection.connect_tcp.complete"
+
+_logger = logging.getLogger("auto_tagger.transport")
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """Connection pool size, per-request timeout in seconds and protocol of the session."""
+
+    pool_size: int = DEFAULT_POOL_SIZE
+    timeout: int = DEFAULT_TIMEOUT
+    http2: bool = False
+
+
+@dataclass(frozen=True)
+class TransportStats:
+    """Requests sent and connections opened by the sessions of the process."""
+
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        """Return the requests sent over an already open connection."""
+        return max(0, self.requests - self.connections)
+
+    def __str__(self) -> str:
+        """Render the counters (e.g. 12 requests over 2 connections, 10 reused)."""
+        return (
+            f"{self.requests} requests over {self.connections} connections, "
+            f"{self.reused} reused"
+        )
+
+
+class _Counters:
+    """Thread-safe counters behind transport_stats()."""
+
+    def __init__(self) -> None:
+        """Start from zero."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+
+    def count_request(self) -> None:
+        """Count a request sent on the wire."""
+        with self._lock:
+            self.requests += 1
+
+    def count_connection(self) -> None:
+        """Count a newly opened connection."""
+        with self._lock:
+            self.connections += 1
+
+    def snapshot(self) -> TransportStats:
+        """Return the current values."""
+        with self._lock:
+            return TransportStats(self.requests, self.connections)
+
+
+_COUNTERS = _Counters()
+
+
+def transport_stats() -> TransportStats:
+    """Return the requests and connections of the process so far."""
+    return _COUNTERS.snapshot()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP pool counting the connections it opens."""
+
+    def _new_conn(self) -> BaseHTTPConnection:
+        _COUNTERS.count_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS pool counting the connections it opens."""
+
+    def _new_conn(self) -> BaseHTTPSConnection:
+        _COUNTERS.count_connection()
+        return super()._new_conn()
+
+
+class _CountingAdapter(HTTPAdapter):
+    """Adapter whose pools count the connections they open."""
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,  # noqa: FBT001, FBT002 - requests' signature
+        **pool_kwargs: Any,
+    ) -> None:
+        """Create the pool manager with the counting pool classes."""
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _requests_session(settings: TransportSettings) -> requests.Session:
+    """Build a keep-alive HTTP/1.1 session holding at most pool_size connections per host.
+
+    Requests wait for a free connection instead of opening throwaway ones, and
+    requests decompresses gzip and deflate responses.
+    """
+    session = requests.Session()
+    # A non-None auth disables the .netrc fallback, as in PyGitHub's own session.
+    session.auth = Requester.noopAuth
+    adapter = _CountingAdapter(
+        pool_maxsize=settings.pool_size, pool_block=True, max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _NotConnectedError(requests.ConnectionError):
+    """Connection to the server could not be opened: the request was never sent."""
+
+
+def _never_connected(error: requests.RequestException) -> bool:
+    """Tell whether a request failed before its connection was opened."""
+    if isinstance(error, (_NotConnectedError, requests.ConnectTimeout)):
+        return True
+    # requests wraps urllib3's MaxRetryError, whose reason is the underlying error;
+    # NewConnectionError (refused, unresolved host) is a ConnectTimeoutError.
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, "reason", reason), ConnectTimeoutError)
+
+
+class _Http2Response:
+    """requests.Response facade over an httpx response, as read by RequestsResponse."""
+
+    def __init__(self, response: Any) -> None:
+        """Wrap a fully read httpx response."""
+        self._response = response
+        self.status_code: int = response.status_code
+        self.headers: Mapping[str, str] = response.headers
+
+    @property
+    def text(self) -> str:
+        """Return the decompressed, decoded body."""
+        return str(self._response.text)
+
+    def iter_content(self, chunk_size: int | None = 1) -> Iterator[bytes]:
+        """Yield the decompressed body in chunks."""
+        return iter(self._response.iter_bytes(chunk_size))
+
+    def raise_for_status(self) -> None:
+        """Raise on 4xx and 5xx responses."""
+        self._response.raise_for_status()
+
+
+def _trace_connections(event: str, _info: Mapping[str, Any]) -> None:
+    """Count the connections opened by httpx from its trace events."""
+    if event == _CONNECT_EVENT:
+        _COUNTERS.count_connection()
+
+
+class _Http2Session:
+    """requests.Session facade over an httpx HTTP/2 client, as used by PyGitHub's connections.
+
+    Concurrent requests to a host are multiplexed over one connection; httpx
+    decompresses the responses.
+    """
+
+    def __init__(self, httpx: Any, settings: TransportSettings) -> None:
+        """Create the client with at most pool_size connections."""
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.pool_size,
+                max_keepalive_connections=settings.pool_size,
+            ),
+            timeout=settings.timeout,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        data: Any = None,
+        timeout: float | None = None,
+        allow_redirects: bool = False,
+        **_: Any,
+    ) -> _Http2Response:
+        """Send a request with the keywords of requests; verify is set on the client.
+
+        Transport errors are raised as their requests counterparts.
+        """
+        httpx = self._httpx
+        try:
+            response = self._client.request(
+                method,
+                url,
+                headers=headers,
+                content=data,
+                timeout=timeout,
+                follow_redirects=allow_redirects,
+                extensions={"trace": _trace_connections},
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout) as error:
+            raise _NotConnectedError(str(error)) from error
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(str(error)) from error
+        return _Http2Response(response)
+
+    def get(self, url: str, **kwargs: Any) -> _Http2Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> _Http2Response:
+        """Send a HEAD request."""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _Http2Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> _Http2Response:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> _Http2Response:
+        """Send a PATCH request."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> _Http2Response:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
+
+
+def build_session(settings: TransportSettings) -> Any:
+    """Build a session, over HTTP/2 when enabled and httpx[http2] is importable."""
+    if settings.http2:
+        try:
+            importlib.import_module("h2")
+            httpx = importlib.import_module("httpx")
+        except ImportError:
+            _logger.warning("HTTP/2 needs httpx[http2]; falling back to HTTP/1.1.")
+        else:
+            return _Http2Session(httpx, settings)
+    return _requests_session(settings)
+
+
+class CachedResponse(RequestsResponse):
+    """Response replayed from the cache after the server answered 304 Not Modified."""
+
+    def __init__(self, entry: CacheEntry, fresh_headers: dict[str, str]) -> None:
+        """Merge the fresh headers (rate limits, validators) over the cached ones."""
+        self.status = _HTTP_OK
+        self._headers = {**entry.headers, **fresh_headers}
+        self._body = entry.body
+
+    def getheaders(self) -> ItemsView[str, str]:
+        """Return the merged response headers."""
+        return self._headers.items()
+
+    def read(self) -> str:
+        """Return the cached body."""
+        return self._body
+
+    def iter_content(self, chunk_size: int | None = 1) -> Iterator[bytes]:
+        """Yield the cached body in chunks."""
+        data = self._body.encode()
+        size = chunk_size or len(data) or 1
+        for start in range(0, len(data), size):
+            yield data[start : start + size]
+
+    def raise_for_status(self) -> None:
+        """Never raise: only successful responses are cached."""
+
+
+_SESSIONS: dict[TransportSettings, Any] = {}
+_SESSIONS_LOCK = threading.Lock()
+# Connection classes are injected process-wide and copied by each new requester.
+_INJECTION_LOCK = threading.Lock()
+
+
+def shared_session(settings: TransportSettings) -> Any:
+    """Return the process-wide session for settings, building it on first use.
+
+    Clients created with the same settings share its keep-alive pool.
+    """
+    with _SESSIONS_LOCK:
+        if settings not in _SESSIONS:
+            _SESSIONS[settings] = build_session(settings)
+        return _SESSIONS[settings]
+
+
+class _CachingConnection:
+    """Per-request connection on a shared session, revalidating GETs with the cache.
+
+    PyGitHub creates a connection per request once custom classes are injected.
+    The cache, scheduler and settings are class attributes: connection_classes()
+    binds them to one client by subclassing.
+    """
+
+    cache: ClassVar[ResponseCache | None] = None
+    scheduler: ClassVar[RateLimitScheduler | None] = None
+    settings: ClassVar[TransportSettings] = TransportSettings()
+
+    scheme: ClassVar[str]
+    default_port: ClassVar[int]
+
+    def __init__(
+        self, host: str, port: int | None = None, *_: Any, **kwargs: Any
+    ) -> None:
+        """Attach the shared session; PyGitHub's timeout, retry and pool_size are ignored.
+
+        The timeout of the transport settings applies to every request instead.
+        """
+        self.protocol = self.scheme
+        self.host = host
+        self.port = port or self.default_port
+        self.timeout: int | None = self.settings.timeout
+        self.verify = kwargs.get("verify", True)
+        self.session = shared_session(self.settings)
+        self.verb = "GET"
+        self.url = ""
+        self.input: Any = None
+        self.headers: dict[str, str] = {}
+        self.stream = False
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        input: Any,  # noqa: A002 - PyGitHub's keyword
+        headers: dict[str, str],
+        stream: bool = False,  # noqa: FBT001, FBT002 - PyGitHub's signature
+    ) -> None:
+        """Record the pending request, sent by getresponse()."""
+        self.verb = verb
+        self.url = url
+        self.input = input
+        self.headers = headers
+        self.stream = stream
+
+    def getresponse(self) -> RequestsResponse:
+        """Send the pending request, answering from the cache on 304."""
+        if self.cache is None or self.verb != "GET" or self.stream:
+            return self._scheduled_send()
+        url = self._absolute_url()
+        entry = self.cache.get(url)
+        if entry is not None:
+            self.headers = {**self.headers, **entry.validators()}
+        response = self._scheduled_send()
+        if response.status == _HTTP_NOT_MODIFIED and entry is not None:
+            self.cache.record_hit()
+            return CachedResponse(entry, dict(response.getheaders()))
+        if response.status == _HTTP_OK:
+            headers = dict(response.getheaders())
+            etag = headers.get("ETag") or headers.get("etag")
+            last_modified = headers.get("Last-Modified") or headers.get("last-modified")
+            if etag or last_modified:
+                self.cache.put(
+                    url,
+                    CacheEntry(
+                        etag=etag,
+                        last_modified=last_modified,
+                        headers=headers,
+                        body=response.read(),
+                    ),
+                )
+        return response
+
+    def close(self) -> None:
+        """Keep the shared session open across connections."""
+
+    def _absolute_url(self) -> str:
+        """Return the URL of the pending request, used as cache key."""
+        return f"{self.protocol}://{self.host}:{self.port}{self.url}"
+
+    def _scheduled_send(self) -> RequestsResponse:
+        """Send the pending request when the scheduler allows it, retrying as it decides.
+
+        Connection errors and timeouts are retried like transient server errors.
+        """
+        scheduler = self.scheduler
+        if scheduler is None:
+            return self._send()
+        attempt = 0
+        while True:
+            scheduler.before_request(self.verb, self.url)
+            try:
+                response = self._send()
+            except (requests.ConnectionError, requests.Timeout) as error:
+                delay = scheduler.error_delay(
+                    self.verb,
+                    attempt,
+                    url=self.url,
+                    maybe_sent=not _never_connected(error),
+                )
+                if delay is None:
+                    raise
+            else:
+                body = response.read() if response.status >= _HTTP_FORBIDDEN else ""
+                delay = scheduler.retry_delay(
+                    self.verb,
+                    response.status,
+                    dict(response.getheaders()),
+                    body,
+                    attempt,
+                    url=self.url,
+                )
+                if delay is None:
+                    return response
+            scheduler.sleep(delay)
+            attempt += 1
+
+    def _send(self) -> RequestsResponse:
+        """Send the pending request on the shared session, counting it."""
+        _COUNTERS.count_request()
+        send = getattr(self.session, self.verb.lower())
+        return RequestsResponse(
+            send(
+                self._absolute_url(),
+                headers=self.headers,
+                data=self.input,
+                timeout=self.timeout,
+                verify=self.verify,
+                allow_redirects=False,
+            )
+        )
+
+
+class CachingHTTPSConnection(_CachingConnection, HTTPSRequestsConnectionClass):
+    """HTTPS connection with a shared session and conditional GET requests."""
+
+    scheme = "https"
+    default_port = 443
+
+
+class CachingHTTPConnection(_CachingConnection, HTTPRequestsConnectionClass):
+    """HTTP connection (e.g. GitHub Enterprise) with a shared session and conditional GET requests."""
+
+    scheme = "http"
+    default_port = 80
+
+
+def connection_classes(
+    cache: ResponseCache | None = None,
+    scheduler: RateLimitScheduler | None = None,
+    settings: TransportSettings | None = None,
+) -> tuple[type[CachingHTTPConnection], type[CachingHTTPSConnection]]:
+    """Return HTTP and HTTPS connection classes bound to one client's transport state."""
+    state = {
+        "cache": cache,
+        "scheduler": scheduler,
+        "settings": settings or TransportSettings(),
+    }
+    return (
+        type(CachingHTTPConnection.__name__, (CachingHTTPConnection,), state),
+        type(CachingHTTPSConnection.__name__, (CachingHTTPSConnection,), state),
+    )
+
+
+def create_client(
+    factory: Callable[[], Github],
+    cache: ResponseCache | None = None,
+    scheduler: RateLimitScheduler | None = None,
+    settings: TransportSettings | None = None,
+) -> Github:
+    """Create a PyGitHub client routing its requests through its own transport.
+
+    Per-request connections make the requester safe to use from several threads;
+    GET responses are revalidated against cache when one is given, and requests are
+    paced and retried by scheduler when one is given. The requester built by factory
+    keeps the connection classes injected at that time, so several clients of one
+    process (fleet and service modes) never use each other's cache or scheduler.
+    Clients with the same settings share one session and its keep-alive pool.
+    """
+    with _INJECTION_LOCK:
+        Requester.injectConnectionClasses(
+            *connection_classes(cache, scheduler, settings)
+        )
+        return factory()
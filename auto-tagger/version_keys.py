@@ -0,0 +1,54 @@
+"""Comparable SemVer keys parsed from tag names in a single pass."""
+
+from __future__ import annotations
+
+import re
+from functools import cache
+from typing import Final
+
+# One prerelease identifier: numeric ones sort before alphanumeric ones.
+PrereleasePart = tuple[int, int | str]
+# (major, minor, patch, release flag, prerelease identifiers); build metadata is ignored
+# as it does not take part in SemVer precedence.
+VersionKey = tuple[int, int, int, int, tuple[PrereleasePart, ...]]
+
+_NUMERIC_PART: Final[int] = 0
+_ALPHANUMERIC_PART: Final[int] = 1
+_PRERELEASE: Final[int] = 0
+_RELEASE: Final[int] = 1
+
+# The SemVer 2.0.0 grammar, as accepted by semver.Version.parse.
+_SEMVER_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
+    r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
+    r"(?:\+[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*)?"
+)
+
+
+def _prerelease_part(identifier: str) -> PrereleasePart:
+    """Return the sort key of a prerelease identifier."""
+    if identifier.isdigit():
+        return (_NUMERIC_PART, int(identifier))
+    return (_ALPHANUMERIC_PART, identifier)
+
+
+@cache
+def version_key(version: str) -> VersionKey | None:
+    """Validate and parse a SemVer string into a key ordered by precedence, or None.
+
+    Results are memoized per string, so rescanning the same tag names is free.
+    """
+    match = _SEMVER_PATTERN.fullmatch(version)
+    if match is None:
+        return None
+    major, minor, patch, prerelease = match.groups()
+    if prerelease is None:
+        return (int(major), int(minor), int(patch), _RELEASE, ())
+    return (
+        int(major),
+        int(minor),
+        int(patch),
+        _PRERELEASE,
+        tuple(_prerelease_part(part) for part in prerelease.split(".")),
+    )